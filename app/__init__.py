@@ -48,9 +48,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
 from config import Config
+from app.services.db_routing import RoutingSession
 import os
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 login_manager = LoginManager()
 migrate = Migrate()
 
@@ -72,11 +73,33 @@ def create_app(config_class=Config):
     login_manager.login_message = 'Please log in.'
     login_manager.login_message_category = 'info'
 
+    from app.services.json_provider import init_json_provider
+    from app.services.user_cache import init_user_cache, load_session_user
+    from app.services.response_cache import init_response_cache
+    from app.services.request_metrics import init_request_metrics
+    from app.services.events import init_events
+    from app.services.passwords import init_password_hasher
+    from app.services.login_throttle import init_login_throttle
+    from app.services.db_routing import init_db_routing
+    from app.services.compression import init_compression
+    from app.services.task_overdue import init_overdue_rollover
+    from app.services.user_directory import init_user_directory
+    init_json_provider(app)
+    init_user_cache(app)
+    init_response_cache(app)
+    init_request_metrics(app)
+    init_events(app)
+    init_password_hasher(app)
+    init_login_throttle(app)
+    init_db_routing(app, db)
+    init_compression(app)
+    init_overdue_rollover(app)
+    init_user_directory(app)
+
     @login_manager.user_loader
     def load_user(user_id):
-        """Load logged-in user from DB."""
-        from app.models.user import User
-        return User.query.get(int(user_id))
+        """Load logged-in user, from the user cache when possible."""
+        return load_session_user(int(user_id))
 
     # -----------------------------
     # Register Blueprints
@@ -91,6 +114,22 @@ def create_app(config_class=Config):
     app.register_blueprint(dashboard_bp)                # /dashboard...
     app.register_blueprint(users_bp, url_prefix='/api') # /api/users/...
 
+    # -----------------------------
+    # CLI Commands & Model Events
+    # -----------------------------
+    from app.commands import register_commands
+    from app.services.task_counters import ensure_counters_seeded
+    from app.services.task_bookkeeping import ensure_bookkeeping_triggers
+    from app.services.task_search import ensure_search_index
+    from app.services.data_versions import register_version_events
+    from app.services.task_overdue import register_overdue_events
+    from app.services.task_changes import register_change_events
+
+    register_commands(app)
+    register_version_events()
+    register_overdue_events()
+    register_change_events()
+
     # -----------------------------
     # Create Database Tables
     # (ONLY for first time — after that use flask db migrate)
@@ -98,5 +137,8 @@ def create_app(config_class=Config):
     with app.app_context():
         if app.config.get("CREATE_TABLES", True):
             db.create_all()
+            ensure_bookkeeping_triggers()
+            ensure_counters_seeded()
+            ensure_search_index()
 
     return app
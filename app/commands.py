@@ -0,0 +1,148 @@
+import click
+from flask.cli import AppGroup, with_appcontext
+
+counters_cli = AppGroup('task-counters', help='Maintain the denormalized task_counters table.')
+
+
+@counters_cli.command('rebuild')
+def rebuild_task_counters():
+    """Recompute task_counters from the tasks table."""
+    from app.services.task_counters import rebuild_counters
+    rebuild_counters()
+    click.echo('task_counters rebuilt.')
+
+
+@counters_cli.command('check')
+@click.option('--fix', is_flag=True, help='Rebuild the table if drift is found.')
+def check_task_counters(fix):
+    """Compare task_counters with the tasks table and report drift."""
+    from app.services.task_counters import find_counter_drift, rebuild_counters
+    drift = find_counter_drift()
+    if not drift:
+        click.echo('task_counters is in sync.')
+        return
+    for (assignee_id, status, priority), (stored, expected) in sorted(drift.items()):
+        click.echo(f'assignee={assignee_id} status={status} priority={priority}: stored {stored}, expected {expected}')
+    if fix:
+        rebuild_counters()
+        click.echo('task_counters rebuilt.')
+    else:
+        raise SystemExit(1)
+
+
+overdue_cli = AppGroup('overdue', help='Maintain the stored tasks.is_overdue flag.')
+
+
+@overdue_cli.command('rollover')
+@click.option('--since', type=click.DateTime(formats=['%Y-%m-%d']),
+              help='Only consider due dates from this day on (the previous run). Default: the whole table.')
+def roll_over_overdue_tasks(since):
+    """Flag tasks that became overdue; schedule daily just after midnight."""
+    from app.services.task_overdue import roll_over_overdue
+    changed = roll_over_overdue(since=since.date() if since else None)
+    click.echo(f'{changed} task(s) updated.')
+
+
+@click.command('check-task-plans')
+@click.option('--verbose', '-v', is_flag=True, help='Print the full plan for every query.')
+@with_appcontext
+def check_task_plans(verbose):
+    """EXPLAIN every /api/tasks sort mode and fail if any needs a filesort."""
+    from app.services.query_plans import task_list_plans, uses_filesort
+
+    failures = 0
+    for scope, sort_by, sort_dir, plan in task_list_plans():
+        sorted_in_memory = uses_filesort(plan)
+        failures += sorted_in_memory
+        status = 'FILESORT' if sorted_in_memory else 'index'
+        click.echo(f'{scope:<10} {sort_by:<10} {sort_dir:<4} {status}')
+        if verbose or sorted_in_memory:
+            for line in plan:
+                click.echo(f'    {line}')
+    if failures:
+        raise SystemExit(1)
+
+
+@click.command('seed')
+@click.option('--users', default=20, show_default=True, help='Developers to create (plus one admin).')
+@click.option('--tasks', default=1000, show_default=True, help='Tasks to create.')
+@click.option('--comments', default=2000, show_default=True, help='Comments to create.')
+@click.option('--batch-size', default=10000, show_default=True, help='Rows per INSERT batch.')
+@click.option('--seed', type=int, help='Random seed, for reproducible data sets.')
+@click.option('--reset', is_flag=True, help='Delete all users, tasks and comments first.')
+@with_appcontext
+def seed_command(users, tasks, comments, batch_size, seed, reset):
+    """Bulk-insert a realistic data set for benchmarks and scaling tests."""
+    import time
+    from app.services.seeding import SEED_PASSWORD, clear_seeded_tables, seed_database
+
+    if reset:
+        click.confirm('Delete every user, task and comment?', abort=True)
+        clear_seeded_tables()
+
+    started = time.perf_counter()
+
+    def progress(table, done):
+        elapsed = time.perf_counter() - started
+        click.echo(f'\r{table:<8} {done:>10,} rows  {elapsed:6.1f}s', nl=False)
+
+    first_ids = seed_database(users, tasks, comments, batch_size=batch_size, seed=seed, progress=progress)
+    elapsed = time.perf_counter() - started
+    total = users + 1 + tasks + comments
+    click.echo(f'\nInserted {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s).')
+    admin_id = first_ids['users']
+    click.echo(f'Log in as admin{admin_id}@seed.local or dev<id>@seed.local with password {SEED_PASSWORD}.')
+
+
+def _parse_age(ctx, param, value):
+    from app.services.task_archive import parse_age
+    try:
+        return parse_age(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc))
+
+
+@click.command('archive')
+@click.option('--older-than', default='90d', show_default=True, callback=_parse_age,
+              help='Archive completed tasks not updated for this long (e.g. 90d, 12w).')
+@click.option('--batch-size', default=1000, show_default=True, help='Tasks moved per transaction.')
+@with_appcontext
+def archive_command(older_than, batch_size):
+    """Move old completed tasks and their comments to the archive tables."""
+    import time
+    from app.services.task_archive import archive_tasks
+
+    started = time.perf_counter()
+
+    def progress(tasks, comments):
+        elapsed = time.perf_counter() - started
+        click.echo(f'\r{tasks:>10,} tasks {comments:>10,} comments  {elapsed:6.1f}s', nl=False)
+
+    tasks, comments = archive_tasks(older_than, batch_size=batch_size, progress=progress)
+    if tasks:
+        click.echo()
+    click.echo(f'Archived {tasks:,} tasks and {comments:,} comments.')
+
+
+changes_cli = AppGroup('task-changes', help='Maintain the delta-sync tombstones and change log.')
+
+
+@changes_cli.command('prune')
+@click.option('--older-than', default='30d', show_default=True, callback=_parse_age,
+              help='Delete tombstones and change log rows older than this (e.g. 30d, 4w).')
+@with_appcontext
+def prune_task_tombstones(older_than):
+    """Delete old tombstones; clients with older tokens reload their list."""
+    from app.services.task_changes import prune_tombstones
+    removed = prune_tombstones(older_than)
+    click.echo(f'{removed:,} tombstone(s) deleted.')
+
+
+def register_commands(app):
+    """Attach the project's CLI command groups to ``app``"""
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(overdue_cli)
+    app.cli.add_command(check_task_plans)
+    app.cli.add_command(seed_command)
+    app.cli.add_command(archive_command)
+    app.cli.add_command(changes_cli)
@@ -1,6 +1,12 @@
 from app.models.user import User
 from app.models.task import Task
 from app.models.comment import Comment
+from app.models.task_counter import TaskCounter
+from app.models.data_version import DataVersion
+from app.models.archived_task import ArchivedTask
+from app.models.archived_comment import ArchivedComment
+from app.models.task_tombstone import TaskTombstone
+from app.models.task_change import TaskChange
 
-__all__ = ['User', 'Task', 'Comment']
+__all__ = ['User', 'Task', 'Comment', 'TaskCounter', 'DataVersion', 'ArchivedTask', 'ArchivedComment', 'TaskTombstone', 'TaskChange']
 
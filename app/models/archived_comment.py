@@ -0,0 +1,18 @@
+from app import db
+
+
+class ArchivedComment(db.Model):
+    """A comment moved to the archive together with its task"""
+    __tablename__ = 'comments_archive'
+    __table_args__ = (
+        db.Index('ix_comments_archive_task_created_at', 'task_id', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    task_id = db.Column(db.Integer, db.ForeignKey('tasks_archive.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    comment_text = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f'<ArchivedComment {self.id}>'
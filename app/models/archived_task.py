@@ -0,0 +1,49 @@
+from app import db
+from app.models.task import STATUS_RANK_SQL
+
+
+class ArchivedTask(db.Model):
+    """A completed task moved out of ``tasks`` by ``flask archive``
+
+    Same columns and ids as the task it was, plus ``archived_at``. Only
+    read by ``/api/tasks?include_archived=1``, which orders and pages it
+    with the same sort keys, so it carries the same list indexes.
+    """
+    __tablename__ = 'tasks_archive'
+    __table_args__ = (
+        db.Index('ix_tasks_archive_created_at', 'created_at'),
+        db.Index('ix_tasks_archive_assignee_created_at', 'assigned_to', 'created_at'),
+        db.Index('ix_tasks_archive_due_date', 'due_date_missing', 'due_date'),
+        db.Index('ix_tasks_archive_assignee_due_date', 'assigned_to', 'due_date_missing', 'due_date'),
+        db.Index('ix_tasks_archive_status_rank', 'status_rank', 'updated_at'),
+        db.Index('ix_tasks_archive_assignee_status_rank', 'assigned_to', 'status_rank', 'updated_at'),
+    )
+    __mapper_args__ = {'eager_defaults': False}
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    assigned_to = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    priority = db.Column(db.String(20), nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    start_date = db.Column(db.Date, nullable=True)
+    due_date = db.Column(db.Date, nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    is_overdue = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
+    change_seq = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    archived_at = db.Column(db.DateTime, nullable=False)
+
+    status_rank = db.Column(db.SmallInteger, db.Computed(STATUS_RANK_SQL, persisted=False))
+    due_date_missing = db.Column(db.Boolean, db.Computed('due_date IS NULL', persisted=False))
+
+    def __repr__(self):
+        return f'<ArchivedTask {self.title}>'
+
+
+db.Index('ix_tasks_archive_due_date_desc', ArchivedTask.due_date_missing.desc(), ArchivedTask.due_date)
+db.Index('ix_tasks_archive_assignee_due_date_desc', ArchivedTask.assigned_to, ArchivedTask.due_date_missing.desc(), ArchivedTask.due_date)
+db.Index('ix_tasks_archive_status_rank_desc', ArchivedTask.status_rank.desc(), ArchivedTask.updated_at)
+db.Index('ix_tasks_archive_assignee_status_rank_desc', ArchivedTask.assigned_to, ArchivedTask.status_rank.desc(), ArchivedTask.updated_at)
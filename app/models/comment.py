@@ -3,6 +3,11 @@ from datetime import datetime
 
 class Comment(db.Model):
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_task_created_at', 'task_id', 'created_at'),
+        # Never reuse the id of a deleted row: archived comments keep their ids
+        {'sqlite_autoincrement': True},
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     task_id = db.Column(db.Integer, db.ForeignKey('tasks.id'), nullable=False)
@@ -18,7 +23,7 @@ class Comment(db.Model):
             'user_id': self.user_id,
             'user_name': self.user.name if self.user else None,
             'comment_text': self.comment_text,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at
         }
     
     def __repr__(self):
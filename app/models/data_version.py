@@ -0,0 +1,19 @@
+from app import db
+
+
+class DataVersion(db.Model):
+    """Monotonic version number per data scope
+
+    Bumped in the same transaction as every write to the data it covers,
+    so readers can tell whether a cached response is still current with a
+    primary-key lookup. Scopes are ``tasks:<assignee id>`` (0 = unassigned),
+    ``users``, ``comments`` and ``task_changes:pruned``; views over every
+    task read the sum of the ``tasks:`` rows instead of a global row.
+    """
+    __tablename__ = 'data_versions'
+
+    scope = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<DataVersion {self.scope}={self.version}>'
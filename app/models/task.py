@@ -1,8 +1,36 @@
 from app import db
 from datetime import datetime
 
+STATUS_RANK_SQL = (
+    "CASE status WHEN 'Pending' THEN 1 WHEN 'In Progress' THEN 2 "
+    "WHEN 'On Hold' THEN 3 WHEN 'Completed' THEN 4 ELSE 5 END"
+)
+
+
 class Task(db.Model):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # One index per list sort mode, unscoped (admin view) and scoped by
+        # assignee (developer view / admin filter). The DESC variants serve
+        # orderings whose columns run in mixed directions; they are declared
+        # below the class because they need column objects.
+        db.Index('ix_tasks_created_at', 'created_at'),
+        db.Index('ix_tasks_assignee_created_at', 'assigned_to', 'created_at'),
+        db.Index('ix_tasks_due_date', 'due_date_missing', 'due_date'),
+        db.Index('ix_tasks_assignee_due_date', 'assigned_to', 'due_date_missing', 'due_date'),
+        db.Index('ix_tasks_status_rank', 'status_rank', 'updated_at'),
+        db.Index('ix_tasks_assignee_status_rank', 'assigned_to', 'status_rank', 'updated_at'),
+        # Overdue counts (overall and per assignee) and the ?overdue=1 list,
+        # newest first or most overdue first
+        db.Index('ix_tasks_overdue_assignee', 'is_overdue', 'assigned_to', 'created_at'),
+        db.Index('ix_tasks_overdue_created_at', 'is_overdue', 'created_at'),
+        db.Index('ix_tasks_overdue_due_date', 'is_overdue', 'due_date_missing', 'due_date'),
+        # Delta sync (/api/tasks/changes), unscoped and per assignee
+        db.Index('ix_tasks_change_seq', 'change_seq'),
+        db.Index('ix_tasks_assignee_change_seq', 'assigned_to', 'change_seq'),
+        # Never reuse the id of a deleted row: archived tasks keep their ids
+        {'sqlite_autoincrement': True},
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -15,36 +43,64 @@ class Task(db.Model):
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Maintained by app.services.task_overdue: set on every write and by the
+    # daily rollover, so reads never compare dates row by row
+    is_overdue = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
+    # Position in the global change sequence of the last write; set by app.services.task_changes
+    change_seq = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
+    # Incremented by every user edit; clients send it back to detect concurrent edits.
+    # The overdue rollover leaves it alone, since that flag is derived rather than edited.
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    
+    # Don't re-SELECT the generated sort keys after every INSERT/UPDATE;
+    # they are only read by list queries, which load them anyway. ORM
+    # updates add ``WHERE version = <loaded>`` and bump it, so a concurrent
+    # edit raises StaleDataError instead of being overwritten.
+    __mapper_args__ = {'eager_defaults': False, 'version_id_col': version}
+    
+    # Generated sort keys so the status and nulls-last due date orderings can use an index
+    status_rank = db.Column(db.SmallInteger, db.Computed(STATUS_RANK_SQL, persisted=False))
+    due_date_missing = db.Column(db.Boolean, db.Computed('due_date IS NULL', persisted=False))
     
     # Relationships
     comments = db.relationship('Comment', backref='task', lazy='dynamic', cascade='all, delete-orphan')
     
-    def to_dict(self):
-        """Convert task to dictionary"""
+    def to_dict(self, user_names=None):
+        """Convert task to dictionary
+
+        ``user_names`` maps user ids to names. When given, names are read from
+        it instead of lazy-loading ``assigned_user`` / ``creator_user``.
+        """
+        if user_names is not None:
+            assigned_to_name = user_names.get(self.assigned_to)
+            created_by_name = user_names.get(self.created_by)
+        else:
+            assigned_to_name = self.assigned_user.name if self.assigned_user else None
+            created_by_name = self.creator_user.name if self.creator_user else None
         return {
             'id': self.id,
             'title': self.title,
             'description': self.description,
             'assigned_to': self.assigned_to,
-            'assigned_to_name': self.assigned_user.name if self.assigned_user else None,
+            'assigned_to_name': assigned_to_name,
             'priority': self.priority,
             'status': self.status,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'due_date': self.due_date.isoformat() if self.due_date else None,
+            'start_date': self.start_date,
+            'due_date': self.due_date,
             'created_by': self.created_by,
-            'created_by_name': self.creator_user.name if self.creator_user else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'is_overdue': self.is_overdue()
+            'created_by_name': created_by_name,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'is_overdue': self.is_overdue,
+            'version': self.version
         }
     
-    def is_overdue(self):
-        """Check if task is overdue"""
-        if self.due_date and self.status != 'Completed':
-            from datetime import date
-            return date.today() > self.due_date
-        return False
-    
     def __repr__(self):
         return f'<Task {self.title}>'
 
+
+
+db.Index('ix_tasks_due_date_desc', Task.due_date_missing.desc(), Task.due_date)
+db.Index('ix_tasks_assignee_due_date_desc', Task.assigned_to, Task.due_date_missing.desc(), Task.due_date)
+db.Index('ix_tasks_status_rank_desc', Task.status_rank.desc(), Task.updated_at)
+db.Index('ix_tasks_assignee_status_rank_desc', Task.assigned_to, Task.status_rank.desc(), Task.updated_at)
@@ -0,0 +1,27 @@
+from app import db
+from datetime import datetime
+
+
+class TaskChange(db.Model):
+    """One row per write transaction that changed tasks, for delta sync
+
+    The auto-increment ``id`` is the ``change_seq`` stamped on the rows the
+    write touched. Taking a number is an insert rather than an update of a
+    shared counter row, so concurrent writes do not queue behind each other.
+    ``created_at`` tells a number that is still in flight from one whose
+    transaction rolled back (see app.services.task_changes). Old rows are
+    pruned together with the tombstones.
+    """
+    __tablename__ = 'task_changes'
+    __table_args__ = (
+        db.Index('ix_task_changes_created_at', 'created_at'),
+        # A number must never be handed out twice, not even after a prune
+        {'sqlite_autoincrement': True},
+    )
+
+    # SQLite only auto-increments a column declared exactly INTEGER PRIMARY KEY
+    id = db.Column(db.BigInteger().with_variant(db.Integer(), 'sqlite'), primary_key=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<TaskChange {self.id}>'
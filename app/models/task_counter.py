@@ -0,0 +1,25 @@
+from app import db
+
+
+class TaskCounter(db.Model):
+    """Denormalized task counts keyed by (assignee, status, priority)
+
+    Kept in step with the tasks table by the triggers in
+    app.services.task_bookkeeping so the dashboard can read its counters
+    without scanning tasks.
+    """
+    __tablename__ = 'task_counters'
+    __table_args__ = (
+        db.UniqueConstraint('assignee_id', 'status', 'priority', name='uq_task_counters_key'),
+    )
+
+    UNASSIGNED = 0
+
+    id = db.Column(db.Integer, primary_key=True)
+    assignee_id = db.Column(db.Integer, nullable=False, default=UNASSIGNED)  # 0 = unassigned
+    status = db.Column(db.String(20), nullable=False)
+    priority = db.Column(db.String(20), nullable=False)
+    task_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<TaskCounter {self.assignee_id}/{self.status}/{self.priority}={self.task_count}>'
@@ -0,0 +1,27 @@
+from app import db
+from datetime import datetime
+
+
+class TaskTombstone(db.Model):
+    """Record of a task leaving an assignee's scope, for delta sync
+
+    ``deleted`` is True when the task left the tasks table (deleted or
+    archived) and False when it was only reassigned away from
+    ``assignee_id`` (0 = unassigned). Rows are pruned by
+    ``flask task-changes prune``.
+    """
+    __tablename__ = 'task_tombstones'
+    __table_args__ = (
+        db.Index('ix_task_tombstones_change_seq', 'change_seq'),
+        db.Index('ix_task_tombstones_assignee_change_seq', 'assignee_id', 'change_seq'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    task_id = db.Column(db.Integer, nullable=False)
+    assignee_id = db.Column(db.Integer, nullable=False, default=0)
+    deleted = db.Column(db.Boolean, nullable=False, default=True)
+    change_seq = db.Column(db.BigInteger, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<TaskTombstone {self.task_id}@{self.change_seq}>'
@@ -1,13 +1,13 @@
 from app import db
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.services.passwords import password_hasher
 from datetime import datetime
 
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
     
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
     password_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(20), nullable=False, default='developer')  # admin or developer
@@ -19,12 +19,16 @@ class User(UserMixin, db.Model):
     comments = db.relationship('Comment', backref='user', lazy='dynamic')
     
     def set_password(self, password):
-        """Hash and set the password"""
-        self.password_hash = generate_password_hash(password)
+        """Hash and set the password (on the app's hashing pool)"""
+        self.password_hash = password_hasher().hash(password)
     
     def check_password(self, password):
         """Check if the provided password matches the hash"""
-        return check_password_hash(self.password_hash, password)
+        return password_hasher().verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """True if the stored hash uses an outdated method or cost"""
+        return password_hasher().needs_rehash(self.password_hash)
     
     def to_dict(self):
         """Convert user to dictionary"""
@@ -33,7 +37,7 @@ class User(UserMixin, db.Model):
             'name': self.name,
             'email': self.email,
             'role': self.role,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at
         }
     
     def __repr__(self):
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, render_template, redirect, url_fo
 from flask_login import login_user, logout_user, login_required, current_user
 from app import db
 from app.models.user import User
+from app.services.login_throttle import login_throttle
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -21,9 +22,22 @@ def login():
     if not email or not password:
         return jsonify({'success': False, 'message': 'Email and password are required'}), 400
     
+    # Refuse throttled attempts before doing any hashing work
+    throttle = login_throttle()
+    throttle_key = email.lower()
+    if not throttle.check(throttle_key, request.remote_addr):
+        response = jsonify({'success': False, 'message': 'Too many login attempts. Please try again later.'})
+        response.headers['Retry-After'] = str(throttle.window)
+        return response, 429
+    
     user = User.query.filter_by(email=email).first()
     
     if user and user.check_password(password):
+        throttle.succeeded(throttle_key)
+        # Upgrade hashes made with an older method or cost while we have the password
+        if user.password_needs_rehash():
+            user.set_password(password)
+            db.session.commit()
         login_user(user, remember=True)
         return jsonify({
             'success': True,
@@ -32,6 +46,7 @@ def login():
             'redirect': url_for('dashboard.index')
         })
     else:
+        throttle.failed(throttle_key, request.remote_addr)
         return jsonify({'success': False, 'message': 'Invalid email or password'}), 401
 
 @auth_bp.route('/logout', methods=['GET', 'POST'])
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, redirect, url_for
 from flask_login import login_required, current_user
+from app.services.bootstrap import build_bootstrap
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
@@ -7,6 +8,6 @@ dashboard_bp = Blueprint('dashboard', __name__)
 @dashboard_bp.route('/dashboard')
 @login_required
 def index():
-    """Main dashboard page"""
-    return render_template('dashboard.html', user=current_user)
+    """Main dashboard page, with the bootstrap payload inlined so first paint needs no API calls"""
+    return render_template('dashboard.html', user=current_user, bootstrap=build_bootstrap(current_user))
 
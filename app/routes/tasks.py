@@ -1,11 +1,36 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_login import login_required, current_user
-from sqlalchemy import case
 from app import db
 from app.models.task import Task
 from app.models.user import User
 from app.models.comment import Comment
-from datetime import datetime, date
+from app.models.archived_task import ArchivedTask
+from app.services.serializers import serialize_task, serialize_task_rows, serialize_tasks
+from app.services.task_queries import (
+    InvalidCursor, scoped_task_query, scope_assignee, apply_sort, cursor_page, merged_page, task_row_query
+)
+from app.services.comment_queries import DEFAULT_COMMENT_LIMIT, MAX_COMMENT_LIMIT, comment_page
+from app.services.data_versions import ALL_TASKS_SCOPE, task_scope
+from app.services.db_routing import replica_reads
+from app.services.events import (
+    comment_event, event_backend, format_sse, publish_events, task_event
+)
+from app.services.bootstrap import build_bootstrap
+from app.services.task_archive import count_archived_tasks
+from app.services.task_changes import task_changes
+from app.services.task_export import EXPORT_FORMATS, export_tasks
+from app.services.task_search import InvalidSearch, search_tasks
+from app.services.response_cache import versioned_json
+from app.services.task_writes import (
+    BULK_MAX_OPERATIONS, CONFLICT_MESSAGE, TaskWriteError, can_edit_task, build_task, apply_task_update,
+    check_version, run_bulk_operations, set_task_status
+)
+from app.services.task_stats import (
+    compute_task_stats, compute_task_stats_by_assignee, count_overdue_tasks, count_tasks
+)
+from datetime import date, datetime
+from sqlalchemy.orm.exc import StaleDataError
+import time
 
 tasks_bp = Blueprint('tasks', __name__)
 
@@ -15,70 +40,174 @@ def require_admin():
         return jsonify({'success': False, 'message': 'Admin access required'}), 403
     return None
 
+def task_list_scopes():
+    """data_versions scopes a task listing for the current viewer depends on"""
+    assignee = scope_assignee(current_user, request.args.get('assigned_to'))
+    tasks_scope = ALL_TASKS_SCOPE if assignee is None else task_scope(assignee)
+    return [tasks_scope, 'users']
+
+def task_search_scopes():
+    """Search results also depend on comment text"""
+    return task_list_scopes() + ['comments']
+
+def dashboard_stats_scopes():
+    """data_versions scopes the dashboard stats for the current viewer depend on"""
+    if current_user.role == 'admin':
+        return [ALL_TASKS_SCOPE, 'users']
+    return [task_scope(current_user.id)]
+
 @tasks_bp.route('/tasks', methods=['GET'])
 @login_required
+@replica_reads
+@versioned_json(task_list_scopes)
 def get_tasks():
-    """Get all tasks (filtered by role) with pagination and sorting"""
-    page = request.args.get('page', 1, type=int)
+    """Get all tasks (filtered by role) with pagination and sorting
+
+    Pass ``mode=cursor`` (and then the returned ``next_cursor`` as
+    ``cursor``) for keyset pagination, which skips the OFFSET scan and the
+    COUNT(*) query. Its ``total_items`` is read from task_counters.
+    ``overdue=1`` lists only overdue tasks; ``include_archived=1`` merges
+    in the archived tasks of the same scope.
+    """
+    page = max(1, request.args.get('page', 1, type=int))
     per_page = request.args.get('per_page', 10, type=int)
     per_page = max(1, min(per_page, 50))  # Clamp to prevent abuse
     sort_by = request.args.get('sort_by', 'created_at')
     sort_dir = request.args.get('sort_dir', 'desc').lower()
     sort_dir = 'desc' if sort_dir not in ('asc', 'desc') else sort_dir
-    print("current_user.role", current_user.role);
-    print("current_user", current_user);
-    query = Task.query
-    if current_user.role != 'admin':
-        query = query.filter_by(assigned_to=current_user.id)
-    else:
-        assigned_to = request.args.get('assigned_to')
-        if assigned_to:
-            if assigned_to == 'unassigned':
-                query = query.filter(Task.assigned_to.is_(None))
-            elif assigned_to.isdigit():
-                query = query.filter(Task.assigned_to == int(assigned_to))
-
-    # Sorting logic
-    if sort_by == 'due_date':
-        nulls_last = Task.due_date.is_(None)
-        if sort_dir == 'asc':
-            query = query.order_by(nulls_last, Task.due_date.asc())
-        else:
-            query = query.order_by(nulls_last, Task.due_date.desc())
-    elif sort_by == 'status':
-        status_order = case(
-            (
-                (Task.status == 'Pending', 1),
-                (Task.status == 'In Progress', 2),
-                (Task.status == 'On Hold', 3),
-                (Task.status == 'Completed', 4),
-            ),
-            else_=5
-        )
-        query = query.order_by(status_order.asc() if sort_dir == 'asc' else status_order.desc(), Task.updated_at.desc())
+    assigned_to = request.args.get('assigned_to')
+    overdue = request.args.get('overdue') in ('1', 'true')
+    query = scoped_task_query(current_user, assigned_to, overdue=overdue)
+
+    # Only completed tasks are archived, so there are none to add to an overdue list
+    archive_query = None
+    if request.args.get('include_archived') in ('1', 'true') and not overdue:
+        archive_query = scoped_task_query(current_user, assigned_to, model=ArchivedTask)
+    # Listings read plain rows; the ORM queries above only back the counts
+    sources = [(task_row_query(query), Task)]
+    if archive_query is not None:
+        sources.append((task_row_query(archive_query, ArchivedTask), ArchivedTask))
+
+    cursor = request.args.get('cursor')
+    if cursor or request.args.get('mode') == 'cursor':
+        count = count_overdue_tasks if overdue else count_tasks
+        total_items = count(scope_assignee(current_user, assigned_to))
+        if archive_query is not None:
+            total_items += count_archived_tasks(archive_query)
+        try:
+            tasks, meta = cursor_page(sources, sort_by, sort_dir, per_page, total_items, cursor=cursor)
+        except InvalidCursor as exc:
+            return jsonify({'success': False, 'message': str(exc)}), 400
+        return jsonify({
+            'success': True,
+            'tasks': serialize_task_rows(tasks),
+            'meta': meta
+        })
+
+    offset = (page - 1) * per_page
+    total_items = query.order_by(None).count()
+    if archive_query is not None:
+        tasks = merged_page(sources, sort_by, sort_dir, per_page, offset=offset)
+        total_items += count_archived_tasks(archive_query)
     else:
-        # Default to created_at
-        if sort_dir == 'asc':
-            query = query.order_by(Task.created_at.asc())
-        else:
-            query = query.order_by(Task.created_at.desc())
+        tasks = apply_sort(sources[0][0], sort_by, sort_dir).offset(offset).limit(per_page).all()
+    total_pages = -(-total_items // per_page)
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-    tasks = pagination.items
+    return jsonify({
+        'success': True,
+        'tasks': serialize_task_rows(tasks),
+        'meta': {
+            'page': page,
+            'per_page': per_page,
+            'total_pages': total_pages,
+            'total_items': total_items,
+            'has_next': page < total_pages,
+            'has_prev': page > 1
+        }
+    })
 
+@tasks_bp.route('/tasks/search', methods=['GET'])
+@login_required
+@replica_reads
+@versioned_json(task_search_scopes)
+def search_task_list():
+    """Full-text search over task titles, descriptions and comments, best match first
+
+    ``q`` is split into words which must all match (as prefixes), either in
+    the task itself or within one of its comments. Results are scoped like
+    ``get_tasks`` and paged with ``page``/``per_page``.
+    """
+    page = max(1, request.args.get('page', 1, type=int))
+    per_page = request.args.get('per_page', 20, type=int)
+    per_page = max(1, min(per_page, 50))
+    
+    try:
+        tasks, has_next = search_tasks(
+            current_user, request.args.get('q'),
+            assigned_to=request.args.get('assigned_to'), page=page, per_page=per_page
+        )
+    except InvalidSearch as exc:
+        return jsonify({'success': False, 'message': str(exc)}), 400
+    
     return jsonify({
         'success': True,
-        'tasks': [task.to_dict() for task in tasks],
+        'tasks': serialize_tasks(tasks),
         'meta': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total_pages': pagination.pages,
-            'total_items': pagination.total,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
+            'page': page,
+            'per_page': per_page,
+            'has_next': has_next,
+            'has_prev': page > 1
         }
     })
 
+@tasks_bp.route('/tasks/changes', methods=['GET'])
+@login_required
+@replica_reads
+def get_task_changes():
+    """Tasks changed and ids removed from the user's list since ``since``
+
+    Call without ``since`` to get a starting token. Takes the same
+    ``assigned_to`` filter as ``get_tasks``; when ``reset`` is true the
+    client must reload its list and continue from ``next_since``.
+    """
+    changes = task_changes(
+        current_user, request.args.get('since'), assigned_to=request.args.get('assigned_to')
+    )
+    return jsonify({
+        'success': True,
+        'reset': changes['reset'],
+        'next_since': changes['next_since'],
+        'tasks': serialize_tasks(changes['tasks']),
+        'deleted': changes['deleted']
+    })
+
+@tasks_bp.route('/tasks/export', methods=['GET'])
+@login_required
+def export_task_list():
+    """Stream every task the user may see as CSV or NDJSON
+
+    Accepts ``format`` (csv|ndjson), the same ``assigned_to`` filter as
+    ``get_tasks`` and ``include_comments=1``.
+    """
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'message': 'format must be csv or ndjson'}), 400
+    include_comments = request.args.get('include_comments') in ('1', 'true')
+    
+    chunks = export_tasks(
+        export_format,
+        current_user,
+        assigned_to=request.args.get('assigned_to'),
+        include_comments=include_comments
+    )
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    filename = f"tasks-{date.today():%Y%m%d}.{export_format}"
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
 @tasks_bp.route('/tasks', methods=['POST'])
 @login_required
 def create_task():
@@ -89,96 +218,59 @@ def create_task():
     
     data = request.get_json()
     
-    # Validation
-    if not data.get('title'):
-        return jsonify({'success': False, 'message': 'Title is required'}), 400
-    
-    # Parse dates
-    start_date = None
-    due_date = None
-    if data.get('start_date'):
-        try:
-            start_date = datetime.strptime(data.get('start_date'), '%Y-%m-%d').date()
-        except:
-            return jsonify({'success': False, 'message': 'Invalid start_date format'}), 400
-    
-    if data.get('due_date'):
-        try:
-            due_date = datetime.strptime(data.get('due_date'), '%Y-%m-%d').date()
-        except:
-            return jsonify({'success': False, 'message': 'Invalid due_date format'}), 400
-    
-    # Create task
-    task = Task(
-        title=data.get('title'),
-        description=data.get('description', ''),
-        assigned_to=data.get('assigned_to'),
-        priority=data.get('priority', 'Medium'),
-        status=data.get('status', 'Pending'),
-        start_date=start_date,
-        due_date=due_date,
-        created_by=current_user.id
-    )
+    try:
+        task = build_task(data, created_by=current_user.id)
+    except TaskWriteError as exc:
+        return jsonify({'success': False, 'message': exc.message}), exc.status_code
     
     db.session.add(task)
     db.session.commit()
     
+    serialized = serialize_task(task)
+    publish_events([task_event('created', task.id, serialized, [task.assigned_to])])
+    
     return jsonify({
         'success': True,
         'message': 'Task created successfully',
-        'task': task.to_dict()
+        'task': serialized
     }), 201
 
 @tasks_bp.route('/tasks/<int:task_id>', methods=['PUT'])
 @login_required
 def update_task(task_id):
-    """Update a task"""
+    """Update a task
+
+    Send back the task's ``version`` to get a 409 instead of overwriting
+    an edit made since it was loaded.
+    """
     task = Task.query.get_or_404(task_id)
     
     # Check permissions
-    if current_user.role != 'admin' and task.assigned_to != current_user.id:
+    if not can_edit_task(current_user, task):
         return jsonify({'success': False, 'message': 'Permission denied'}), 403
     
     data = request.get_json()
+    previous_assignee = task.assigned_to
     
-    # Update fields
-    if 'title' in data:
-        task.title = data['title']
-    if 'description' in data:
-        task.description = data.get('description', '')
-    if 'assigned_to' in data:
-        if current_user.role == 'admin':
-            task.assigned_to = data['assigned_to']
-        else:
-            return jsonify({'success': False, 'message': 'Only admin can reassign tasks'}), 403
-    if 'priority' in data:
-        task.priority = data['priority']
-    if 'status' in data:
-        task.status = data['status']
-    if 'start_date' in data:
-        if data['start_date']:
-            try:
-                task.start_date = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
-            except:
-                return jsonify({'success': False, 'message': 'Invalid start_date format'}), 400
-        else:
-            task.start_date = None
-    if 'due_date' in data:
-        if data['due_date']:
-            try:
-                task.due_date = datetime.strptime(data['due_date'], '%Y-%m-%d').date()
-            except:
-                return jsonify({'success': False, 'message': 'Invalid due_date format'}), 400
-        else:
-            task.due_date = None
-    
-    task.updated_at = datetime.utcnow()
-    db.session.commit()
+    try:
+        check_version(task, data)
+        apply_task_update(task, data, current_user)
+    except TaskWriteError as exc:
+        return jsonify({'success': False, 'message': exc.message}), exc.status_code
+    
+    try:
+        db.session.commit()
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': CONFLICT_MESSAGE}), 409
+    
+    serialized = serialize_task(task)
+    publish_events([task_event('updated', task.id, serialized, [previous_assignee, task.assigned_to])])
     
     return jsonify({
         'success': True,
         'message': 'Task updated successfully',
-        'task': task.to_dict()
+        'task': serialized
     })
 
 @tasks_bp.route('/tasks/<int:task_id>', methods=['DELETE'])
@@ -190,8 +282,15 @@ def delete_task(task_id):
         return admin_check
     
     task = Task.query.get_or_404(task_id)
+    assignee = task.assigned_to
     db.session.delete(task)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': CONFLICT_MESSAGE}), 409
+    
+    publish_events([task_event('deleted', task_id, assignees=[assignee])])
     
     return jsonify({
         'success': True,
@@ -201,48 +300,135 @@ def delete_task(task_id):
 @tasks_bp.route('/tasks/<int:task_id>/status', methods=['PUT'])
 @login_required
 def update_task_status(task_id):
-    """Update task status"""
-    task = Task.query.get_or_404(task_id)
+    """Update task status
+
+    One conditional UPDATE, without loading the task into the ORM; an
+    optional ``version`` guards against overwriting a newer edit.
+    """
+    data = request.get_json() or {}
     
-    # Check permissions
-    if current_user.role != 'admin' and task.assigned_to != current_user.id:
-        return jsonify({'success': False, 'message': 'Permission denied'}), 403
+    try:
+        serialized = set_task_status(task_id, data, current_user)
+    except TaskWriteError as exc:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': exc.message}), exc.status_code
     
-    data = request.get_json()
-    new_status = data.get('status')
+    db.session.commit()
+    
+    publish_events([task_event('updated', task_id, serialized, [serialized['assigned_to']])])
+    
+    return jsonify({
+        'success': True,
+        'message': 'Status updated successfully',
+        'task': serialized
+    })
+
+@tasks_bp.route('/tasks/bulk', methods=['POST'])
+@login_required
+def bulk_update_tasks():
+    """Apply many task operations in a single transaction
+
+    Body: ``{"operations": [...], "atomic": false}`` where each operation is
+    ``{"op": "create", "data": {...}}``, ``{"op": "update", "ids": [...], "data": {...}}``,
+    ``{"op": "status", "ids": [...], "status": "..."}`` or ``{"op": "delete", "ids": [...]}``.
+    Results are reported per task; with ``atomic`` any failure rolls back the lot.
+    """
+    data = request.get_json() or {}
+    operations = data.get('operations')
+    
+    if not isinstance(operations, list) or not operations:
+        return jsonify({'success': False, 'message': 'operations must be a non-empty list'}), 400
+    if len(operations) > BULK_MAX_OPERATIONS:
+        return jsonify({'success': False, 'message': f'At most {BULK_MAX_OPERATIONS} operations per request'}), 400
+    if not all(isinstance(operation, dict) for operation in operations):
+        return jsonify({'success': False, 'message': 'Each operation must be an object'}), 400
     
-    if not new_status:
-        return jsonify({'success': False, 'message': 'Status is required'}), 400
+    results = run_bulk_operations(operations, current_user, db.session)
+    failed = sum(1 for result in results if not result['success'])
     
-    valid_statuses = ['Pending', 'In Progress', 'Completed', 'On Hold']
-    if new_status not in valid_statuses:
-        return jsonify({'success': False, 'message': 'Invalid status'}), 400
+    if failed and data.get('atomic'):
+        db.session.rollback()
+        for result in results:
+            result.pop('task', None)
+            result.pop('previous_assignee', None)
+        return jsonify({
+            'success': False,
+            'message': f'{failed} of {len(results)} operations failed; nothing was applied',
+            'results': results
+        }), 400
     
-    task.status = new_status
-    task.updated_at = datetime.utcnow()
+    try:
+        db.session.flush()
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': CONFLICT_MESSAGE}), 409
+    touched = [result.pop('task') for result in results if 'task' in result]
+    touched_ids = [task.id for task in touched]
     db.session.commit()
     
+    # Reload every touched task with one query instead of one refresh per task
+    if touched_ids:
+        Task.query.filter(Task.id.in_(touched_ids)).all()
+    serialized = iter(serialize_tasks(touched))
+    events = []
+    for result in results:
+        if not result['success']:
+            continue
+        previous_assignee = result.pop('previous_assignee', None)
+        if result['op'] == 'delete':
+            events.append(task_event('deleted', result['id'], assignees=[previous_assignee]))
+            continue
+        result['task'] = next(serialized)
+        kind = 'created' if result['op'] == 'create' else 'updated'
+        assignees = [previous_assignee, result['task']['assigned_to']]
+        events.append(task_event(kind, result['task']['id'], result['task'], assignees))
+    publish_events(events)
+    
     return jsonify({
-        'success': True,
-        'message': 'Status updated successfully',
-        'task': task.to_dict()
+        'success': failed == 0,
+        'message': f'{len(results) - failed} of {len(results)} operations succeeded',
+        'results': results
     })
 
 @tasks_bp.route('/tasks/<int:task_id>/comments', methods=['GET'])
 @login_required
+@replica_reads
 def get_comments(task_id):
-    """Get comments for a task"""
+    """Get comments for a task, oldest first
+
+    Paginated with ``limit`` and ``cursor``; ``since`` (ISO timestamp)
+    restricts the result to newer comments.
+    """
     task = Task.query.get_or_404(task_id)
     
     # Check permissions
     if current_user.role != 'admin' and task.assigned_to != current_user.id:
         return jsonify({'success': False, 'message': 'Permission denied'}), 403
     
-    comments = Comment.query.filter_by(task_id=task_id).order_by(Comment.created_at.asc()).all()
+    limit = request.args.get('limit', DEFAULT_COMMENT_LIMIT, type=int)
+    limit = max(1, min(limit, MAX_COMMENT_LIMIT))
+    since = None
+    if request.args.get('since'):
+        try:
+            since = datetime.fromisoformat(request.args['since'])
+        except ValueError:
+            return jsonify({'success': False, 'message': 'Invalid since format'}), 400
+    
+    try:
+        comments, next_cursor, has_next = comment_page(
+            task_id, limit=limit, cursor=request.args.get('cursor'), since=since
+        )
+    except InvalidCursor as exc:
+        return jsonify({'success': False, 'message': str(exc)}), 400
     
     return jsonify({
         'success': True,
-        'comments': [comment.to_dict() for comment in comments]
+        'comments': [comment.to_dict() for comment in comments],
+        'meta': {
+            'limit': limit,
+            'has_next': has_next,
+            'next_cursor': next_cursor
+        }
     })
 
 @tasks_bp.route('/tasks/<int:task_id>/comments', methods=['POST'])
@@ -270,50 +456,84 @@ def add_comment(task_id):
     db.session.add(comment)
     db.session.commit()
     
+    serialized = comment.to_dict()
+    publish_events([comment_event(serialized, task.assigned_to)])
+    
     return jsonify({
         'success': True,
         'message': 'Comment added successfully',
-        'comment': comment.to_dict()
+        'comment': serialized
     }), 201
 
+@tasks_bp.route('/events', methods=['GET'])
+@login_required
+def task_events():
+    """Server-sent event stream of task and comment changes
+
+    Admins receive every change; developers only changes to tasks that are,
+    or were until that change, assigned to them. A ``resync`` event means
+    events were dropped and the client should reload.
+    """
+    backend = event_backend()
+    if not backend.enabled:
+        return jsonify({'success': False, 'message': 'Live updates are disabled'}), 404
+    
+    subscription = backend.subscribe(current_user.id, current_user.role)
+    heartbeat = current_app.config.get('EVENTS_HEARTBEAT', 15)
+    dumps = current_app.json.dumps
+    
+    def stream():
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                event = subscription.get(timeout=heartbeat)
+                # Comments keep the connection alive through proxies and
+                # surface disconnected clients on the next write
+                yield format_sse(event, dumps) if event else f': {int(time.time())}\n\n'
+        finally:
+            backend.unsubscribe(subscription)
+    
+    return Response(
+        stream(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @tasks_bp.route('/dashboard/stats', methods=['GET'])
 @login_required
+@replica_reads
+@versioned_json(dashboard_stats_scopes)
 def get_dashboard_stats():
-    """Get dashboard statistics"""
+    """Get dashboard statistics
+
+    Admins may pass ``group_by=assignee`` to also receive a per-developer
+    breakdown; it is computed by the same grouped query as the totals.
+    """
     if current_user.role == 'admin':
-        total_tasks = Task.query.count()
-        completed_tasks = Task.query.filter_by(status='Completed').count()
-        pending_tasks = Task.query.filter_by(status='Pending').count()
-        in_progress_tasks = Task.query.filter_by(status='In Progress').count()
-        
-        # Overdue tasks
-        today = date.today()
-        overdue_tasks = Task.query.filter(
-            Task.due_date < today,
-            Task.status != 'Completed'
-        ).count()
+        if request.args.get('group_by') == 'assignee':
+            stats, breakdown = compute_task_stats_by_assignee()
+            return jsonify({
+                'success': True,
+                'stats': stats,
+                'by_assignee': breakdown
+            })
+        stats = compute_task_stats()
     else:
-        total_tasks = Task.query.filter_by(assigned_to=current_user.id).count()
-        completed_tasks = Task.query.filter_by(assigned_to=current_user.id, status='Completed').count()
-        pending_tasks = Task.query.filter_by(assigned_to=current_user.id, status='Pending').count()
-        in_progress_tasks = Task.query.filter_by(assigned_to=current_user.id, status='In Progress').count()
-        
-        today = date.today()
-        overdue_tasks = Task.query.filter(
-            Task.assigned_to == current_user.id,
-            Task.due_date < today,
-            Task.status != 'Completed'
-        ).count()
+        stats = compute_task_stats(assigned_to=current_user.id)
     
     return jsonify({
         'success': True,
-        'stats': {
-            'total_tasks': total_tasks,
-            'completed_tasks': completed_tasks,
-            'pending_tasks': pending_tasks,
-            'in_progress_tasks': in_progress_tasks,
-            'overdue_tasks': overdue_tasks
-        }
+        'stats': stats
     })
 
+@tasks_bp.route('/bootstrap', methods=['GET'])
+@login_required
+@replica_reads
+@versioned_json(task_list_scopes)
+def get_bootstrap():
+    """Stats, the first task page, the user list (admins) and a sync token in one response
+
+    Lets the dashboard load with a single request instead of one per
+    widget; the dashboard page itself inlines the same payload.
+    """
+    return jsonify({'success': True, **build_bootstrap(current_user)})
@@ -2,6 +2,12 @@ from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
 from app import db
 from app.models.user import User
+from app.services.db_routing import replica_reads
+from app.services.response_cache import versioned_json
+from app.services.user_cache import invalidate_user
+from app.services.user_directory import (
+    MAX_USER_PAGE_SIZE, USER_PAGE_SIZE, invalidate_user_directory, user_directory, user_page
+)
 import re
 
 users_bp = Blueprint('users', __name__)
@@ -19,16 +25,45 @@ def validate_email(email):
 
 @users_bp.route('/users', methods=['GET'])
 @login_required
+@replica_reads
+@versioned_json(lambda: ['users'])
 def get_all_users():
-    """Get all users (Admin only)"""
+    """Get users, newest first, with pagination (Admin only)
+
+    ``q`` keeps users whose name or email starts with it.
+    """
     admin_check = require_admin()
     if admin_check:
         return admin_check
     
-    users = User.query.order_by(User.created_at.desc()).all()
+    page = max(1, request.args.get('page', 1, type=int))
+    per_page = request.args.get('per_page', USER_PAGE_SIZE, type=int)
+    per_page = max(1, min(per_page, MAX_USER_PAGE_SIZE))
+    users, meta = user_page(request.args.get('q'), page=page, per_page=per_page)
+    return jsonify({
+        'success': True,
+        'users': users,
+        'meta': meta
+    })
+
+@users_bp.route('/users/directory', methods=['GET'])
+@login_required
+@replica_reads
+@versioned_json(lambda: ['users'])
+def get_user_directory():
+    """Every user as an ``[id, name, role]`` row, ordered by name, for pickers (Admin only)
+
+    Served from a per-process copy that is rebuilt when ``version`` changes.
+    """
+    admin_check = require_admin()
+    if admin_check:
+        return admin_check
+
+    version, users = user_directory()
     return jsonify({
         'success': True,
-        'users': [user.to_dict() for user in users]
+        'version': version,
+        'users': users
     })
 
 @users_bp.route('/users', methods=['POST'])
@@ -73,6 +108,7 @@ def create_user():
     
     db.session.add(user)
     db.session.commit()
+    invalidate_user_directory()
     
     return jsonify({
         'success': True,
@@ -132,6 +168,8 @@ def update_user(user_id):
         user.set_password(data['password'])
     
     db.session.commit()
+    invalidate_user(user.id)
+    invalidate_user_directory()
     
     return jsonify({
         'success': True,
@@ -161,6 +199,8 @@ def delete_user(user_id):
     
     db.session.delete(user)
     db.session.commit()
+    invalidate_user(user_id)
+    invalidate_user_directory()
     
     return jsonify({
         'success': True,
@@ -0,0 +1,40 @@
+from app.models.task import Task
+from app.services.serializers import serialize_task_rows
+from app.services.task_changes import current_change_token
+from app.services.task_queries import cursor_page, scope_assignee, scoped_task_query, task_row_query
+from app.services.task_stats import compute_task_stats, count_tasks
+from app.services.user_directory import user_directory, user_page
+
+# Must match the dashboard's default page size and ordering
+BOOTSTRAP_PAGE_SIZE = 10
+BOOTSTRAP_SORT = ('created_at', 'desc')
+
+
+def build_bootstrap(user):
+    """Everything the dashboard's first paint needs, as one JSON-ready dict
+
+    Bundles what ``/api/dashboard/stats`` and the first cursor page of
+    ``/api/tasks`` return, plus a delta-sync token and, for admins, the
+    first page of ``/api/users`` and ``/api/users/directory``. The token is
+    read first, so a write racing with the other reads is replayed by the
+    client's next sync instead of lost.
+    """
+    next_since = current_change_token()
+    assignee = scope_assignee(user)
+    tasks, meta = cursor_page(
+        [(task_row_query(scoped_task_query(user)), Task)], *BOOTSTRAP_SORT, BOOTSTRAP_PAGE_SIZE, count_tasks(assignee)
+    )
+    result = {
+        'stats': compute_task_stats(assigned_to=assignee),
+        'tasks': serialize_task_rows(tasks),
+        'meta': meta,
+        'users': None,
+        'users_meta': None,
+        'directory': None,
+        'next_since': next_since
+    }
+    if user.role == 'admin':
+        result['users'], result['users_meta'] = user_page()
+        version, rows = user_directory()
+        result['directory'] = {'version': version, 'users': rows}
+    return result
@@ -0,0 +1,31 @@
+from sqlalchemy.orm import joinedload
+
+from app.models.comment import Comment
+from app.services.task_queries import keyset_filter, order_by_clauses, pack_cursor, unpack_cursor
+
+COMMENT_KEYS = [(Comment.created_at, False), (Comment.id, False)]
+DEFAULT_COMMENT_LIMIT = 50
+MAX_COMMENT_LIMIT = 200
+
+
+def comment_page(task_id, limit=DEFAULT_COMMENT_LIMIT, cursor=None, since=None):
+    """Return (comments, next_cursor, has_next) for a task, oldest first
+
+    Authors are joined into the same query. ``cursor`` continues after a
+    previous page; ``since`` (a datetime) only returns newer comments. The
+    returned cursor always points past the last comment, so a client can
+    poll with it to fetch only comments added later.
+    """
+    query = Comment.query.options(joinedload(Comment.user)).filter(Comment.task_id == task_id)
+    if cursor:
+        query = query.filter(keyset_filter(COMMENT_KEYS, unpack_cursor(COMMENT_KEYS, cursor, t=task_id)))
+    if since is not None:
+        query = query.filter(Comment.created_at > since)
+    rows = query.order_by(*order_by_clauses(COMMENT_KEYS)).limit(limit + 1).all()
+    comments, has_next = rows[:limit], len(rows) > limit
+
+    if comments:
+        next_cursor = pack_cursor(COMMENT_KEYS, comments[-1], t=task_id)
+    else:
+        next_cursor = cursor
+    return comments, next_cursor, has_next
@@ -0,0 +1,69 @@
+import gzip
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/javascript', 'text/css', 'text/csv',
+    'text/html', 'text/javascript', 'text/plain',
+}
+
+
+def _accepted_encoding(encodings):
+    accepted = request.accept_encodings
+    for encoding in encodings:
+        if accepted[encoding]:
+            return encoding
+    return None
+
+
+def _compress(data, encoding, level):
+    if encoding == 'br':
+        # Brotli quality 4-5 is about gzip's speed with smaller output
+        return brotli.compress(data, quality=min(level, 11))
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def init_compression(app):
+    """Compress eligible responses with brotli or gzip, as the client accepts
+
+    Only buffered 2xx responses of a compressible type and at least
+    COMPRESS_MIN_SIZE bytes are compressed. Streams (exports, /api/events)
+    are left alone. Strong ETags become weak, since the bytes differ per
+    encoding; ``If-None-Match`` matching already uses weak comparison.
+    """
+    if not app.config.get('COMPRESS_ENABLED', True):
+        return
+
+    min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+    encodings = ('br', 'gzip') if brotli is not None else ('gzip',)
+    levels = {'br': app.config.get('COMPRESS_BROTLI_QUALITY', 4), 'gzip': app.config.get('COMPRESS_GZIP_LEVEL', 3)}
+
+    @app.after_request
+    def compress_response(response):
+        if (
+            response.direct_passthrough
+            or response.is_streamed
+            or not 200 <= response.status_code < 300
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if (response.content_length or 0) < min_size:
+            return response
+        encoding = _accepted_encoding(encodings)
+        if encoding is None:
+            return response
+
+        response.set_data(_compress(response.get_data(), encoding, levels[encoding]))
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
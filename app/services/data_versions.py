@@ -0,0 +1,78 @@
+from sqlalchemy import case, event, func, literal, select
+
+from app import db
+from app.models.comment import Comment
+from app.models.data_version import DataVersion
+from app.models.user import User
+from app.services.upserts import upsert
+
+versions_table = DataVersion.__table__
+
+# Read-only scope standing for every ``tasks:<assignee id>`` scope at
+# once. Its version is their sum, so there is no global row that every
+# task write would have to lock until it commits.
+ALL_TASKS_SCOPE = 'tasks:*'
+
+
+def task_scope(assignee_id):
+    return f'tasks:{assignee_id}'
+
+
+def bump_versions(connection, scopes):
+    """Increment the version of every scope in ``scopes`` on ``connection``
+
+    One upsert covers every scope, existing or new; the rows are locked in
+    primary-key order, so concurrent writers cannot deadlock on them.
+    """
+    rows = [{'scope': scope, 'version': 1} for scope in sorted(set(scopes))]
+    upsert(connection, versions_table, rows, ['scope'], lambda new: {'version': versions_table.c.version + 1})
+
+
+def raise_version(connection, scope, value):
+    """Set ``scope``'s version to ``value`` unless it is already higher"""
+    current = versions_table.c.version
+    upsert(
+        connection, versions_table, [{'scope': scope, 'version': value}], ['scope'],
+        lambda new: {'version': case((new.version > current, new.version), else_=current)}
+    )
+
+
+def read_versions(scopes):
+    """Return a tuple of the current versions of ``scopes`` (0 for unknown scopes)
+
+    One query; ALL_TASKS_SCOPE adds up the ``tasks:`` rows with a
+    primary-key range scan.
+    """
+    query = select(versions_table.c.scope, versions_table.c.version).where(versions_table.c.scope.in_(scopes))
+    if ALL_TASKS_SCOPE in scopes:
+        # ';' sorts right after ':', so this is every scope starting with 'tasks:'
+        query = query.union_all(
+            select(literal(ALL_TASKS_SCOPE), func.sum(versions_table.c.version))
+            .where(versions_table.c.scope >= task_scope(''), versions_table.c.scope < 'tasks;')
+        )
+    rows = dict(db.session.execute(query).all())
+    return tuple(rows.get(scope) or 0 for scope in scopes)
+
+
+def _changed_scopes(session):
+    scopes = set()
+    for obj in list(session.new) + list(session.deleted) + list(session.dirty):
+        if isinstance(obj, User):
+            if obj in session.dirty and not session.is_modified(obj):
+                continue
+            scopes.add('users')
+        elif isinstance(obj, Comment):
+            scopes.add('comments')
+    return scopes
+
+
+def _track_data_changes(session, flush_context, instances):
+    """before_flush hook bumping the versions of the scopes a flush touches"""
+    scopes = _changed_scopes(session)
+    if scopes:
+        bump_versions(session.connection(), scopes)
+
+
+def register_version_events():
+    if not event.contains(db.session, 'before_flush', _track_data_changes):
+        event.listen(db.session, 'before_flush', _track_data_changes)
@@ -0,0 +1,63 @@
+import time
+from functools import wraps
+
+from flask import current_app, g, has_app_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND = 'replica'
+
+
+class RoutingSession(Session):
+    """Sends reads to the replica while a ``replica_reads`` view is running
+
+    Flushes (and the before_flush hooks that write change numbers and
+    versions) always go to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get('use_replica'):
+            return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def replica_configured(app=None):
+    app = app or current_app
+    return REPLICA_BIND in (app.config.get('SQLALCHEMY_BINDS') or {})
+
+
+def replica_reads(view):
+    """Run a read-only view against the replica when one is configured
+
+    A user who committed a change within REPLICA_STICKY_SECONDS keeps
+    reading from the primary so they always see their own writes.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if replica_configured() and session.get('primary_until', 0) < time.time():
+            g.use_replica = True
+        try:
+            return view(*args, **kwargs)
+        finally:
+            g.pop('use_replica', None)
+    return wrapper
+
+
+def _mark_write(db_session):
+    if has_app_context():
+        g.wrote_primary = True
+
+
+def _pin_to_primary(response):
+    if g.pop('wrote_primary', False):
+        session['primary_until'] = time.time() + current_app.config.get('REPLICA_STICKY_SECONDS', 5)
+    return response
+
+
+def init_db_routing(app, db):
+    """Track commits so writers are pinned to the primary for a while"""
+    if not replica_configured(app):
+        return
+    if not event.contains(db.session, 'after_commit', _mark_write):
+        event.listen(db.session, 'after_commit', _mark_write)
+    app.after_request(_pin_to_primary)
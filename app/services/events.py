@@ -0,0 +1,240 @@
+import json
+import logging
+import queue
+import threading
+import time
+
+from flask import current_app
+
+# Sent when a subscriber fell too far behind and dropped events
+RESYNC = {'type': 'resync'}
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """One SSE connection's bounded queue of events"""
+
+    def __init__(self, user_id, role, max_size=100):
+        self.user_id = user_id
+        self.role = role
+        self._queue = queue.Queue(maxsize=max_size)
+        self.overflowed = False
+
+    def wants(self, event):
+        return self.role == 'admin' or self.user_id in event['audience']
+
+    def put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout):
+        """Next event, RESYNC after an overflow, or None on timeout"""
+        if self.overflowed:
+            self.overflowed = False
+            with self._queue.mutex:
+                self._queue.queue.clear()
+            return RESYNC
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventHub:
+    """Fans events out to the subscriptions of this process"""
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id, role):
+        subscription = Subscription(user_id, role, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def dispatch(self, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.wants(event):
+                subscription.put(event)
+
+    def resync(self):
+        """Tell every subscription to reload, after events may have been lost"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.put(RESYNC)
+
+
+class MemoryEventBackend:
+    """Single-process delivery; enough for one worker or the dev server"""
+
+    enabled = True
+
+    def __init__(self, hub):
+        self.hub = hub
+
+    def subscribe(self, user_id, role):
+        return self.hub.subscribe(user_id, role)
+
+    def unsubscribe(self, subscription):
+        self.hub.unsubscribe(subscription)
+
+    def publish(self, event):
+        self.hub.dispatch(event)
+
+
+class RedisEventBackend:
+    """Delivers events to every worker through a Redis pub/sub channel
+
+    Each process runs one listener thread that feeds its local hub, so the
+    number of Redis connections does not grow with the number of clients.
+    The thread starts with the process's first stream (after any fork) and
+    reconnects with backoff when Redis goes away; since events published
+    meanwhile are lost, local subscribers get RESYNC once it is back.
+    """
+
+    enabled = True
+    min_backoff = 0.5
+    max_backoff = 30
+
+    def __init__(self, hub, url, dumps, channel='teamprogress:events'):
+        import redis
+
+        self.hub = hub
+        self.dumps = dumps
+        self.channel = channel
+        self._client = redis.Redis.from_url(url)
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='event-listener', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        backoff = self.min_backoff
+        connected_before = False
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                if connected_before:
+                    self.hub.resync()
+                connected_before = True
+                backoff = self.min_backoff
+                for message in pubsub.listen():
+                    self._dispatch(message)
+            except Exception:
+                logger.exception('Event listener lost Redis; reconnecting in %.1fs', backoff)
+            finally:
+                pubsub.close()
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _dispatch(self, message):
+        try:
+            event = json.loads(message['data'])
+            event['audience'] = set(event['audience'])
+        except (KeyError, TypeError, ValueError):
+            logger.warning('Ignoring malformed event on %s', self.channel)
+            return
+        self.hub.dispatch(event)
+
+    def subscribe(self, user_id, role):
+        subscription = self.hub.subscribe(user_id, role)
+        self._ensure_listener()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self.hub.unsubscribe(subscription)
+
+    def publish(self, event):
+        payload = dict(event, audience=list(event['audience']))
+        self._client.publish(self.channel, self.dumps(payload))
+
+
+class NullEventBackend:
+    """Events disabled; /api/events answers 404 and clients fall back to polling"""
+
+    enabled = False
+
+    def __init__(self, hub):
+        self.hub = hub
+
+    def publish(self, event):
+        pass
+
+
+def init_events(app):
+    hub = EventHub(queue_size=app.config.get('EVENTS_QUEUE_SIZE', 100))
+    backend_name = app.config.get('EVENTS_BACKEND', 'memory')
+    if backend_name == 'redis':
+        backend = RedisEventBackend(hub, app.config.get('EVENTS_REDIS_URL', 'redis://localhost:6379/0'), app.json.dumps)
+    elif backend_name == 'none':
+        backend = NullEventBackend(hub)
+    else:
+        backend = MemoryEventBackend(hub)
+    app.extensions['events'] = backend
+    return backend
+
+
+def event_backend():
+    return current_app.extensions['events']
+
+
+def task_event(kind, task_id, task=None, assignees=()):
+    """Build a ``task.<kind>`` event for the admins and the given assignees
+
+    ``assignees`` should hold the assignee before and after the change, so a
+    developer also hears about a task being reassigned away from them.
+    """
+    return {
+        'type': f'task.{kind}',
+        'id': task_id,
+        'task': task,
+        'audience': {assignee for assignee in assignees if assignee is not None},
+    }
+
+
+def comment_event(comment, assignee):
+    return {
+        'type': 'comment.created',
+        'id': comment['id'],
+        'comment': comment,
+        'audience': {assignee} if assignee is not None else set(),
+    }
+
+
+def publish_events(events):
+    """Publish committed changes; call after ``db.session.commit()``
+
+    The write has already committed, so a backend failure (Redis down) is
+    logged rather than raised: the request still succeeds, and listeners
+    catch up on their next reload.
+    """
+    backend = event_backend()
+    if backend.enabled:
+        for event in events:
+            try:
+                backend.publish(event)
+            except Exception:
+                logger.exception('Could not publish %s event', event['type'])
+
+
+def format_sse(event, dumps):
+    """Frame ``event`` for the stream, encoded with the app's JSON ``dumps``"""
+    payload = {key: value for key, value in event.items() if key != 'audience'}
+    return f"event: {event['type']}\ndata: {dumps(payload)}\n\n"
@@ -0,0 +1,60 @@
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+
+class IsoJSONProvider(DefaultJSONProvider):
+    """Stdlib JSON provider that writes dates and datetimes as ISO 8601
+
+    Flask's default provider formats them as HTTP dates; ISO strings are
+    what the API has always returned, so models hand over date objects and
+    leave the formatting to the provider.
+    """
+
+    @staticmethod
+    def default(obj):
+        if isinstance(obj, date):
+            return obj.isoformat()
+        return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(IsoJSONProvider):
+    """orjson-backed provider; serializes dates and datetimes natively"""
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # Callers asking for stdlib options (indent, separators...) get them
+            return super().dumps(obj, **kwargs)
+        return self._dumps_bytes(obj).decode()
+
+    def _dumps_bytes(self, obj):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=option)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    """Install the orjson provider when available (JSON_PROVIDER=auto|orjson|stdlib)"""
+    choice = app.config.get('JSON_PROVIDER', 'auto')
+    if choice == 'orjson' and orjson is None:
+        raise RuntimeError('JSON_PROVIDER=orjson but orjson is not installed')
+    provider_class = OrjsonProvider if orjson is not None and choice != 'stdlib' else IsoJSONProvider
+    app.json = provider_class(app)
+    return app.json
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+
+class MemoryAttemptStore:
+    """Fixed-window attempt counters kept per process
+
+    Counters are kept in the order their windows opened, so when the store
+    is full of live keys the oldest are dropped first.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._counters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self, now):
+        """Drop expired counters, then the oldest live ones until there is room
+
+        A spray of random emails thus only pushes out the longest-running
+        windows instead of resetting every counter at once.
+        """
+        expired = [key for key, (_, expires_at) in self._counters.items() if expires_at <= now]
+        for key in expired:
+            del self._counters[key]
+        while len(self._counters) >= self.max_keys:
+            self._counters.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                return 0
+            return entry[0]
+
+    def incr(self, key, window):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None or entry[1] <= now:
+                if len(self._counters) >= self.max_keys:
+                    self._prune(now)
+                entry = [0, now + window]
+                self._counters.pop(key, None)
+                self._counters[key] = entry
+            entry[0] += 1
+            return entry[0]
+
+    def reset(self, key):
+        with self._lock:
+            self._counters.pop(key, None)
+
+
+class RedisAttemptStore:
+    """Counters shared by every worker, expiring with the window"""
+
+    def __init__(self, url, prefix='teamprogress:login:'):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self._client.get(self.prefix + key)
+        return int(value) if value else 0
+
+    def incr(self, key, window):
+        pipe = self._client.pipeline()
+        pipe.set(self.prefix + key, 0, ex=window, nx=True)
+        pipe.incr(self.prefix + key)
+        return pipe.execute()[1]
+
+    def reset(self, key):
+        self._client.delete(self.prefix + key)
+
+
+class LoginThrottle:
+    """Per-email and per-IP limits on failed logins
+
+    ``check`` is a couple of counter reads, so abusive attempts are turned
+    away before any password hashing happens.
+    """
+
+    def __init__(self, store, per_email=5, per_ip=50, window=300):
+        self.store = store
+        self.per_email = per_email
+        self.per_ip = per_ip
+        self.window = window
+
+    def check(self, email, ip):
+        """True if another attempt is allowed for this email and address"""
+        return (
+            self.store.get(f'email:{email}') < self.per_email
+            and self.store.get(f'ip:{ip}') < self.per_ip
+        )
+
+    def failed(self, email, ip):
+        self.store.incr(f'email:{email}', self.window)
+        self.store.incr(f'ip:{ip}', self.window)
+
+    def succeeded(self, email):
+        self.store.reset(f'email:{email}')
+
+
+def init_login_throttle(app):
+    if app.config.get('LOGIN_THROTTLE_BACKEND', 'memory') == 'redis':
+        store = RedisAttemptStore(app.config.get('LOGIN_THROTTLE_REDIS_URL', 'redis://localhost:6379/0'))
+    else:
+        store = MemoryAttemptStore()
+    throttle = LoginThrottle(
+        store,
+        per_email=app.config.get('LOGIN_MAX_ATTEMPTS_PER_EMAIL', 5),
+        per_ip=app.config.get('LOGIN_MAX_ATTEMPTS_PER_IP', 50),
+        window=app.config.get('LOGIN_ATTEMPT_WINDOW', 300)
+    )
+    app.extensions['login_throttle'] = throttle
+    return throttle
+
+
+def login_throttle():
+    return current_app.extensions['login_throttle']
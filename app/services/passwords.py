@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app, jsonify
+from werkzeug.security import check_password_hash, generate_password_hash
+
+DEFAULT_HASH_METHOD = 'scrypt:32768:8:1'
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool already has its maximum backlog"""
+
+
+class PasswordHasher:
+    """Runs password hashing on a small thread pool behind a bounded semaphore
+
+    The calling request thread still waits for its hash; the pool only caps
+    how many cores hashing uses at once (``workers``). What protects the
+    request threads from a login flood is the semaphore: at most
+    ``max_pending`` hashes may be running or queued, and any call beyond
+    that fails at once with PasswordHasherBusy, answered as a 503.
+    """
+
+    def __init__(self, method=DEFAULT_HASH_METHOD, workers=2, max_pending=16):
+        self.method = method
+        # The "method:params" part of a hash made now, with werkzeug's
+        # defaults filled in (so "scrypt" becomes "scrypt:32768:8:1")
+        self._prefix = generate_password_hash('x', method).split('$', 1)[0]
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def _run(self, function, *args):
+        # Refuse rather than queue: a waiting caller would hold its request thread
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy()
+        try:
+            return self._executor.submit(function, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True for hashes made with another method or other cost parameters"""
+        return password_hash.split('$', 1)[0] != self._prefix
+
+
+def init_password_hasher(app):
+    hasher = PasswordHasher(
+        method=app.config.get('PASSWORD_HASH_METHOD', DEFAULT_HASH_METHOD),
+        workers=app.config.get('PASSWORD_HASH_WORKERS', 2),
+        max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING', 16)
+    )
+    app.extensions['password_hasher'] = hasher
+
+    @app.errorhandler(PasswordHasherBusy)
+    def password_hasher_busy(exc):
+        response = jsonify({'success': False, 'message': 'Server busy, please retry shortly'})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+
+    return hasher
+
+
+def password_hasher():
+    return current_app.extensions['password_hasher']
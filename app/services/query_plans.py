@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+from app import db
+from app.services.task_queries import SORT_FIELDS, apply_sort, scoped_task_query, task_row_query
+
+# Viewer scopes the task list is served in: (user, assigned_to filter)
+TASK_LIST_SCOPES = {
+    'admin': (SimpleNamespace(role='admin', id=None), None),
+    'assignee': (SimpleNamespace(role='developer', id=1), None),
+    'unassigned': (SimpleNamespace(role='admin', id=None), 'unassigned'),
+}
+
+
+def explain(statement):
+    """Return the query plan lines for ``statement`` on the current database"""
+    dialect = db.engine.dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    if dialect.name == 'sqlite':
+        rows = db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}'))
+        return [row.detail for row in rows]
+    rows = db.session.execute(db.text(f'EXPLAIN {sql}')).mappings()
+    return [' '.join(f'{key}={value}' for key, value in row.items()) for row in rows]
+
+
+def uses_filesort(plan):
+    return any('USE TEMP B-TREE' in line or 'Using filesort' in line for line in plan)
+
+
+def task_list_plans():
+    """Yield (scope, sort_by, sort_dir, plan) for every /api/tasks page query"""
+    for scope, (user, assigned_to) in TASK_LIST_SCOPES.items():
+        for sort_by in SORT_FIELDS:
+            for sort_dir in ('asc', 'desc'):
+                query = apply_sort(task_row_query(scoped_task_query(user, assigned_to)), sort_by, sort_dir).limit(10)
+                yield scope, sort_by, sort_dir, explain(query.statement)
@@ -0,0 +1,182 @@
+import hmac
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Response, abort, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds of the histogram buckets (Prometheus ``le`` labels)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+HISTOGRAMS = (
+    ('http_request_duration_seconds', 'Wall time per request', DURATION_BUCKETS),
+    ('http_request_db_seconds', 'Time spent in SQL per request', DURATION_BUCKETS),
+    ('http_request_sql_queries', 'SQL statements executed per request', QUERY_BUCKETS),
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram; callers hold the registry lock"""
+
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Per-process request histograms keyed by blueprint
+
+    Recording is one dict lookup and three bisects under a lock, cheap
+    enough to leave on in production. Each worker process exposes its own
+    numbers; let Prometheus sum them across instances.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._responses = {}
+
+    def record(self, blueprint, status, duration, db_time, queries):
+        with self._lock:
+            series = self._histograms.get(blueprint)
+            if series is None:
+                series = self._histograms[blueprint] = [Histogram(buckets) for _, _, buckets in HISTOGRAMS]
+            for histogram, value in zip(series, (duration, db_time, queries)):
+                histogram.observe(value)
+            key = (blueprint, status)
+            self._responses[key] = self._responses.get(key, 0) + 1
+
+    def render(self):
+        """Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for index, (name, help_text, buckets) in enumerate(HISTOGRAMS):
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} histogram')
+                for blueprint, series in sorted(self._histograms.items()):
+                    histogram = series[index]
+                    cumulative = 0
+                    for bound, count in zip(buckets + ('+Inf',), histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{blueprint="{blueprint}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{blueprint="{blueprint}"}} {histogram.total:.6f}')
+                    lines.append(f'{name}_count{{blueprint="{blueprint}"}} {histogram.count}')
+            lines.append('# HELP http_responses_total Responses by blueprint and status code')
+            lines.append('# TYPE http_responses_total counter')
+            for (blueprint, status), count in sorted(self._responses.items()):
+                lines.append(f'http_responses_total{{blueprint="{blueprint}",status="{status}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_app_context() and 'sql_stats' in g:
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def _finish_statement(conn):
+    started = conn.info.get('query_started')
+    if started and has_app_context() and 'sql_stats' in g:
+        stats = g.sql_stats
+        stats[0] += 1
+        stats[1] += time.perf_counter() - started.pop()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _finish_statement(conn)
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; without this its
+    # start time would stay on the stack and skew every later statement
+    if context.connection is not None:
+        _finish_statement(context.connection)
+
+
+def register_sql_timing():
+    """Time every statement run while a request is being measured"""
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+
+def _start_timer():
+    g.request_started = time.perf_counter()
+    g.sql_stats = [0, 0.0]  # statements, seconds
+
+
+def _add_server_timing(response):
+    started = g.get('request_started')
+    if started is None or request.endpoint == 'metrics':
+        return response
+
+    queries, db_time = g.sql_stats
+    duration = time.perf_counter() - started
+    response.headers.add(
+        'Server-Timing',
+        f'app;dur={duration * 1000:.1f}, db;dur={db_time * 1000:.1f};desc="{queries} queries"'
+    )
+    g.response_status = response.status_code
+    return response
+
+
+def _record_request(exc):
+    """teardown_request hook, so requests that raised are counted (as 500s) too"""
+    started = g.pop('request_started', None)
+    stats = g.pop('sql_stats', None)
+    status = g.pop('response_status', 500)
+    registry = g.get('metrics_registry')
+    if started is None or registry is None or request.endpoint == 'metrics':
+        return
+
+    queries, db_time = stats
+    registry.record(request.blueprint or 'app', status, time.perf_counter() - started, db_time, queries)
+
+
+def init_request_metrics(app):
+    """Register the timing hooks and, when enabled, the /metrics endpoint
+
+    ``METRICS_ENABLED`` turns the whole thing off. Scrapers must send
+    ``METRICS_TOKEN`` as a bearer token; without a token /metrics answers
+    404, except under the debugger.
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return None
+
+    registry = MetricsRegistry()
+    app.extensions['request_metrics'] = registry
+    register_sql_timing()
+
+    @app.before_request
+    def start_request_timer():
+        _start_timer()
+        g.metrics_registry = registry
+
+    app.after_request(_add_server_timing)
+    app.teardown_request(_record_request)
+
+    def metrics():
+        token = app.config.get('METRICS_TOKEN')
+        if token:
+            supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+            # Bytes: compare_digest rejects str with non-ASCII characters
+            if not hmac.compare_digest(supplied.encode(), token.encode()):
+                abort(401)
+        elif not app.debug:
+            abort(404)
+        return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule('/metrics', 'metrics', metrics)
+    return registry
@@ -0,0 +1,91 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request
+from flask_login import current_user
+
+from app.services.data_versions import read_versions
+
+
+class ResponseCache:
+    """Per-process LRU of serialized JSON bodies, each stored with its ETag
+
+    Entries are never expired explicitly: a write bumps the data version,
+    which changes the ETag a request computes, so a stale entry simply no
+    longer matches and is replaced.
+    """
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, etag):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, etag, body):
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def init_response_cache(app):
+    cache = ResponseCache(max_size=app.config.get('RESPONSE_CACHE_SIZE', 512))
+    app.extensions['response_cache'] = cache
+    return cache
+
+
+def _viewer_key():
+    # Admins all see the same data; everyone else sees their own slice
+    return 'admin' if current_user.role == 'admin' else f'user:{current_user.id}'
+
+
+def versioned_json(scopes):
+    """Serve a GET JSON view with a strong ETag and a server-side body cache
+
+    ``scopes`` is called per request and returns the data_versions scopes
+    the response depends on. The ETag hashes those versions together with
+    the endpoint, viewer and query string, so a matching ``If-None-Match``
+    gets a 304 and a cached body is reused without running the view. The
+    overdue rollover bumps the versions it changes, so the date is not part
+    of the key.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            scope_names = scopes()
+            key = (request.endpoint, _viewer_key(), request.query_string)
+            stamp = (key, scope_names, read_versions(scope_names))
+            etag = hashlib.sha1(repr(stamp).encode()).hexdigest()
+
+            # Weak match: compression turns the ETag weak on the way out
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                cache = current_app.extensions['response_cache']
+                body = cache.get(key, etag)
+                if body is None:
+                    response = current_app.make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    cache.set(key, etag, response.get_data())
+                else:
+                    response = current_app.response_class(body, mimetype='application/json')
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
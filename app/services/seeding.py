@@ -0,0 +1,241 @@
+import random
+from array import array
+from datetime import date, datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, func, insert, select, text
+
+from app import db
+from app.models.archived_comment import ArchivedComment
+from app.models.archived_task import ArchivedTask
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.task_counter import TaskCounter
+from app.models.user import User
+from app.services.data_versions import bump_versions, task_scope, versions_table
+from app.services.passwords import password_hasher
+from app.services.task_bookkeeping import create_bookkeeping_triggers, drop_bookkeeping_triggers
+from app.services.task_changes import expire_change_tokens, next_change_seq
+from app.services.task_counters import rebuild_counters
+from app.services.task_overdue import overdue_on
+from app.services.task_search import create_search_index, drop_search_index
+
+users_table = User.__table__
+tasks_table = Task.__table__
+comments_table = Comment.__table__
+
+SEED_BATCH_SIZE = 10000
+SEED_PASSWORD = 'dev123'
+
+# Roughly what a team with a long-running backlog looks like
+STATUS_WEIGHTS = {'Completed': 45, 'Pending': 25, 'In Progress': 20, 'On Hold': 10}
+PRIORITY_WEIGHTS = {'Medium': 50, 'High': 25, 'Low': 25}
+UNASSIGNED_SHARE = 0.05
+NO_DUE_DATE_SHARE = 0.15
+HISTORY_DAYS = 365
+
+TASK_VERBS = ['Implement', 'Fix', 'Refactor', 'Review', 'Document', 'Test', 'Migrate', 'Optimize']
+TASK_NOUNS = ['login flow', 'task export', 'dashboard stats', 'API pagination', 'user settings',
+              'email alerts', 'search index', 'billing report', 'audit log', 'file uploads']
+COMMENT_TEXTS = ['Started on this.', 'Blocked on review.', 'Pushed a first version.',
+                 'Needs more tests.', 'Looks good to me.', 'Moved to next sprint.',
+                 'Can we clarify the scope?', 'Done, please verify.']
+
+
+def _weighted(rng, weights, k):
+    return rng.choices(list(weights), weights=list(weights.values()), k=k)
+
+
+def _batches(total, size):
+    for start in range(0, total, size):
+        yield start, min(size, total - start)
+
+
+def _next_id(column, archived_column=None):
+    """An id above every one handed out so far, archived and deleted rows included"""
+    highest = [db.session.execute(select(func.max(column))).scalar()]
+    if archived_column is not None:
+        highest.append(db.session.execute(select(func.max(archived_column))).scalar())
+    if db.session.get_bind().dialect.name == 'sqlite' and column.table.dialect_options['sqlite']['autoincrement']:
+        highest.append(db.session.execute(
+            text('SELECT seq FROM sqlite_sequence WHERE name = :name'), {'name': column.table.name}
+        ).scalar())
+    return max(value or 0 for value in highest) + 1
+
+
+def _bulk_load_indexes(dialect):
+    """Secondary indexes on tasks and comments to drop for a bulk load
+
+    MySQL refuses to drop an index that backs a foreign key, so on MySQL
+    the ones led by a foreign key column are kept.
+    """
+    indexes = [index for table in (tasks_table, comments_table) for index in table.indexes]
+    if dialect.name == 'mysql':
+        indexes = [index for index in indexes if not list(index.expressions)[0].foreign_keys]
+    return indexes
+
+
+def _tune_connection(connection):
+    # SQLite's default 2 MB page cache thrashes on a million-row load
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql('PRAGMA cache_size = -262144')
+
+
+def clear_seeded_tables():
+    """Delete every user, task and comment, archived ones included, one statement per table
+
+    The bookkeeping triggers are dropped for the deletes, which would
+    otherwise run them once per task; task_counters is emptied and every
+    task data version bumped afterwards instead. The deletes leave no
+    tombstones, so every outstanding delta-sync token is expired too.
+    """
+    with db.engine.begin() as connection:
+        triggers_dropped = drop_bookkeeping_triggers(connection)
+    try:
+        with db.engine.begin() as connection:
+            expire_change_tokens(connection)
+            scopes = connection.execute(
+                select(versions_table.c.scope).where(versions_table.c.scope.startswith(task_scope('')))
+            ).scalars().all()
+            for table in (ArchivedComment.__table__, ArchivedTask.__table__, comments_table, tasks_table, users_table):
+                connection.execute(delete(table))
+            connection.execute(delete(TaskCounter.__table__))
+            bump_versions(connection, scopes + ['users', 'comments'])
+    finally:
+        if triggers_dropped:
+            with db.engine.begin() as connection:
+                create_bookkeeping_triggers(connection)
+
+
+def seed_database(users, tasks, comments, batch_size=SEED_BATCH_SIZE, seed=None, progress=None):
+    """Bulk-insert users, tasks and comments with Core ``insert()`` batches
+
+    Rows are appended after the existing ones with explicit ids, so tasks
+    can be referenced by comments without reading ids back. Assignees follow
+    a Zipf-like curve (a few developers own most of the work); statuses,
+    priorities and due dates are skewed the way a real backlog is.
+
+    The task and comment indexes (and the full-text search indexes) are
+    dropped for the load and rebuilt once at the end, which is several
+    times faster than maintaining them row by row. So are the bookkeeping
+    triggers: task_counters is rebuilt and the data versions are bumped
+    once at the end. Every new task shares one change_seq, and
+    outstanding delta-sync tokens are expired.
+    ``progress(table, done)`` is called after every batch. Returns the
+    first inserted id per table.
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    today = date.today()
+    password_hash = password_hasher().hash(SEED_PASSWORD)
+
+    first_user_id = _next_id(User.id)
+    first_task_id = _next_id(Task.id, ArchivedTask.id)
+    first_comment_id = _next_id(Comment.id, ArchivedComment.id)
+
+    # One admin who creates the tasks, plus the developers they go to
+    admin_id = first_user_id
+    user_rows = [{
+        'id': admin_id, 'name': f'Seed Admin {admin_id}', 'email': f'admin{admin_id}@seed.local',
+        'password_hash': password_hash, 'role': 'admin', 'created_at': now
+    }]
+    developer_ids = list(range(admin_id + 1, admin_id + 1 + users))
+    for user_id in developer_ids:
+        user_rows.append({
+            'id': user_id, 'name': f'Developer {user_id}', 'email': f'dev{user_id}@seed.local',
+            'password_hash': password_hash, 'role': 'developer', 'created_at': now
+        })
+    dropped = _bulk_load_indexes(db.engine.dialect)
+    with db.engine.begin() as connection:
+        for index in dropped:
+            index.drop(connection)
+        search_dropped = drop_search_index(connection)
+        triggers_dropped = drop_bookkeeping_triggers(connection)
+
+    try:
+        with db.engine.begin() as connection:
+            _tune_connection(connection)
+            change_seq = next_change_seq(connection)
+            for start, size in _batches(len(user_rows), batch_size):
+                connection.execute(insert(users_table), user_rows[start:start + size])
+                if progress:
+                    progress('users', start + size)
+
+            # Remember each task's assignee and creation time for its comments
+            assignees = array('i')
+            created_offsets = array('f')
+            developer_weights = [1 / rank ** 1.1 for rank in range(1, len(developer_ids) + 1)]
+            history = HISTORY_DAYS * 86400
+            for start, size in _batches(tasks, batch_size):
+                statuses = _weighted(rng, STATUS_WEIGHTS, size)
+                priorities = _weighted(rng, PRIORITY_WEIGHTS, size)
+                owners = rng.choices(developer_ids, weights=developer_weights, k=size) if developer_ids else [None] * size
+                rows = []
+                for offset in range(size):
+                    task_id = first_task_id + start + offset
+                    assignee = None if rng.random() < UNASSIGNED_SHARE else owners[offset]
+                    age = rng.random() * history
+                    created_at = now - timedelta(seconds=age)
+                    updated_at = created_at + timedelta(seconds=rng.random() * age)
+                    due_date = None
+                    if rng.random() >= NO_DUE_DATE_SHARE:
+                        due_date = created_at.date() + timedelta(days=rng.randint(3, 60))
+                    rows.append({
+                        'id': task_id,
+                        'title': f'{rng.choice(TASK_VERBS)} {rng.choice(TASK_NOUNS)} #{task_id}',
+                        'description': None,
+                        'assigned_to': assignee,
+                        'priority': priorities[offset],
+                        'status': statuses[offset],
+                        'start_date': created_at.date(),
+                        'due_date': due_date,
+                        'is_overdue': overdue_on(due_date, statuses[offset], today),
+                        'change_seq': change_seq,
+                        'created_by': admin_id,
+                        'created_at': created_at,
+                        'updated_at': updated_at,
+                    })
+                    assignees.append(assignee or 0)
+                    created_offsets.append(age)
+                connection.execute(insert(tasks_table), rows)
+                if progress:
+                    progress('tasks', start + size)
+
+            # Comments cluster on a minority of tasks and are written by the assignee
+            for start, size in _batches(comments if tasks else 0, batch_size):
+                rows = []
+                for offset in range(size):
+                    index = int(tasks * rng.random() ** 3)
+                    age = created_offsets[index] * rng.random()
+                    rows.append({
+                        'id': first_comment_id + start + offset,
+                        'task_id': first_task_id + index,
+                        'user_id': assignees[index] or admin_id,
+                        'comment_text': rng.choice(COMMENT_TEXTS),
+                        'created_at': now - timedelta(seconds=age),
+                    })
+                connection.execute(insert(comments_table), rows)
+                if progress:
+                    progress('comments', start + size)
+    finally:
+        with db.engine.begin() as connection:
+            _tune_connection(connection)
+            for index in dropped:
+                index.create(connection)
+            if search_dropped:
+                create_search_index(connection)
+            if triggers_dropped:
+                create_bookkeeping_triggers(connection)
+            if progress:
+                progress('indexes', len(dropped))
+
+    rebuild_counters()
+    scopes = {'users', 'comments', task_scope(TaskCounter.UNASSIGNED)} | {task_scope(user_id) for user_id in developer_ids}
+    with db.engine.begin() as connection:
+        bump_versions(connection, scopes)
+        # The load ran far longer than CHANGE_SEQ_GRACE, so its number may
+        # already have been passed over by delta-sync readers
+        expire_change_tokens(connection)
+    current_app.extensions['user_cache'].clear()
+
+    return {'users': first_user_id, 'tasks': first_task_id, 'comments': first_comment_id}
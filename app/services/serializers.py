@@ -0,0 +1,45 @@
+from app import db
+from app.models.user import User
+from app.services.task_queries import ROW_SORT_FIELDS
+
+
+def load_user_names(user_ids):
+    """Fetch {id: name} for the given user ids in a single query"""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return {}
+    rows = db.session.query(User.id, User.name).filter(User.id.in_(user_ids))
+    return {user_id: name for user_id, name in rows}
+
+
+def serialize_tasks(tasks):
+    """Serialize a list of tasks, resolving assignee/creator names in one query
+
+    Replaces per-row ``Task.to_dict()`` calls, which lazy-load both user
+    relationships and cost two extra SELECTs per task.
+    """
+    user_names = load_user_names(
+        [task.assigned_to for task in tasks] + [task.created_by for task in tasks]
+    )
+    return [task.to_dict(user_names=user_names) for task in tasks]
+
+
+def serialize_task(task):
+    """Serialize a single task (used by the create/update responses)"""
+    return serialize_tasks([task])[0]
+
+
+def serialize_task_rows(rows):
+    """Serialize rows from ``task_row_query`` into the same dicts as ``serialize_tasks``
+
+    The names were joined in by the query, so this runs no SQL. Fields are
+    keyed by the row's own column labels, so live and archived rows (which
+    add ``archived_at``) serialize alike; the sort keys are dropped.
+    """
+    serialized = []
+    for row in rows:
+        task = dict(zip(row._fields, row))
+        for name in ROW_SORT_FIELDS:
+            del task[name]
+        serialized.append(task)
+    return serialized
@@ -0,0 +1,109 @@
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, literal, select
+
+from app import db
+from app.models.archived_comment import ArchivedComment
+from app.models.archived_task import ArchivedTask
+from app.models.comment import Comment
+from app.models.task import Task
+from app.services.task_changes import next_change_seq, write_tombstones
+
+tasks_table = Task.__table__
+comments_table = Comment.__table__
+archived_tasks_table = ArchivedTask.__table__
+archived_comments_table = ArchivedComment.__table__
+
+ARCHIVE_BATCH_SIZE = 1000
+
+AGE_UNITS = {'d': 1, 'w': 7}
+
+
+def parse_age(value):
+    """Parse an age such as ``90d``, ``12w`` or ``90`` (days) into a timedelta"""
+    match = re.fullmatch(r'(\d+)([dw]?)', (value or '').strip().lower())
+    if not match:
+        raise ValueError(f'Invalid age {value!r}; use e.g. 90d or 12w')
+    return timedelta(days=int(match.group(1)) * AGE_UNITS.get(match.group(2) or 'd'))
+
+
+def _copy_columns(table):
+    # Generated columns are recomputed by the archive table itself
+    return [column.name for column in table.columns if column.computed is None]
+
+
+def _candidate_ids(connection, cutoff, after_id, limit):
+    """Ids above ``after_id`` of up to ``limit`` completed tasks last updated before ``cutoff``
+
+    Walks the table in id order, so each batch deletes neighbouring rows
+    and touches far fewer index pages than picking by age would. Archived
+    rows keep their ids, which is safe because ``tasks`` and ``comments``
+    never hand out an id twice (AUTOINCREMENT on SQLite).
+    """
+    return connection.execute(
+        select(tasks_table.c.id)
+        .where(
+            tasks_table.c.id > after_id,
+            tasks_table.c.status == 'Completed',
+            tasks_table.c.updated_at < cutoff,
+        )
+        .order_by(tasks_table.c.id)
+        .limit(limit)
+    ).scalars().all()
+
+
+def _archive_batch(connection, ids, archived_at):
+    """Move the tasks ``ids`` and their comments to the archive tables
+
+    Runs as Core statements, so it writes the delta-sync tombstones itself
+    instead of relying on the ORM flush hook. Deleting from ``tasks`` lets
+    the triggers take the rows out of task_counters, the data versions
+    and the full-text index.
+    """
+    task_columns = _copy_columns(tasks_table)
+    comment_columns = _copy_columns(comments_table)
+    seq = next_change_seq(connection)
+
+    connection.execute(archived_tasks_table.insert().from_select(
+        task_columns + ['archived_at'],
+        select(*(tasks_table.c[name] for name in task_columns), literal(archived_at))
+        .where(tasks_table.c.id.in_(ids))
+    ))
+    comments = connection.execute(archived_comments_table.insert().from_select(
+        comment_columns,
+        select(*(comments_table.c[name] for name in comment_columns))
+        .where(comments_table.c.task_id.in_(ids))
+    )).rowcount
+    write_tombstones(connection, select(tasks_table).where(tasks_table.c.id.in_(ids)), seq)
+    connection.execute(comments_table.delete().where(comments_table.c.task_id.in_(ids)))
+    connection.execute(tasks_table.delete().where(tasks_table.c.id.in_(ids)))
+    return comments
+
+
+def archive_tasks(older_than, batch_size=ARCHIVE_BATCH_SIZE, progress=None):
+    """Move completed tasks not updated for ``older_than`` to the archive
+
+    Works in batches of ``batch_size`` tasks, one transaction each, so
+    locks are held briefly and an interrupted run keeps the batches it
+    finished. ``progress(tasks, comments)`` is called with running totals
+    after every batch. Returns (tasks archived, comments archived).
+    """
+    cutoff = datetime.utcnow() - older_than
+    archived = comments = last_id = 0
+    while True:
+        with db.engine.begin() as connection:
+            ids = _candidate_ids(connection, cutoff, last_id, batch_size)
+            if not ids:
+                break
+            comments += _archive_batch(connection, ids, datetime.utcnow())
+            archived += len(ids)
+            last_id = ids[-1]
+        if progress:
+            progress(archived, comments)
+    return archived, comments
+
+
+def count_archived_tasks(query):
+    """COUNT(*) of an archive query built with ``scoped_task_query``"""
+    return query.with_entities(func.count(ArchivedTask.id)).scalar()
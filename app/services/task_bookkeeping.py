@@ -0,0 +1,125 @@
+from app import db
+
+# task_counters and the tasks:<assignee id> data versions are maintained by
+# these triggers on tasks, so every write, ORM flush or Core statement,
+# updates them in the statement that changes the task row
+TRIGGERS = ('tasks_bookkeeping_ai', 'tasks_bookkeeping_ad', 'tasks_bookkeeping_au')
+
+SQLITE_TRIGGERS = (
+    """CREATE TRIGGER tasks_bookkeeping_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (coalesce(new.assigned_to, 0), new.status, new.priority, 1)
+        ON CONFLICT (assignee_id, status, priority) DO UPDATE SET task_count = task_count + 1;
+        INSERT INTO data_versions (scope, version) VALUES ('tasks:' || coalesce(new.assigned_to, 0), 1)
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    END""",
+    """CREATE TRIGGER tasks_bookkeeping_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (coalesce(old.assigned_to, 0), old.status, old.priority, -1)
+        ON CONFLICT (assignee_id, status, priority) DO UPDATE SET task_count = task_count - 1;
+        INSERT INTO data_versions (scope, version) VALUES ('tasks:' || coalesce(old.assigned_to, 0), 1)
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    END""",
+    # Both counter keys, and both assignee scopes when reassigned, in key order
+    """CREATE TRIGGER tasks_bookkeeping_au AFTER UPDATE ON tasks BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        SELECT coalesce(old.assigned_to, 0), old.status, old.priority, -1
+        WHERE old.assigned_to IS NOT new.assigned_to OR old.status != new.status OR old.priority != new.priority
+        UNION ALL
+        SELECT coalesce(new.assigned_to, 0), new.status, new.priority, 1
+        WHERE old.assigned_to IS NOT new.assigned_to OR old.status != new.status OR old.priority != new.priority
+        ORDER BY 1, 2, 3
+        ON CONFLICT (assignee_id, status, priority) DO UPDATE SET task_count = task_count + excluded.task_count;
+        INSERT INTO data_versions (scope, version)
+        SELECT 'tasks:' || coalesce(old.assigned_to, 0), 1
+        UNION
+        SELECT 'tasks:' || coalesce(new.assigned_to, 0), 1
+        ORDER BY 1
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    END""",
+)
+
+MYSQL_TRIGGERS = (
+    """CREATE TRIGGER tasks_bookkeeping_ai AFTER INSERT ON tasks FOR EACH ROW BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (COALESCE(NEW.assigned_to, 0), NEW.status, NEW.priority, 1)
+        ON DUPLICATE KEY UPDATE task_count = task_count + 1;
+        INSERT INTO data_versions (scope, version) VALUES (CONCAT('tasks:', COALESCE(NEW.assigned_to, 0)), 1)
+        ON DUPLICATE KEY UPDATE version = version + 1;
+    END""",
+    """CREATE TRIGGER tasks_bookkeeping_ad AFTER DELETE ON tasks FOR EACH ROW BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (COALESCE(OLD.assigned_to, 0), OLD.status, OLD.priority, -1)
+        ON DUPLICATE KEY UPDATE task_count = task_count - 1;
+        INSERT INTO data_versions (scope, version) VALUES (CONCAT('tasks:', COALESCE(OLD.assigned_to, 0)), 1)
+        ON DUPLICATE KEY UPDATE version = version + 1;
+    END""",
+    """CREATE TRIGGER tasks_bookkeeping_au AFTER UPDATE ON tasks FOR EACH ROW BEGIN
+        IF NOT (OLD.assigned_to <=> NEW.assigned_to) OR OLD.status <> NEW.status OR OLD.priority <> NEW.priority THEN
+            INSERT INTO task_counters (assignee_id, status, priority, task_count)
+            SELECT * FROM (
+                SELECT COALESCE(OLD.assigned_to, 0) AS assignee_id, OLD.status AS status,
+                       OLD.priority AS priority, -1 AS task_count
+                UNION ALL
+                SELECT COALESCE(NEW.assigned_to, 0), NEW.status, NEW.priority, 1
+            ) AS changed
+            ORDER BY assignee_id, status, priority
+            ON DUPLICATE KEY UPDATE task_count = task_counters.task_count + VALUES(task_count);
+        END IF;
+        INSERT INTO data_versions (scope, version)
+        SELECT scope, 1 FROM (
+            SELECT CONCAT('tasks:', COALESCE(OLD.assigned_to, 0)) AS scope
+            UNION
+            SELECT CONCAT('tasks:', COALESCE(NEW.assigned_to, 0))
+        ) AS touched
+        ORDER BY scope
+        ON DUPLICATE KEY UPDATE version = data_versions.version + 1;
+    END""",
+)
+
+DIALECT_TRIGGERS = {'sqlite': SQLITE_TRIGGERS, 'mysql': MYSQL_TRIGGERS}
+
+
+def bookkeeping_triggers_exist(connection):
+    """True when every bookkeeping trigger is in place"""
+    if connection.dialect.name == 'sqlite':
+        found = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").scalars()
+    elif connection.dialect.name == 'mysql':
+        found = connection.exec_driver_sql('SHOW TRIGGERS').scalars()
+    else:
+        return False
+    return set(TRIGGERS) <= set(found)
+
+
+def create_bookkeeping_triggers(connection):
+    """Create the triggers that keep task_counters and the task data versions current
+
+    Each task row written is followed by its counter rows and then its
+    version rows, both in key order, so single-row writes always lock
+    them in the same order. Only SQLite and MySQL are supported.
+    """
+    dialect = connection.dialect.name
+    if dialect not in DIALECT_TRIGGERS:
+        raise NotImplementedError(f'No task bookkeeping triggers for the {dialect} dialect')
+    drop_bookkeeping_triggers(connection)
+    for statement in DIALECT_TRIGGERS[dialect]:
+        connection.exec_driver_sql(statement)
+
+
+def drop_bookkeeping_triggers(connection):
+    """Drop the bookkeeping triggers; returns True when they were in place
+
+    Bulk loads drop them, then rebuild task_counters, bump the versions
+    and put them back with ``create_bookkeeping_triggers``.
+    """
+    existed = bookkeeping_triggers_exist(connection)
+    for name in TRIGGERS:
+        connection.exec_driver_sql(f'DROP TRIGGER IF EXISTS {name}')
+    return existed
+
+
+def ensure_bookkeeping_triggers():
+    """Create the triggers for databases built with ``db.create_all()``"""
+    with db.engine.begin() as connection:
+        if not bookkeeping_triggers_exist(connection):
+            create_bookkeeping_triggers(connection)
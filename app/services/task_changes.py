@@ -0,0 +1,218 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, exists, func, insert, literal, select, true
+
+from app import db
+from app.models.task import Task
+from app.models.task_change import TaskChange
+from app.models.task_counter import TaskCounter
+from app.models.task_tombstone import TaskTombstone
+from app.services.data_versions import raise_version, read_versions
+from app.services.task_counters import committed_counter_key, current_counter_key
+from app.services.task_queries import scope_assignee, scoped_task_query
+
+tombstones_table = TaskTombstone.__table__
+changes_table = TaskChange.__table__
+
+# data_versions row holding the highest sequence number whose tombstones
+# have been pruned
+PRUNED_SEQ_SCOPE = 'task_changes:pruned'
+
+# Beyond this many changed tasks (or removed ids) a client is told to reload
+MAX_CHANGES = 500
+
+# How long a missing sequence number may hold readers back before it is
+# taken to belong to a rolled-back write; writes that stamp tasks must
+# commit within this
+CHANGE_SEQ_GRACE = timedelta(seconds=10)
+
+
+def next_change_seq(connection):
+    """Take a new change sequence number on ``connection`` and return it
+
+    An insert into task_changes: concurrent writes each get their own row
+    and never wait for one another. Numbers therefore commit out of order,
+    and a rolled-back write leaves a gap on MySQL; ``committed_change_seq``
+    is what readers may rely on.
+
+    Take it before writing task rows; the triggers on ``tasks`` then lock
+    each row's counters and data versions right after the row itself (see
+    app.services.task_bookkeeping).
+    """
+    return connection.execute(changes_table.insert().values(created_at=datetime.utcnow())).inserted_primary_key[0]
+
+
+def committed_change_seq():
+    """The highest sequence number N such that every write numbered N or below is visible
+
+    A missing number is either a write still in flight or one that rolled
+    back. Until CHANGE_SEQ_GRACE has passed since it was handed out it
+    holds the result back; after that it is taken to have rolled back.
+    Numbers are expected to come one apart (auto_increment_increment = 1
+    on MySQL); otherwise every number waits out the grace period.
+    """
+    cutoff = datetime.utcnow() - CHANGE_SEQ_GRACE
+    # The newest number old enough that nothing before it can still be in flight
+    settled = func.coalesce(
+        select(changes_table.c.id).where(changes_table.c.created_at < cutoff)
+        .order_by(changes_table.c.created_at.desc()).limit(1).scalar_subquery(),
+        0,
+    )
+    later = changes_table.alias('later')
+    following = changes_table.alias('following')
+    # The first number after the settled one, and the first one after that
+    # whose successor is missing
+    first = select(func.min(later.c.id)).where(later.c.id > settled).scalar_subquery()
+    last = (
+        select(func.min(later.c.id))
+        .where(later.c.id > settled, ~exists().where(following.c.id == later.c.id + 1))
+        .scalar_subquery()
+    )
+    settled, first, last = db.session.execute(select(settled, first, last)).one()
+    if first is None or first > settled + 1:
+        return settled
+    return last
+
+
+def _tombstone(task_id, assignee_id, deleted, seq, now):
+    return {'task_id': task_id, 'assignee_id': assignee_id, 'deleted': deleted, 'change_seq': seq, 'created_at': now}
+
+
+def _record_task_changes(session, flush_context, instances):
+    """before_flush hook stamping changed tasks and writing tombstones
+
+    Every task inserted or updated by the flush gets the same new
+    ``change_seq``. Deleted tasks leave a tombstone for their assignee,
+    and a reassigned task leaves one for the assignee it left.
+    """
+    changed = [obj for obj in session.new if isinstance(obj, Task)]
+    changed += [obj for obj in session.dirty if isinstance(obj, Task) and session.is_modified(obj)]
+    deleted = [obj for obj in session.deleted if isinstance(obj, Task)]
+    if not changed and not deleted:
+        return
+
+    connection = session.connection()
+    seq = next_change_seq(connection)
+    now = datetime.utcnow()
+    tombstones = [_tombstone(task.id, committed_counter_key(task)[0], True, seq, now) for task in deleted]
+    for task in changed:
+        task.change_seq = seq
+        if task not in session.new:
+            previous = committed_counter_key(task)[0]
+            if previous != current_counter_key(task)[0]:
+                tombstones.append(_tombstone(task.id, previous, False, seq, now))
+    if tombstones:
+        connection.execute(insert(tombstones_table), tombstones)
+
+
+def register_change_events():
+    """Keep ``Task.change_seq`` and task_tombstones in step with every ORM flush
+
+    Inserted ahead of the data version hook, so a flush takes its number
+    first like the Core task writes do.
+    """
+    if not event.contains(db.session, 'before_flush', _record_task_changes):
+        event.listen(db.session, 'before_flush', _record_task_changes, insert=True)
+
+
+def write_tombstones(connection, select_tasks, seq):
+    """Tombstone (as deleted) every task selected by ``select_tasks``, a Core select of tasks
+
+    For Core deletes that bypass the ORM hook, such as archiving.
+    """
+    tasks = select_tasks.subquery()
+    connection.execute(tombstones_table.insert().from_select(
+        ['task_id', 'assignee_id', 'deleted', 'change_seq', 'created_at'],
+        select(
+            tasks.c.id, func.coalesce(tasks.c.assigned_to, TaskCounter.UNASSIGNED),
+            true(), literal(seq), literal(datetime.utcnow())
+        )
+    ))
+
+
+def expire_change_tokens(connection):
+    """Make every token handed out so far answer ``reset``
+
+    For bulk deletes that write no tombstones.
+    """
+    raise_version(connection, PRUNED_SEQ_SCOPE, next_change_seq(connection))
+
+
+def current_change_token():
+    """The token a client starting from the current data should sync from"""
+    return str(committed_change_seq())
+
+
+def task_changes(user, since, assigned_to=None):
+    """Tasks changed and ids removed in the viewer's scope since token ``since``
+
+    Returns a dict with ``next_since`` (the token to send next time),
+    ``reset`` and, unless ``reset`` is set, ``tasks`` (ORM rows in change
+    order) and ``deleted`` (task ids). ``reset`` means the client must
+    reload its list instead: no or an unknown token, tombstones pruned past
+    it, or more than MAX_CHANGES changes.
+    """
+    current = committed_change_seq()
+    pruned, = read_versions([PRUNED_SEQ_SCOPE])
+    result = {'next_since': str(current), 'reset': True, 'tasks': [], 'deleted': []}
+    if since is None or not since.isdigit():
+        return result
+    since = int(since)
+    if since < pruned or since > current:
+        return result
+    if since == current:
+        result['reset'] = False
+        return result
+
+    tasks = (
+        scoped_task_query(user, assigned_to)
+        .filter(Task.change_seq > since, Task.change_seq <= current)
+        .order_by(Task.change_seq, Task.id)
+        .limit(MAX_CHANGES + 1)
+        .all()
+    )
+    removed = db.session.query(TaskTombstone.task_id).filter(
+        TaskTombstone.change_seq > since, TaskTombstone.change_seq <= current
+    )
+    scope = scope_assignee(user, assigned_to)
+    if scope is None:
+        # The unfiltered admin list only loses tasks that left the table
+        removed = removed.filter(TaskTombstone.deleted == true())
+    else:
+        removed = removed.filter(TaskTombstone.assignee_id == scope)
+    removed = [task_id for task_id, in removed.order_by(TaskTombstone.change_seq).limit(MAX_CHANGES + 1)]
+    if len(tasks) > MAX_CHANGES or len(removed) > MAX_CHANGES:
+        return result
+
+    # A task removed and then re-added (reassigned back) is live again
+    live = {task.id for task in tasks}
+    result.update(reset=False, tasks=tasks, deleted=list(dict.fromkeys(i for i in removed if i not in live)))
+    return result
+
+
+def prune_tombstones(older_than):
+    """Delete tombstones and change log rows older than ``older_than``; returns the tombstones removed
+
+    Records the highest pruned sequence number so clients holding an
+    older token are told to reset rather than silently missing removals.
+    """
+    cutoff = datetime.utcnow() - older_than
+    with db.engine.begin() as connection:
+        # committed_change_seq counts on from the newest old row, so keep it
+        newest = connection.execute(
+            select(changes_table.c.id).where(changes_table.c.created_at < cutoff)
+            .order_by(changes_table.c.created_at.desc()).limit(1)
+        ).scalar()
+        if newest is not None:
+            connection.execute(changes_table.delete().where(changes_table.c.id < newest))
+
+        highest = connection.execute(
+            select(func.max(tombstones_table.c.change_seq)).where(tombstones_table.c.created_at < cutoff)
+        ).scalar()
+        if highest is None:
+            return 0
+        removed = connection.execute(
+            tombstones_table.delete().where(tombstones_table.c.change_seq <= highest)
+        ).rowcount
+        raise_version(connection, PRUNED_SEQ_SCOPE, highest)
+    return removed
@@ -0,0 +1,81 @@
+from sqlalchemy import func, inspect, insert, select
+
+from app import db
+from app.models.task import Task
+from app.models.task_counter import TaskCounter
+
+counters_table = TaskCounter.__table__
+
+
+def counter_key(assigned_to, status, priority):
+    """Normalize task fields into a task_counters key"""
+    assignee_id = int(assigned_to) if assigned_to else TaskCounter.UNASSIGNED
+    return (assignee_id, status or 'Pending', priority or 'Medium')
+
+
+def _committed_value(task, attr):
+    history = inspect(task).attrs[attr].load_history()
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(task, attr)
+
+
+def committed_counter_key(task):
+    return counter_key(*(_committed_value(task, attr) for attr in ('assigned_to', 'status', 'priority')))
+
+
+def current_counter_key(task):
+    return counter_key(task.assigned_to, task.status, task.priority)
+
+
+def expected_counters():
+    """Counters as they should be, computed from the tasks table"""
+    assignee = func.coalesce(Task.assigned_to, TaskCounter.UNASSIGNED)
+    rows = (
+        db.session.query(assignee, Task.status, Task.priority, func.count(Task.id))
+        .group_by(assignee, Task.status, Task.priority)
+    )
+    return {(assignee_id, status, priority): count for assignee_id, status, priority, count in rows}
+
+
+def stored_counters():
+    """Non-zero counters currently stored in task_counters"""
+    rows = db.session.query(
+        TaskCounter.assignee_id, TaskCounter.status, TaskCounter.priority, TaskCounter.task_count
+    ).filter(TaskCounter.task_count != 0)
+    return {(assignee_id, status, priority): count for assignee_id, status, priority, count in rows}
+
+
+def find_counter_drift():
+    """Return {key: (stored, expected)} for every counter that is out of step"""
+    expected = expected_counters()
+    stored = stored_counters()
+    return {
+        key: (stored.get(key, 0), expected.get(key, 0))
+        for key in set(expected) | set(stored)
+        if stored.get(key, 0) != expected.get(key, 0)
+    }
+
+
+def rebuild_counters():
+    """Recompute task_counters from scratch in a single transaction"""
+    assignee = func.coalesce(Task.assigned_to, TaskCounter.UNASSIGNED)
+    source = (
+        select(assignee, Task.status, Task.priority, func.count(Task.id))
+        .group_by(assignee, Task.status, Task.priority)
+    )
+    db.session.execute(counters_table.delete())
+    db.session.execute(
+        insert(counters_table).from_select(
+            ['assignee_id', 'status', 'priority', 'task_count'], source
+        )
+    )
+    db.session.commit()
+
+
+def ensure_counters_seeded():
+    """Build task_counters on first start against a database that already has tasks"""
+    if db.session.query(TaskCounter.id).first() is None and db.session.query(Task.id).first() is not None:
+        rebuild_counters()
@@ -0,0 +1,145 @@
+import csv
+import json
+from itertools import groupby
+
+from sqlalchemy.orm import aliased
+
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.user import User
+from app.services.task_queries import scoped_task_query
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+EXPORT_BATCH_SIZE = 1000
+
+TASK_FIELDS = (
+    'id', 'title', 'description', 'assigned_to', 'assigned_to_name', 'priority', 'status',
+    'start_date', 'due_date', 'created_by', 'created_by_name', 'created_at', 'updated_at', 'is_overdue'
+)
+COMMENT_FIELDS = ('comment_id', 'comment_user_id', 'comment_user_name', 'comment_text', 'comment_created_at')
+
+
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def _export_rows(user, assigned_to, include_comments):
+    """Stream (task dict, [comment dicts]) pairs in task id order
+
+    Assignee, creator and (optionally) comment author names are joined
+    into the same statement, and rows are fetched through a server-side
+    cursor in batches of EXPORT_BATCH_SIZE, so memory use does not grow
+    with the table.
+    """
+    assignee = aliased(User)
+    creator = aliased(User)
+    columns = [
+        Task.id, Task.title, Task.description, Task.assigned_to,
+        assignee.name.label('assigned_to_name'), Task.priority, Task.status,
+        Task.start_date, Task.due_date, Task.created_by,
+        creator.name.label('created_by_name'), Task.created_at, Task.updated_at, Task.is_overdue
+    ]
+    query = scoped_task_query(user, assigned_to).with_entities(*columns)
+    query = query.outerjoin(assignee, assignee.id == Task.assigned_to)
+    query = query.outerjoin(creator, creator.id == Task.created_by)
+    order = [Task.id]
+    if include_comments:
+        author = aliased(User)
+        query = query.add_columns(
+            Comment.id.label('comment_id'), Comment.user_id.label('comment_user_id'),
+            author.name.label('comment_user_name'), Comment.comment_text.label('comment_text'),
+            Comment.created_at.label('comment_created_at')
+        )
+        query = query.outerjoin(Comment, Comment.task_id == Task.id)
+        query = query.outerjoin(author, author.id == Comment.user_id)
+        order.append(Comment.id)
+    rows = query.order_by(*order).yield_per(EXPORT_BATCH_SIZE)
+
+    for _, task_rows in groupby(rows, key=lambda row: row.id):
+        task_rows = list(task_rows)
+        row = task_rows[0]
+        task = {
+            'id': row.id,
+            'title': row.title,
+            'description': row.description,
+            'assigned_to': row.assigned_to,
+            'assigned_to_name': row.assigned_to_name,
+            'priority': row.priority,
+            'status': row.status,
+            'start_date': _iso(row.start_date),
+            'due_date': _iso(row.due_date),
+            'created_by': row.created_by,
+            'created_by_name': row.created_by_name,
+            'created_at': _iso(row.created_at),
+            'updated_at': _iso(row.updated_at),
+            'is_overdue': row.is_overdue
+        }
+        comments = []
+        if include_comments:
+            comments = [
+                {
+                    'comment_id': comment.comment_id,
+                    'comment_user_id': comment.comment_user_id,
+                    'comment_user_name': comment.comment_user_name,
+                    'comment_text': comment.comment_text,
+                    'comment_created_at': _iso(comment.comment_created_at)
+                }
+                for comment in task_rows if comment.comment_id is not None
+            ]
+        yield task, comments
+
+
+class _LineBuffer:
+    """File-like object whose write() hands the line straight back to csv.writer's caller"""
+
+    def write(self, value):
+        return value
+
+
+def _chunked(lines, size=EXPORT_BATCH_SIZE):
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def _csv_lines(rows, include_comments):
+    writer = csv.writer(_LineBuffer())
+    header = TASK_FIELDS + (COMMENT_FIELDS if include_comments else ())
+    yield writer.writerow(header)
+    for task, comments in rows:
+        task_values = [task[field] for field in TASK_FIELDS]
+        if not include_comments:
+            yield writer.writerow(task_values)
+            continue
+        # One line per comment; tasks without comments get a single line
+        for comment in comments or [dict.fromkeys(COMMENT_FIELDS)]:
+            yield writer.writerow(task_values + [comment[field] for field in COMMENT_FIELDS])
+
+
+def _ndjson_lines(rows, include_comments):
+    for task, comments in rows:
+        if include_comments:
+            task['comments'] = [
+                {
+                    'id': comment['comment_id'],
+                    'user_id': comment['comment_user_id'],
+                    'user_name': comment['comment_user_name'],
+                    'comment_text': comment['comment_text'],
+                    'created_at': comment['comment_created_at']
+                }
+                for comment in comments
+            ]
+        yield json.dumps(task) + '\n'
+
+
+def export_tasks(export_format, user, assigned_to=None, include_comments=False):
+    """Return a generator of text chunks for a CSV or NDJSON task export"""
+    rows = _export_rows(user, assigned_to, include_comments)
+    if export_format == 'csv':
+        return _chunked(_csv_lines(rows, include_comments))
+    return _chunked(_ndjson_lines(rows, include_comments))
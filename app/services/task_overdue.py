@@ -0,0 +1,107 @@
+import threading
+from datetime import date, timedelta
+
+from flask import request
+from sqlalchemy import and_, event, false, or_, true
+
+from app import db
+from app.models.task import Task
+from app.services.task_changes import expire_change_tokens, next_change_seq
+
+tasks_table = Task.__table__
+
+# How far back a worker's first in-process rollover looks; older flags can
+# only be wrong if a scheduled job was missed for longer than this
+ROLLOVER_CATCH_UP_DAYS = 7
+
+
+def overdue_on(due_date, status, today):
+    """Whether a task with ``due_date`` and ``status`` is overdue on ``today``"""
+    return bool(due_date and status != 'Completed' and due_date < today)
+
+
+def _set_overdue_flag(mapper, connection, task):
+    task.is_overdue = overdue_on(task.due_date, task.status, date.today())
+
+
+def register_overdue_events():
+    """Recompute ``Task.is_overdue`` whenever the ORM inserts or updates a task"""
+    for name in ('before_insert', 'before_update'):
+        if not event.contains(Task, name, _set_overdue_flag):
+            event.listen(Task, name, _set_overdue_flag)
+
+
+def _stale_flags(today, since=None):
+    """[(condition, new value)] selecting tasks whose stored flag is wrong on ``today``
+
+    Dates only move forward, so between runs tasks can only become overdue;
+    with ``since`` (the previous run's date) just the due dates passed since
+    then are considered. Without it the whole table is reconciled in both
+    directions, which also repairs flags written behind the ORM's back.
+    """
+    c = tasks_table.c
+    newly_overdue = and_(c.is_overdue == false(), c.status != 'Completed', c.due_date < today)
+    if since is not None:
+        # due_date_missing leads ix_tasks_due_date; naming it makes this a range scan
+        return [(and_(newly_overdue, c.due_date_missing == false(), c.due_date >= since), True)]
+    no_longer_overdue = and_(
+        c.is_overdue == true(),
+        or_(c.status == 'Completed', c.due_date.is_(None), c.due_date >= today)
+    )
+    return [(newly_overdue, True), (no_longer_overdue, False)]
+
+
+def roll_over_overdue(today=None, since=None):
+    """Bring ``tasks.is_overdue`` up to date for ``today``; returns rows changed
+
+    Runs in one transaction on its own connection. Changed tasks get a new
+    change_seq for delta sync, and the triggers bump the data versions of
+    their assignees, so cached lists and stats refresh. A whole-table run
+    can outlast CHANGE_SEQ_GRACE, so it also expires delta-sync tokens.
+    """
+    today = today or date.today()
+    changed = 0
+    with db.engine.begin() as connection:
+        seq = next_change_seq(connection)
+        for condition, overdue in _stale_flags(today, since):
+            changed += connection.execute(
+                tasks_table.update().where(condition).values(is_overdue=overdue, change_seq=seq)
+            ).rowcount
+        if since is None and changed:
+            expire_change_tokens(connection)
+    return changed
+
+
+def init_overdue_rollover(app):
+    """Run the rollover in-process once a day, after an API write has responded
+
+    Writes keep the flag current, so only due dates that passed since the
+    previous run need flipping: ROLLOVER_CATCH_UP_DAYS on a worker's first
+    run, then one day at a time, each an index range scan over those due
+    dates. The run is attached to the first API write of the day and starts
+    once that response has been sent, so it holds the worker, not the
+    caller. Reads and pages never start it and show yesterday's flags until
+    a write comes in. Deployments that schedule ``flask overdue rollover``
+    shortly after midnight can turn this off with OVERDUE_AUTO_ROLLOVER=false.
+    """
+    if not app.config.get('OVERDUE_AUTO_ROLLOVER', True):
+        return
+    state = {'last_run': None}
+    lock = threading.Lock()
+
+    def run_rollover():
+        today = date.today()
+        with lock:
+            if state['last_run'] != today:
+                with app.app_context():
+                    since = state['last_run'] or today - timedelta(days=ROLLOVER_CATCH_UP_DAYS)
+                    roll_over_overdue(today, since=since)
+                state['last_run'] = today
+
+    @app.after_request
+    def roll_over_overdue_daily(response):
+        if (state['last_run'] != date.today()
+                and request.method not in ('GET', 'HEAD', 'OPTIONS')
+                and request.path.startswith('/api/')):
+            response.call_on_close(run_rollover)
+        return response
@@ -0,0 +1,275 @@
+import base64
+import heapq
+import json
+from datetime import date, datetime
+from functools import cmp_to_key
+
+from sqlalchemy import and_, or_, select, true
+
+from app.models.task import Task
+from app.models.task_counter import TaskCounter
+from app.models.user import User
+
+SORT_FIELDS = ('created_at', 'due_date', 'status')
+
+# Task list rows hold the serialized fields in output order (archived rows
+# add archived_at), then the generated sort keys that cursors and merged
+# pages compare on
+ROW_FIELDS = (
+    'id', 'title', 'description', 'assigned_to', 'assigned_to_name', 'priority', 'status',
+    'start_date', 'due_date', 'created_by', 'created_by_name', 'created_at', 'updated_at', 'is_overdue',
+    'version',
+)
+ARCHIVE_ROW_FIELDS = ROW_FIELDS + ('archived_at',)
+ROW_SORT_FIELDS = ('status_rank', 'due_date_missing')
+
+# Built once: creating ORM aliases per query costs more than a small page's rows
+_assignees = User.__table__.alias('assignee')
+_creators = User.__table__.alias('creator')
+_ROW_NAMES = {
+    'assigned_to_name': _assignees.c.name.label('assigned_to_name'),
+    'created_by_name': _creators.c.name.label('created_by_name'),
+}
+
+
+def scoped_task_query(user, assigned_to=None, overdue=False, model=Task):
+    """Task query limited to what ``user`` may see
+
+    Developers only see tasks assigned to them. Admins see everything and
+    may narrow it with ``assigned_to`` (a user id string or 'unassigned').
+    ``overdue`` keeps only overdue tasks, read from the indexed flag.
+    ``model`` may be ``ArchivedTask`` to query the archive instead.
+    """
+    query = model.query
+    if overdue:
+        query = query.filter(model.is_overdue == true())
+    if user.role != 'admin':
+        return query.filter_by(assigned_to=user.id)
+    if assigned_to:
+        if assigned_to == 'unassigned':
+            query = query.filter(model.assigned_to.is_(None))
+        elif assigned_to.isdigit():
+            query = query.filter(model.assigned_to == int(assigned_to))
+    return query
+
+
+def task_row_query(query, model=Task):
+    """Reshape a ``scoped_task_query`` into a read-only query of plain rows
+
+    Selects only the ``ROW_FIELDS`` columns (``ARCHIVE_ROW_FIELDS`` for the
+    archive) and ``ROW_SORT_FIELDS``, with the assignee and creator names
+    joined in. Results are ``Row`` tuples with attribute access, so
+    nothing enters the identity map or gets change tracking, and
+    serializing needs no name lookup. Filters, sorting and cursors apply
+    to it as to the original query.
+    """
+    fields = ARCHIVE_ROW_FIELDS if hasattr(model, 'archived_at') else ROW_FIELDS
+    columns = [
+        _ROW_NAMES[name] if name in _ROW_NAMES else getattr(model, name) for name in fields + ROW_SORT_FIELDS
+    ]
+    return (
+        query.with_entities(*columns)
+        .outerjoin(_assignees, _assignees.c.id == model.assigned_to)
+        .outerjoin(_creators, _creators.c.id == model.created_by)
+    )
+
+
+def returned_task_fields():
+    """``ROW_FIELDS`` and ``ROW_SORT_FIELDS`` for ``UPDATE tasks ... RETURNING``
+
+    RETURNING cannot join, so the names are scalar subqueries; rows
+    serialize like ``task_row_query`` rows.
+    """
+    tasks, users = Task.__table__, User.__table__.alias('named')
+    user_ids = {'assigned_to_name': tasks.c.assigned_to, 'created_by_name': tasks.c.created_by}
+    return [
+        select(users.c.name).where(users.c.id == user_ids[name]).scalar_subquery().label(name)
+        if name in user_ids else tasks.c[name]
+        for name in ROW_FIELDS + ROW_SORT_FIELDS
+    ]
+
+
+def scope_assignee(user, assigned_to=None):
+    """The task_counters assignee id matching ``scoped_task_query``'s scope
+
+    Returns None when the scope is every task.
+    """
+    if user.role != 'admin':
+        return user.id
+    if assigned_to == 'unassigned':
+        return TaskCounter.UNASSIGNED
+    if assigned_to and assigned_to.isdigit():
+        return int(assigned_to)
+    return None
+
+
+def sort_keys(sort_by, sort_dir, model=Task):
+    """Return the list ordering as [(column, descending), ...]
+
+    Every ordering ends with ``id`` so it is total, and each one matches
+    an index declared on ``Task`` (and mirrored on ``ArchivedTask``):
+
+    * ``due_date`` keeps tasks without a due date last in both directions.
+    * ``status`` orders by workflow stage, most recently updated first.
+    * anything else orders by ``created_at``.
+    """
+    descending = sort_dir == 'desc'
+    if sort_by == 'due_date':
+        return [(model.due_date_missing, False), (model.due_date, descending), (model.id, descending)]
+    if sort_by == 'status':
+        return [(model.status_rank, descending), (model.updated_at, True), (model.id, True)]
+    return [(model.created_at, descending), (model.id, descending)]
+
+
+def order_by_clauses(keys):
+    return [column.desc() if descending else column.asc() for column, descending in keys]
+
+
+def apply_sort(query, sort_by, sort_dir, model=Task):
+    return query.order_by(*order_by_clauses(sort_keys(sort_by, sort_dir, model)))
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another ordering"""
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def pack_cursor(keys, row, **extra):
+    """Opaque cursor holding ``row``'s values for the ``keys`` columns"""
+    payload = dict(extra, k=[_encode_value(getattr(row, column.key)) for column, _ in keys])
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def unpack_cursor(keys, cursor, **expected):
+    """Return the key values stored by ``pack_cursor``
+
+    Raises InvalidCursor if the token is malformed or its ``extra`` fields
+    differ from ``expected``.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if any(payload.get(name) != value for name, value in expected.items()) or len(payload['k']) != len(keys):
+            raise InvalidCursor('Cursor does not match the requested sort order')
+        return [_decode_value(column, value) for (column, _), value in zip(keys, payload['k'])]
+    except InvalidCursor:
+        raise
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        raise InvalidCursor('Malformed cursor') from exc
+
+
+def encode_cursor(task, sort_by, sort_dir):
+    """Opaque cursor pointing just past ``task`` in the given ordering"""
+    return pack_cursor(sort_keys(sort_by, sort_dir), task, s=sort_by, d=sort_dir)
+
+
+def decode_cursor(cursor, sort_by, sort_dir):
+    """Return the sort-key values stored in ``cursor``"""
+    return unpack_cursor(sort_keys(sort_by, sort_dir), cursor, s=sort_by, d=sort_dir)
+
+
+def _equals(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _beyond(column, value, descending):
+    """Condition for ``column`` sorting strictly after ``value``, or None if nothing can"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        # SQL booleans only support equality; False sorts before True
+        return None if value != descending else column == (not value)
+    return column < value if descending else column > value
+
+
+def keyset_filter(keys, values):
+    """Filter selecting rows strictly after ``values`` in the ``keys`` ordering
+
+    Expands to ``(k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...`` with ``<`` for
+    descending columns. A NULL value contributes no "after" branch: NULL
+    due dates only occur inside the ``due_date_missing`` group, where the
+    ``id`` tie-break decides the order.
+    """
+    branches = []
+    for index, ((column, descending), value) in enumerate(zip(keys, values)):
+        beyond = _beyond(column, value, descending)
+        if beyond is None:
+            continue
+        prefix = [_equals(col, val) for (col, _), val in zip(keys[:index], values[:index])]
+        branches.append(and_(*prefix, beyond))
+    return or_(*branches)
+
+
+def apply_cursor(query, sort_by, sort_dir, cursor, model=Task):
+    """Order ``query`` and, when ``cursor`` is given, start it after that cursor"""
+    keys = sort_keys(sort_by, sort_dir, model)
+    if cursor:
+        query = query.filter(keyset_filter(keys, decode_cursor(cursor, sort_by, sort_dir)))
+    return query.order_by(*order_by_clauses(keys))
+
+
+def _compare_rows(keys):
+    """cmp function ordering loaded rows exactly as ``order_by_clauses(keys)`` does"""
+    def compare(a, b):
+        for column, descending in keys:
+            x, y = getattr(a, column.key), getattr(b, column.key)
+            # NULL due dates only meet inside the due_date_missing group
+            if x == y or x is None or y is None:
+                continue
+            result = -1 if x < y else 1
+            return -result if descending else result
+        return 0
+    return compare
+
+
+def merged_page(sources, sort_by, sort_dir, limit, cursor=None, offset=0):
+    """Rows ``offset`` to ``offset + limit`` of several task tables in one ordering
+
+    ``sources`` is a list of (query, model) pairs, e.g. the live and the
+    archived tasks in the same scope. Each query is ordered (and started
+    after ``cursor``) on its own indexes and fetches at most
+    ``offset + limit`` rows, which are then merged in Python. The cost
+    grows with the page depth, not with the size of either table, and
+    ids are unique across the tables so cursors work across both.
+    """
+    fetched = [
+        apply_cursor(query, sort_by, sort_dir, cursor, model).limit(offset + limit).all()
+        for query, model in sources
+    ]
+    key = cmp_to_key(_compare_rows(sort_keys(sort_by, sort_dir)))
+    return list(heapq.merge(*fetched, key=key))[offset:offset + limit]
+
+
+def cursor_page(sources, sort_by, sort_dir, per_page, total_items, cursor=None):
+    """One keyset page of ``sources`` and the ``meta`` block the list endpoints return
+
+    ``total_items`` is counted by the caller, usually from task_counters.
+    Raises InvalidCursor for a malformed ``cursor``.
+    """
+    rows = merged_page(sources, sort_by, sort_dir, per_page + 1, cursor=cursor)
+    tasks, has_next = rows[:per_page], len(rows) > per_page
+    return tasks, {
+        'per_page': per_page,
+        'total_pages': max(1, -(-total_items // per_page)),
+        'total_items': total_items,
+        'has_next': has_next,
+        'has_prev': bool(cursor),
+        'next_cursor': encode_cursor(tasks[-1], sort_by, sort_dir) if has_next else None
+    }
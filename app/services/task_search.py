@@ -0,0 +1,229 @@
+import re
+
+from sqlalchemy import and_, column, func, inspect, literal_column, or_, select, table, text, union_all
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+from app import db
+from app.models.comment import Comment
+from app.models.task import Task
+from app.services.task_queries import scoped_task_query
+
+SEARCH_INDEX_NAME = 'ix_tasks_fulltext'
+COMMENT_SEARCH_INDEX_NAME = 'ix_comments_fulltext'
+FTS_TABLE = 'tasks_fts'
+COMMENT_FTS_TABLE = 'comments_fts'
+MAX_SEARCH_TERMS = 8
+
+fts_table = table(FTS_TABLE, column('rowid'))
+comment_fts_table = table(COMMENT_FTS_TABLE, column('rowid'))
+
+
+def _sqlite_fts_ddl(fts, source, columns):
+    """External-content FTS5 table over ``source(columns)``, kept in step by triggers
+
+    The triggers see every write, including Core bulk inserts and deletes.
+    """
+    names = ', '.join(columns)
+    new = ', '.join(f'new.{name}' for name in columns)
+    old = ', '.join(f'old.{name}' for name in columns)
+    return (
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{source}', content_rowid='id')",
+        f"""CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN
+        INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});
+    END""",
+        f"""CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN
+        INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old});
+    END""",
+        f"""CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {source} BEGIN
+        INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old});
+        INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});
+    END""",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    )
+
+
+def _sqlite_drop_fts_ddl(fts):
+    return (
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TABLE IF EXISTS {fts}",
+    )
+
+
+# One entry per indexed table: (table, SQLite FTS table, MySQL index, columns)
+SEARCH_INDEXES = (
+    ('tasks', FTS_TABLE, SEARCH_INDEX_NAME, ('title', 'description')),
+    ('comments', COMMENT_FTS_TABLE, COMMENT_SEARCH_INDEX_NAME, ('comment_text',)),
+)
+
+# Relevance is computed for at most this many of the newest matches in
+# task text, and as many in comments; see _matching_query
+SEARCH_CANDIDATES = 1000
+# A comment hit ranks below a hit in the task's own description
+COMMENT_WEIGHT = 0.5
+
+
+class InvalidSearch(ValueError):
+    """Raised for a query with nothing searchable in it"""
+
+
+def is_search_object(name):
+    """True for schema objects owned by the search indexes rather than the models"""
+    return any(name == index or name.startswith(fts) for _, fts, index, _ in SEARCH_INDEXES)
+
+
+def search_terms(q):
+    terms = re.findall(r'\w+', (q or '').lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise InvalidSearch('Search query must contain at least one word')
+    return terms
+
+
+def _index_exists(connection, source, fts, index):
+    if connection.dialect.name == 'sqlite':
+        return inspect(connection).has_table(fts)
+    if connection.dialect.name == 'mysql':
+        return any(found['name'] == index for found in inspect(connection).get_indexes(source))
+    return False
+
+
+def _missing_indexes(connection):
+    return [entry for entry in SEARCH_INDEXES if not _index_exists(connection, *entry[:3])]
+
+
+def search_index_exists(connection):
+    """True when every full-text index is in place"""
+    return connection.dialect.name in ('sqlite', 'mysql') and not _missing_indexes(connection)
+
+
+def create_search_index(connection):
+    """Create (and fill) the missing full-text indexes; a no-op without full-text support"""
+    dialect = connection.dialect.name
+    if dialect not in ('sqlite', 'mysql'):
+        return
+    for source, fts, index, columns in _missing_indexes(connection):
+        if dialect == 'sqlite':
+            ddl = _sqlite_fts_ddl(fts, source, columns)
+        else:
+            ddl = (f"CREATE FULLTEXT INDEX {index} ON {source} ({', '.join(columns)})",)
+        for statement in ddl:
+            connection.exec_driver_sql(statement)
+
+
+def drop_search_index(connection):
+    """Drop the full-text indexes present; returns True when any was dropped
+
+    Bulk loads drop them first, as the SQLite triggers otherwise index every
+    row as it is inserted, then put them back with ``create_search_index``.
+    """
+    dialect = connection.dialect.name
+    dropped = False
+    for source, fts, index, _ in SEARCH_INDEXES:
+        if not _index_exists(connection, source, fts, index):
+            continue
+        ddl = _sqlite_drop_fts_ddl(fts) if dialect == 'sqlite' else (f"DROP INDEX {index} ON {source}",)
+        for statement in ddl:
+            connection.exec_driver_sql(statement)
+        dropped = True
+    return dropped
+
+
+def ensure_search_index():
+    """Create the full-text indexes for databases built with ``db.create_all()``"""
+    with db.engine.begin() as connection:
+        create_search_index(connection)
+
+
+def _matching_query(query, terms, dialect):
+    """Filter ``query`` to tasks matching every term (as a prefix), best first
+
+    A task matches when its title and description hold every term, or when
+    one of its comments does; comment hits rank below hits in the task itself.
+    """
+    if dialect == 'sqlite':
+        # bm25() costs about as much per row as reading the row, so ranking
+        # every hit of a common word on a large table takes hundreds of ms.
+        # FTS5 walks its matches newest-first for free, so only the newest
+        # SEARCH_CANDIDATES in-scope matches of each index are scored.
+        match = ' '.join(f'"{term}"*' for term in terms)
+        task_hits = (
+            query.join(fts_table, fts_table.c.rowid == Task.id)
+            .filter(text(f'{FTS_TABLE} MATCH :task_match').bindparams(task_match=match))
+            # bm25 is lower-is-better; a title hit counts ten times a description hit
+            .with_entities(Task.id.label('id'), literal_column(f'bm25({FTS_TABLE}, 10.0, 1.0)').label('score'))
+            .order_by(fts_table.c.rowid.desc())
+            .limit(SEARCH_CANDIDATES)
+            .subquery()
+        )
+        comment_hits = (
+            query.join(Comment, Comment.task_id == Task.id)
+            .join(comment_fts_table, comment_fts_table.c.rowid == Comment.id)
+            .filter(text(f'{COMMENT_FTS_TABLE} MATCH :comment_match').bindparams(comment_match=match))
+            .with_entities(
+                Task.id.label('id'),
+                (literal_column(f'bm25({COMMENT_FTS_TABLE})') * COMMENT_WEIGHT).label('score'),
+            )
+            .order_by(comment_fts_table.c.rowid.desc())
+            .limit(SEARCH_CANDIDATES)
+            .subquery()
+        )
+        hits = union_all(
+            select(task_hits.c.id, task_hits.c.score),
+            select(comment_hits.c.id, comment_hits.c.score),
+        ).subquery()
+        candidates = (
+            select(hits.c.id, func.min(hits.c.score).label('score'))
+            .group_by(hits.c.id)
+            .subquery()
+        )
+        return (
+            Task.query.join(candidates, candidates.c.id == Task.id)
+            .order_by(candidates.c.score, Task.id.desc())
+        )
+    if dialect == 'mysql':
+        # InnoDB does not index words shorter than innodb_ft_min_token_size (3)
+        terms = [term for term in terms if len(term) >= 3] or terms
+        against = ' '.join(f'+{term}*' for term in terms)
+        # Two index-driven MATCH queries, as on SQLite; MATCH scores are
+        # higher-is-better, so a task keeps its best score
+        relevance = mysql_match(Task.title, Task.description, against=against).in_boolean_mode()
+        comment_relevance = mysql_match(Comment.comment_text, against=against).in_boolean_mode()
+        task_hits = query.filter(relevance).with_entities(Task.id.label('id'), relevance.label('score'))
+        comment_hits = (
+            query.join(Comment, Comment.task_id == Task.id)
+            .filter(comment_relevance)
+            .with_entities(Task.id.label('id'), (comment_relevance * COMMENT_WEIGHT).label('score'))
+        )
+        hits = union_all(task_hits.statement, comment_hits.statement).subquery()
+        candidates = (
+            select(hits.c.id, func.max(hits.c.score).label('score'))
+            .group_by(hits.c.id)
+            .subquery()
+        )
+        return (
+            Task.query.join(candidates, candidates.c.id == Task.id)
+            .order_by(candidates.c.score.desc(), Task.id.desc())
+        )
+    # No full-text support: unindexed substring scan, newest first
+    in_task = []
+    commented = select(Comment.task_id)
+    for term in terms:
+        pattern = f'%{term}%'
+        in_task.append(Task.title.ilike(pattern) | Task.description.ilike(pattern))
+        commented = commented.where(Comment.comment_text.ilike(pattern))
+    query = query.filter(or_(and_(*in_task), Task.id.in_(commented)))
+    return query.order_by(Task.created_at.desc(), Task.id.desc())
+
+
+def search_tasks(user, q, assigned_to=None, page=1, per_page=20):
+    """Return (tasks, has_next) for one page of ranked search results
+
+    Uses the same role scoping and ``assigned_to`` filter as the task list.
+    On SQLite only the newest SEARCH_CANDIDATES matches in task text and as
+    many in comments are ranked, so paging stops there for very common words.
+    """
+    terms = search_terms(q)
+    query = _matching_query(scoped_task_query(user, assigned_to), terms, db.session.get_bind().dialect.name)
+    rows = query.offset((page - 1) * per_page).limit(per_page + 1).all()
+    return rows[:per_page], len(rows) > per_page
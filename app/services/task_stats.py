@@ -0,0 +1,115 @@
+from sqlalchemy import func, true
+
+from app import db
+from app.models.task import Task
+from app.models.task_counter import TaskCounter
+from app.models.user import User
+
+STATUS_KEYS = {
+    'Pending': 'pending_tasks',
+    'In Progress': 'in_progress_tasks',
+    'Completed': 'completed_tasks',
+    'On Hold': 'on_hold_tasks',
+}
+PRIORITIES = ('Low', 'Medium', 'High')
+
+
+def _empty_stats():
+    stats = {'total_tasks': 0, 'overdue_tasks': 0}
+    stats.update({key: 0 for key in STATUS_KEYS.values()})
+    stats['by_priority'] = {priority: 0 for priority in PRIORITIES}
+    return stats
+
+
+def _add_count(stats, status, priority, count):
+    stats['total_tasks'] += count
+    if status in STATUS_KEYS:
+        stats[STATUS_KEYS[status]] += count
+    if priority in stats['by_priority']:
+        stats['by_priority'][priority] += count
+
+
+def _overdue_query(*columns):
+    # Served by ix_tasks_overdue_assignee; the flag is kept current by app.services.task_overdue
+    return db.session.query(*columns).filter(Task.is_overdue == true())
+
+
+def count_tasks(assignee_id=None):
+    """Number of tasks in scope, read from task_counters
+
+    ``assignee_id`` of None counts every task; ``TaskCounter.UNASSIGNED``
+    counts unassigned ones.
+    """
+    query = db.session.query(func.coalesce(func.sum(TaskCounter.task_count), 0))
+    if assignee_id is not None:
+        query = query.filter(TaskCounter.assignee_id == assignee_id)
+    return int(query.scalar())
+
+
+def count_overdue_tasks(assignee_id=None):
+    """Number of overdue tasks in scope, with the same ``assignee_id`` rules as ``count_tasks``"""
+    query = _overdue_query(func.count(Task.id))
+    if assignee_id == TaskCounter.UNASSIGNED:
+        query = query.filter(Task.assigned_to.is_(None))
+    elif assignee_id is not None:
+        query = query.filter(Task.assigned_to == assignee_id)
+    return query.scalar()
+
+
+def compute_task_stats(assigned_to=None):
+    """Return all dashboard counters
+
+    Status and priority counts come from the task_counters table, so their
+    cost depends on the number of (assignee, status, priority) combinations
+    rather than on the number of tasks. When ``assigned_to`` is given the
+    counters are limited to that user's tasks.
+    """
+    query = db.session.query(
+        TaskCounter.status, TaskCounter.priority, func.sum(TaskCounter.task_count)
+    ).group_by(TaskCounter.status, TaskCounter.priority)
+    overdue = _overdue_query(func.count(Task.id))
+    if assigned_to is not None:
+        query = query.filter(TaskCounter.assignee_id == assigned_to)
+        overdue = overdue.filter(Task.assigned_to == assigned_to)
+
+    stats = _empty_stats()
+    for status, priority, count in query:
+        _add_count(stats, status, priority, int(count or 0))
+    stats['overdue_tasks'] = overdue.scalar()
+    return stats
+
+
+def compute_task_stats_by_assignee():
+    """Return (overall stats, per-assignee breakdown)
+
+    Unassigned tasks are reported with ``assigned_to`` set to None.
+    """
+    rows = (
+        db.session.query(
+            TaskCounter.assignee_id, User.name,
+            TaskCounter.status, TaskCounter.priority, TaskCounter.task_count
+        )
+        .outerjoin(User, User.id == TaskCounter.assignee_id)
+        .filter(TaskCounter.task_count != 0)
+    )
+    overdue = dict(
+        _overdue_query(Task.assigned_to, func.count(Task.id)).group_by(Task.assigned_to).all()
+    )
+
+    totals = _empty_stats()
+    groups = {}
+    for assignee_id, name, status, priority, count in rows:
+        assigned_to = assignee_id or None
+        if assigned_to not in groups:
+            groups[assigned_to] = _empty_stats()
+            groups[assigned_to].update({
+                'assigned_to': assigned_to,
+                'assigned_to_name': name,
+                'overdue_tasks': overdue.get(assigned_to, 0)
+            })
+        _add_count(groups[assigned_to], status, priority, count)
+        _add_count(totals, status, priority, count)
+    totals['overdue_tasks'] = sum(overdue.values())
+
+    breakdown = sorted(groups.values(), key=lambda stats: stats['assigned_to_name'] or '')
+    return totals, breakdown
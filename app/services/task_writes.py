@@ -0,0 +1,298 @@
+from datetime import date, datetime
+
+from sqlalchemy import and_, false
+
+from app import db
+from app.models.task import Task
+from app.models.user import User
+from app.services.serializers import serialize_task_rows
+from app.services.task_changes import next_change_seq
+from app.services.task_queries import returned_task_fields, task_row_query
+
+VALID_STATUSES = ('Pending', 'In Progress', 'Completed', 'On Hold')
+CONFLICT_MESSAGE = 'Task was changed by someone else; reload it and try again'
+
+tasks_table = Task.__table__
+
+
+class TaskWriteError(Exception):
+    """A task write was rejected; carries the message and HTTP status to return"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def can_edit_task(user, task):
+    """Admins may edit any task, developers only the ones assigned to them"""
+    return user.role == 'admin' or task.assigned_to == user.id
+
+
+def expected_version(data):
+    """The optional ``version`` a client sent to guard its edit, or None"""
+    version = data.get('version')
+    if version is None:
+        return None
+    if not isinstance(version, int) or isinstance(version, bool):
+        raise TaskWriteError('version must be an integer')
+    return version
+
+
+def check_version(task, data):
+    """Reject the edit with 409 if the client read an older version of ``task``"""
+    version = expected_version(data)
+    if version is not None and version != task.version:
+        raise TaskWriteError(CONFLICT_MESSAGE, 409)
+
+
+def parse_date(value, field):
+    """Parse a YYYY-MM-DD string, returning None for empty values"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        raise TaskWriteError(f'Invalid {field} format')
+
+
+def is_row_id(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def load_user_ids(values):
+    """The subset of ``values`` that are ids of existing users, in one query"""
+    user_ids = {value for value in values if is_row_id(value)}
+    if not user_ids:
+        return set()
+    return {user_id for user_id, in db.session.query(User.id).filter(User.id.in_(user_ids))}
+
+
+def check_assignee(assigned_to, known_users):
+    """Reject an ``assigned_to`` that is not one of ``known_users`` (None unassigns)"""
+    if assigned_to is not None and assigned_to not in known_users:
+        raise TaskWriteError('Assigned user not found')
+
+
+def build_task(data, created_by, known_users=None):
+    """Validate ``data`` and return a new, unsaved Task
+
+    Pass ``known_users`` (see ``load_user_ids``) to also check the assignee.
+    """
+    if not data.get('title'):
+        raise TaskWriteError('Title is required')
+    if known_users is not None:
+        check_assignee(data.get('assigned_to'), known_users)
+    start_date = parse_date(data.get('start_date'), 'start_date')
+    due_date = parse_date(data.get('due_date'), 'due_date')
+    return Task(
+        title=data.get('title'),
+        description=data.get('description', ''),
+        assigned_to=data.get('assigned_to'),
+        priority=data.get('priority', 'Medium'),
+        status=data.get('status', 'Pending'),
+        start_date=start_date,
+        due_date=due_date,
+        created_by=created_by
+    )
+
+
+def apply_task_update(task, data, user, known_users=None):
+    """Validate ``data`` and copy the fields it contains onto ``task``
+
+    Everything is validated before the first field is assigned, so a
+    rejected update leaves ``task`` untouched. Pass ``known_users`` to
+    also check a new assignee.
+    """
+    changes = {}
+    if 'title' in data:
+        changes['title'] = data['title']
+    if 'description' in data:
+        changes['description'] = data.get('description', '')
+    if 'assigned_to' in data:
+        if user.role != 'admin':
+            raise TaskWriteError('Only admin can reassign tasks', 403)
+        if known_users is not None:
+            check_assignee(data['assigned_to'], known_users)
+        changes['assigned_to'] = data['assigned_to']
+    if 'priority' in data:
+        changes['priority'] = data['priority']
+    if 'status' in data:
+        changes['status'] = data['status']
+    if 'start_date' in data:
+        changes['start_date'] = parse_date(data['start_date'], 'start_date')
+    if 'due_date' in data:
+        changes['due_date'] = parse_date(data['due_date'], 'due_date')
+
+    for field, value in changes.items():
+        setattr(task, field, value)
+    task.updated_at = datetime.utcnow()
+
+
+def validate_status(new_status):
+    if not new_status:
+        raise TaskWriteError('Status is required')
+    if new_status not in VALID_STATUSES:
+        raise TaskWriteError('Invalid status')
+
+
+def apply_status(task, new_status):
+    """Validate and set a new workflow status on ``task``"""
+    validate_status(new_status)
+    task.status = new_status
+    task.updated_at = datetime.utcnow()
+
+
+def _status_update_error(task_id, user):
+    """Why a conditional status UPDATE matched no row: 404, 403 or 409"""
+    row = db.session.query(Task.assigned_to).filter(Task.id == task_id).first()
+    if row is None:
+        return TaskWriteError('Task not found', 404)
+    if not can_edit_task(user, row):
+        return TaskWriteError('Permission denied', 403)
+    return TaskWriteError(CONFLICT_MESSAGE, 409)
+
+
+def set_task_status(task_id, data, user):
+    """Change a task's status without loading it into the ORM; returns the task dict
+
+    A single ``UPDATE ... WHERE id = ?`` that also checks the permission
+    and, when the client sent one, the ``version`` it read. It returns
+    the row, user names included, as the response (SQLite; MySQL, which
+    lacks ``UPDATE ... RETURNING``, reads it back). Only when it matches
+    nothing does a read tell 404, 403 and 409 apart. The triggers on
+    ``tasks`` keep task_counters and the data versions up to date inside
+    the UPDATE, so the only other statement is taking the change
+    sequence number. Runs on the session's connection; the caller
+    commits, or rolls back on TaskWriteError.
+    """
+    new_status = data.get('status')
+    validate_status(new_status)
+    version = expected_version(data)
+
+    c = tasks_table.c
+    condition = [c.id == task_id]
+    if user.role != 'admin':
+        condition.append(c.assigned_to == user.id)
+    if version is not None:
+        condition.append(c.version == version)
+    # task_overdue.overdue_on, evaluated against the row's own due date
+    is_overdue = false() if new_status == 'Completed' else and_(c.due_date.is_not(None), c.due_date < date.today())
+
+    connection = db.session.connection()
+    seq = next_change_seq(connection)
+    update = tasks_table.update().where(*condition).values(
+        status=new_status, updated_at=datetime.utcnow(), is_overdue=is_overdue,
+        version=c.version + 1, change_seq=seq,
+    )
+    if connection.dialect.update_returning:
+        row = connection.execute(update.returning(*returned_task_fields())).first()
+    else:
+        row = None
+        if connection.execute(update).rowcount:
+            row = task_row_query(Task.query.filter(Task.id == task_id)).one()
+    if row is None:
+        raise _status_update_error(task_id, user)
+    return serialize_task_rows([row])[0]
+
+
+BULK_MAX_OPERATIONS = 200
+BULK_OPERATIONS = ('create', 'update', 'status', 'delete')
+
+
+def operation_ids(operation):
+    """Values targeted by a bulk operation (``ids`` list or single ``id``)
+
+    Returned as sent; anything that is not an integer fails on its own.
+    """
+    ids = operation.get('ids')
+    if ids is None:
+        return [operation['id']] if operation.get('id') is not None else []
+    return ids if isinstance(ids, list) else [ids]
+
+
+def run_bulk_operations(operations, user, session):
+    """Apply bulk task operations to ``session`` without committing
+
+    Every targeted task, and every user named as an assignee, is loaded
+    with one query up front and checked with the same rules as the
+    single-task endpoints; an unknown assignee fails its operation with 400
+    here rather than the whole flush with a foreign-key error. Returns one
+    result dict per (operation, task id); successful creates/updates carry
+    the Task under the ``task`` key, and updates/deletes the assignee the
+    task had before under ``previous_assignee``.
+    """
+    all_ids = {
+        task_id for operation in operations for task_id in operation_ids(operation) if is_row_id(task_id)
+    }
+    tasks = {}
+    if all_ids:
+        tasks = {task.id: task for task in Task.query.filter(Task.id.in_(all_ids))}
+    known_users = load_user_ids(
+        (operation.get('data') or {}).get('assigned_to')
+        for operation in operations if operation.get('op') in ('create', 'update')
+    )
+
+    results = []
+    for index, operation in enumerate(operations):
+        kind = operation.get('op')
+        if kind not in BULK_OPERATIONS:
+            results.append(_failure(index, kind, None, TaskWriteError('Unknown operation')))
+            continue
+
+        if kind == 'create':
+            try:
+                if user.role != 'admin':
+                    raise TaskWriteError('Admin access required', 403)
+                task = build_task(operation.get('data') or {}, created_by=user.id, known_users=known_users)
+            except TaskWriteError as exc:
+                results.append(_failure(index, kind, None, exc))
+                continue
+            session.add(task)
+            results.append({'index': index, 'op': kind, 'id': None, 'success': True, 'task': task})
+            continue
+
+        task_ids = operation_ids(operation)
+        for task_id in task_ids or [None]:
+            task = tasks.get(task_id) if is_row_id(task_id) else None
+            try:
+                if task_ids and not is_row_id(task_id):
+                    raise TaskWriteError('Task id must be an integer')
+                if task is None:
+                    raise TaskWriteError('Task not found', 404)
+                previous_assignee = task.assigned_to
+                if kind == 'delete':
+                    if user.role != 'admin':
+                        raise TaskWriteError('Admin access required', 403)
+                    session.delete(task)
+                    del tasks[task_id]
+                    results.append({
+                        'index': index, 'op': kind, 'id': task_id, 'success': True,
+                        'previous_assignee': previous_assignee
+                    })
+                    continue
+                if not can_edit_task(user, task):
+                    raise TaskWriteError('Permission denied', 403)
+                if kind == 'update':
+                    apply_task_update(task, operation.get('data') or {}, user, known_users)
+                else:
+                    apply_status(task, operation.get('status'))
+            except TaskWriteError as exc:
+                results.append(_failure(index, kind, task_id, exc))
+                continue
+            results.append({
+                'index': index, 'op': kind, 'id': task_id, 'success': True, 'task': task,
+                'previous_assignee': previous_assignee
+            })
+    return results
+
+
+def _failure(index, kind, task_id, exc):
+    return {
+        'index': index,
+        'op': kind,
+        'id': task_id,
+        'success': False,
+        'status_code': exc.status_code,
+        'message': exc.message
+    }
@@ -0,0 +1,30 @@
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+ON_CONFLICT_INSERTS = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}
+
+
+def upsert(connection, table, rows, keys, merge):
+    """Insert ``rows`` into ``table``, updating the rows whose ``keys`` already exist
+
+    ``keys`` names the columns of a unique key and ``merge(new)`` returns
+    the ``{column: expression}`` to set on an existing row, where ``new``
+    holds the values it would have been inserted with. It is a single
+    statement, so two transactions adding the same new key cannot both
+    miss it and then collide on the unique key. Pass ``rows`` sorted by
+    key: InnoDB locks them in that order, which keeps concurrent writers
+    from deadlocking.
+    """
+    if not rows:
+        return
+    dialect = connection.dialect.name
+    if dialect in ON_CONFLICT_INSERTS:
+        statement = ON_CONFLICT_INSERTS[dialect](table).values(rows)
+        statement = statement.on_conflict_do_update(index_elements=keys, set_=merge(statement.excluded))
+    elif dialect == 'mysql':
+        statement = mysql_insert(table).values(rows)
+        statement = statement.on_duplicate_key_update(merge(statement.inserted))
+    else:
+        raise NotImplementedError(f'No upsert for the {dialect} dialect')
+    connection.execute(statement)
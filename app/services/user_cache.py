@@ -0,0 +1,147 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+from flask_login import UserMixin
+
+from app import db
+
+
+class SessionUser(UserMixin):
+    """Read-only snapshot of a User, returned by the Flask-Login user loader
+
+    Carries only what request handlers read from ``current_user`` so that
+    it can be cached between requests without holding a session-bound ORM
+    instance.
+    """
+    __slots__ = ('id', 'name', 'email', 'role')
+
+    def __init__(self, id, name, email, role):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.role = role
+
+    def __repr__(self):
+        return f'<User {self.email}>'
+
+
+class MemoryUserCache:
+    """Per-process LRU cache of user records with a time-to-live"""
+
+    def __init__(self, ttl=60, max_size=1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, record = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return record
+
+    def set(self, user_id, record):
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, record)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisUserCache:
+    """User records shared by every worker through Redis
+
+    Needed when running several gunicorn workers: an invalidation made by
+    one worker is then seen by all of them.
+    """
+
+    def __init__(self, url, ttl=60, prefix='teamprogress:user:'):
+        import redis  # optional dependency, only needed for this backend
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, user_id):
+        raw = self.client.get(f'{self.prefix}{user_id}')
+        return json.loads(raw) if raw else None
+
+    def set(self, user_id, record):
+        self.client.setex(f'{self.prefix}{user_id}', self.ttl, json.dumps(record))
+
+    def delete(self, user_id):
+        self.client.delete(f'{self.prefix}{user_id}')
+
+    def clear(self):
+        for key in self.client.scan_iter(f'{self.prefix}*'):
+            self.client.delete(key)
+
+
+class NullUserCache:
+    """Cache that never stores anything (USER_CACHE_BACKEND=none)"""
+
+    def get(self, user_id):
+        return None
+
+    def set(self, user_id, record):
+        pass
+
+    def delete(self, user_id):
+        pass
+
+    def clear(self):
+        pass
+
+
+def init_user_cache(app):
+    """Create the user cache configured for ``app``"""
+    backend = app.config.get('USER_CACHE_BACKEND', 'memory')
+    ttl = app.config.get('USER_CACHE_TTL', 60)
+    if backend == 'redis':
+        cache = RedisUserCache(app.config['USER_CACHE_REDIS_URL'], ttl=ttl)
+    elif backend == 'none':
+        cache = NullUserCache()
+    else:
+        cache = MemoryUserCache(ttl=ttl, max_size=app.config.get('USER_CACHE_SIZE', 1024))
+    app.extensions['user_cache'] = cache
+    return cache
+
+
+def load_session_user(user_id):
+    """Return the SessionUser for ``user_id``, querying the database only on a cache miss"""
+    from app.models.user import User
+
+    cache = current_app.extensions['user_cache']
+    record = cache.get(user_id)
+    if record is None:
+        row = (
+            db.session.query(User.id, User.name, User.email, User.role)
+            .filter(User.id == user_id)
+            .first()
+        )
+        if row is None:
+            return None
+        record = {'id': row.id, 'name': row.name, 'email': row.email, 'role': row.role}
+        cache.set(user_id, record)
+    return SessionUser(**record)
+
+
+def invalidate_user(user_id):
+    """Drop ``user_id`` from the cache so the next request reloads it"""
+    current_app.extensions['user_cache'].delete(user_id)
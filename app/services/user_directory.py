@@ -0,0 +1,96 @@
+import threading
+
+from flask import current_app
+from sqlalchemy import or_
+
+from app import db
+from app.models.user import User
+from app.services.data_versions import read_versions
+
+USER_PAGE_SIZE = 50
+MAX_USER_PAGE_SIZE = 100
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def user_query(search=None):
+    """Users newest first, optionally only those whose name or email starts with ``search``
+
+    Prefix matches can use ix_users_name and the unique email index.
+    """
+    query = User.query
+    search = (search or '').strip()
+    if search:
+        pattern = f'{_escape_like(search)}%'
+        query = query.filter(or_(User.name.like(pattern, escape='\\'), User.email.like(pattern, escape='\\')))
+    return query.order_by(User.created_at.desc(), User.id.desc())
+
+
+def user_page(search=None, page=1, per_page=USER_PAGE_SIZE):
+    """One page of ``user_query(search)`` as (user dicts, meta)"""
+    pagination = user_query(search).paginate(page=page, per_page=per_page, error_out=False)
+    return [user.to_dict() for user in pagination.items], {
+        'page': pagination.page,
+        'per_page': pagination.per_page,
+        'total_pages': pagination.pages,
+        'total_items': pagination.total,
+        'has_next': pagination.has_next,
+        'has_prev': pagination.has_prev
+    }
+
+
+class UserDirectoryCache:
+    """Per-process copy of the user directory, tagged with the ``users`` data version
+
+    A worker that changes users clears it directly; other workers notice
+    the bumped version on their next read.
+    """
+
+    def __init__(self):
+        self._entry = None
+        self._lock = threading.Lock()
+
+    def get(self, version):
+        with self._lock:
+            if self._entry is None or self._entry[0] != version:
+                return None
+            return self._entry[1]
+
+    def set(self, version, rows):
+        with self._lock:
+            self._entry = (version, rows)
+
+    def clear(self):
+        with self._lock:
+            self._entry = None
+
+
+def init_user_directory(app):
+    cache = UserDirectoryCache()
+    app.extensions['user_directory'] = cache
+    return cache
+
+
+def user_directory():
+    """Return (version, [[id, name, role], ...]) for every user, ordered by name
+
+    Costs one version lookup while the cached copy is current. The version
+    is read before the rows, so a copy is never tagged newer than it is.
+    """
+    cache = current_app.extensions['user_directory']
+    version, = read_versions(['users'])
+    rows = cache.get(version)
+    if rows is None:
+        rows = [
+            [user_id, name, role]
+            for user_id, name, role in db.session.query(User.id, User.name, User.role).order_by(User.name, User.id)
+        ]
+        cache.set(version, rows)
+    return version, rows
+
+
+def invalidate_user_directory():
+    """Drop this worker's cached directory after a user is created, changed or deleted"""
+    current_app.extensions['user_directory'].clear()
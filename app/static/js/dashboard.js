@@ -3,6 +3,7 @@ let tasks = [];
 let users = [];
 let tasksMeta = {};
 let currentUserRole = window.currentUserRole || "developer";
+let currentUserId = window.currentUserId;
 
 let currentPage = 1;
 let pageSize = 10;
@@ -10,21 +11,59 @@ let totalPages = 1;
 let currentSortField = "created_at";
 let currentSortDir = "desc";
 let currentAssigneeFilter = "all";
+// Keyset pagination: pageCursors[i] is the cursor that loads page i + 1
+let pageCursors = [null];
+// Task ids ticked for bulk actions (admin only)
+let selectedTaskIds = new Set();
+// Live updates: true while the /api/events stream is open
+let liveUpdatesConnected = false;
+let liveUpdatesEverConnected = false;
+// Tasks we created and already showed; their task.created echo is just an update
+const ownCreatedTaskIds = new Set();
+let statsRefreshTimer = null;
+// Delta-sync token from /api/tasks/changes; null until the first sync
+let changesToken = null;
 
 // Initialize dashboard
 document.addEventListener("DOMContentLoaded", () => {
   initializeControls();
-  loadDashboardStats();
-  loadTasks();
+  loadBootstrap();
+  connectLiveUpdates();
   if (currentUserRole === "admin") {
-    loadUsers();
-    loadAllUsers(); // Load all users for user management table
     setupTaskForm();
     setupEditForm();
     setupUserForms();
+    setupUserSearch();
   }
 });
 
+// First paint: stats, first task page and users from the payload the
+// page inlines, or from one /api/bootstrap request when it is missing
+async function loadBootstrap() {
+  let data = window.bootstrapData;
+  window.bootstrapData = null;
+  if (!data) {
+    try {
+      const response = await fetch("/api/bootstrap");
+      data = await response.json();
+    } catch (error) {
+      console.error("Error loading dashboard:", error);
+      return;
+    }
+    if (!data.success) return;
+  }
+
+  changesToken = data.next_since;
+  renderStats(data.stats);
+  applyTaskPage(data);
+  if (data.directory) {
+    applyDirectory(data.directory.users);
+  }
+  if (data.users) {
+    applyUserPage(data);
+  }
+}
+
 // Load dashboard statistics
 async function loadDashboardStats() {
   try {
@@ -32,59 +71,81 @@ async function loadDashboardStats() {
     const data = await response.json();
 
     if (data.success) {
-      document.getElementById("statTotal").textContent = data.stats.total_tasks;
-      document.getElementById("statCompleted").textContent =
-        data.stats.completed_tasks;
-      document.getElementById("statPending").textContent =
-        data.stats.pending_tasks;
-      document.getElementById("statInProgress").textContent =
-        data.stats.in_progress_tasks;
-      document.getElementById("statOverdue").textContent =
-        data.stats.overdue_tasks;
+      renderStats(data.stats);
     }
   } catch (error) {
     console.error("Error loading stats:", error);
   }
 }
 
+function renderStats(stats) {
+  document.getElementById("statTotal").textContent = stats.total_tasks;
+  document.getElementById("statCompleted").textContent = stats.completed_tasks;
+  document.getElementById("statPending").textContent = stats.pending_tasks;
+  document.getElementById("statInProgress").textContent =
+    stats.in_progress_tasks;
+  document.getElementById("statOverdue").textContent = stats.overdue_tasks;
+}
+
 // Load all tasks
 async function loadTasks() {
   try {
     const params = new URLSearchParams({
-      page: currentPage,
+      mode: "cursor",
       per_page: pageSize,
       sort_by: currentSortField,
       sort_dir: currentSortDir,
     });
-    if (
-      currentUserRole === "admin" &&
-      currentAssigneeFilter &&
-      currentAssigneeFilter !== "all"
-    ) {
-      params.append("assigned_to", currentAssigneeFilter);
+    const cursor = pageCursors[currentPage - 1];
+    if (cursor) {
+      params.append("cursor", cursor);
     }
+    appendAssigneeFilter(params);
     const response = await fetch(`/api/tasks?${params.toString()}`);
     const data = await response.json();
 
     if (data.success) {
-      tasks = data.tasks;
-      tasksMeta = data.meta || {};
-      currentPage = tasksMeta.page || currentPage;
-      pageSize = tasksMeta.per_page || pageSize;
-      totalPages = tasksMeta.total_pages || 1;
-      syncControlsWithState();
-      renderTasks();
-      renderPagination();
+      applyTaskPage(data);
     }
   } catch (error) {
     console.error("Error loading tasks:", error);
   }
 }
 
+// Show a page of tasks returned by /api/tasks (or /api/bootstrap)
+function applyTaskPage(data) {
+  tasks = data.tasks;
+  tasksMeta = data.meta || {};
+  pageSize = tasksMeta.per_page || pageSize;
+  totalPages = tasksMeta.total_pages || 1;
+  pageCursors = pageCursors.slice(0, currentPage);
+  if (tasksMeta.next_cursor) {
+    pageCursors.push(tasksMeta.next_cursor);
+  }
+  const visibleIds = new Set(tasks.map((task) => task.id));
+  selectedTaskIds = new Set(
+    [...selectedTaskIds].filter((taskId) => visibleIds.has(taskId))
+  );
+  syncControlsWithState();
+  renderTasks();
+  renderPagination();
+  updateBulkActions();
+}
+
+function appendAssigneeFilter(params) {
+  if (
+    currentUserRole === "admin" &&
+    currentAssigneeFilter &&
+    currentAssigneeFilter !== "all"
+  ) {
+    params.append("assigned_to", currentAssigneeFilter);
+  }
+}
+
 // Render tasks table
 function renderTasks() {
   const tbody = document.getElementById("tasksTableBody");
-  const columnCount = currentUserRole === "admin" ? 9 : 8;
+  const columnCount = currentUserRole === "admin" ? 10 : 8;
 
   if (tasks.length === 0) {
     tbody.innerHTML = `<tr><td colspan="${columnCount}" class="px-6 py-4 text-center text-gray-500">No tasks found</td></tr>`;
@@ -126,8 +187,18 @@ function renderTasks() {
                </td>`
           : "";
 
+      const selectCell =
+        currentUserRole === "admin"
+          ? `<td class="px-6 py-4">
+                <input type="checkbox" class="rounded border-gray-300" onchange="toggleTaskSelection(${
+                  task.id
+                }, this.checked)" ${selectedTaskIds.has(task.id) ? "checked" : ""}>
+               </td>`
+          : "";
+
       return `
             <tr class="${rowClass}">
+                ${selectCell}
                 <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">#${
                   task.id
                 }</td>
@@ -258,19 +329,26 @@ function getStatusSelectClass(status) {
 // Load users (for admin - developers only for task assignment dropdown)
 async function loadUsers() {
   try {
-    const response = await fetch("/api/users");
+    const response = await fetch("/api/users/directory");
     const data = await response.json();
 
     if (data.success) {
-      // Filter to only developers for task assignment dropdown
-      users = data.users.filter((user) => user.role === "developer");
-      populateUserSelects();
+      applyDirectory(data.users);
     }
   } catch (error) {
     console.error("Error loading users:", error);
   }
 }
 
+// Directory rows are [id, name, role]
+function applyDirectory(rows) {
+  // Filter to only developers for task assignment dropdown
+  users = rows
+    .filter(([, , role]) => role === "developer")
+    .map(([id, name, role]) => ({ id, name, role }));
+  populateUserSelects();
+}
+
 // Populate user select dropdowns
 function populateUserSelects() {
   const selects = ["taskAssignedTo", "editTaskAssignedTo"];
@@ -288,6 +366,18 @@ function populateUserSelects() {
     }
   });
 
+  const bulkSelect = document.getElementById("bulkAssignedTo");
+  if (bulkSelect) {
+    bulkSelect.innerHTML =
+      '<option value="">Assignee: no change</option><option value="unassigned">Unassigned</option>' +
+      users
+        .map(
+          (user) =>
+            `<option value="${user.id}">${escapeHtml(user.name)}</option>`
+        )
+        .join("");
+  }
+
   const filterSelect = document.getElementById("assigneeFilter");
   if (filterSelect) {
     const previousValue = filterSelect.value;
@@ -318,7 +408,7 @@ function initializeControls() {
   if (sortFieldSelect) {
     sortFieldSelect.addEventListener("change", () => {
       currentSortField = sortFieldSelect.value;
-      currentPage = 1;
+      resetPagination();
       loadTasks();
     });
   }
@@ -326,7 +416,7 @@ function initializeControls() {
   if (sortDirectionSelect) {
     sortDirectionSelect.addEventListener("change", () => {
       currentSortDir = sortDirectionSelect.value;
-      currentPage = 1;
+      resetPagination();
       loadTasks();
     });
   }
@@ -334,7 +424,7 @@ function initializeControls() {
   if (pageSizeSelect) {
     pageSizeSelect.addEventListener("change", () => {
       pageSize = parseInt(pageSizeSelect.value, 10) || 10;
-      currentPage = 1;
+      resetPagination();
       loadTasks();
     });
   }
@@ -342,18 +432,24 @@ function initializeControls() {
   if (assigneeFilterSelect) {
     assigneeFilterSelect.addEventListener("change", () => {
       currentAssigneeFilter = assigneeFilterSelect.value;
-      currentPage = 1;
+      resetPagination();
       loadTasks();
     });
   }
 }
 
 function changePage(newPage) {
-  if (newPage < 1 || newPage > totalPages) return;
+  // Cursor pages can only be reached from a neighbouring page
+  if (newPage < 1 || newPage > pageCursors.length) return;
   currentPage = newPage;
   loadTasks();
 }
 
+function resetPagination() {
+  currentPage = 1;
+  pageCursors = [null];
+}
+
 function syncControlsWithState() {
   const sortFieldSelect = document.getElementById("sortField");
   const sortDirectionSelect = document.getElementById("sortDirection");
@@ -408,8 +504,7 @@ function setupTaskForm() {
 
       if (data.success) {
         closeAddTaskModal();
-        loadTasks();
-        loadDashboardStats();
+        refreshAfterWrite([{ op: "create", task: data.task }]);
         alert("Task created successfully!");
       } else {
         alert("Error: " + data.message);
@@ -432,6 +527,7 @@ function setupEditForm() {
       e.preventDefault();
 
       const taskId = document.getElementById("editTaskId").value;
+      const task = tasks.find((t) => t.id === Number(taskId));
       const taskData = {
         title: document.getElementById("editTaskTitle").value,
         description: document.getElementById("editTaskDescription").value,
@@ -441,6 +537,8 @@ function setupEditForm() {
         status: document.getElementById("editTaskStatus").value,
         start_date: document.getElementById("editTaskStartDate").value || null,
         due_date: document.getElementById("editTaskDueDate").value || null,
+        // Lets the server refuse to overwrite an edit made since it loaded
+        version: task ? task.version : undefined,
       };
 
       const btn = document.getElementById("updateTaskBtn");
@@ -458,11 +556,14 @@ function setupEditForm() {
 
         if (data.success) {
           closeEditModal();
-          loadTasks();
-          loadDashboardStats();
+          refreshAfterWrite([{ op: "update", task: data.task }]);
           alert("Task updated successfully!");
         } else {
           alert("Error: " + data.message);
+          if (response.status === 409) {
+            closeEditModal();
+            loadTasks();
+          }
         }
       } catch (error) {
         alert("An error occurred. Please try again.");
@@ -519,18 +620,21 @@ function closeEditModal() {
 
 // Update task status
 async function updateTaskStatus(taskId, newStatus) {
+  const task = tasks.find((t) => t.id === taskId);
   try {
     const response = await fetch(`/api/tasks/${taskId}/status`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ status: newStatus }),
+      body: JSON.stringify({
+        status: newStatus,
+        version: task ? task.version : undefined,
+      }),
     });
 
     const data = await response.json();
 
     if (data.success) {
-      loadTasks();
-      loadDashboardStats();
+      refreshAfterWrite([{ op: "status", task: data.task }]);
     } else {
       alert("Error: " + data.message);
       loadTasks(); // Reload to revert change
@@ -556,8 +660,7 @@ async function deleteTask(taskId) {
     const data = await response.json();
 
     if (data.success) {
-      loadTasks();
-      loadDashboardStats();
+      refreshAfterWrite([{ op: "delete", id: taskId }]);
       alert("Task deleted successfully!");
     } else {
       alert("Error: " + data.message);
@@ -568,6 +671,255 @@ async function deleteTask(taskId) {
   }
 }
 
+// ==================== BULK TASK ACTIONS ====================
+
+function toggleTaskSelection(taskId, checked) {
+  if (checked) {
+    selectedTaskIds.add(taskId);
+  } else {
+    selectedTaskIds.delete(taskId);
+  }
+  updateBulkActions();
+}
+
+function toggleSelectAllTasks(checked) {
+  selectedTaskIds = checked ? new Set(tasks.map((task) => task.id)) : new Set();
+  renderTasks();
+  updateBulkActions();
+}
+
+function clearTaskSelection() {
+  toggleSelectAllTasks(false);
+}
+
+// Show the bulk action bar while at least one task is selected
+function updateBulkActions() {
+  const bar = document.getElementById("bulkActions");
+  if (!bar) return;
+
+  bar.classList.toggle("hidden", selectedTaskIds.size === 0);
+  document.getElementById("bulkSelectedCount").textContent =
+    selectedTaskIds.size;
+
+  const selectAll = document.getElementById("selectAllTasks");
+  if (selectAll) {
+    selectAll.checked =
+      tasks.length > 0 && selectedTaskIds.size === tasks.length;
+  }
+}
+
+// Send operations to the bulk endpoint and refresh once afterwards
+async function submitBulkOperations(operations) {
+  try {
+    const response = await fetch("/api/tasks/bulk", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ operations }),
+    });
+
+    const data = await response.json();
+
+    if (!data.success) {
+      const failures = (data.results || [])
+        .filter((result) => !result.success)
+        .map((result) => `#${result.id ?? "?"}: ${result.message}`);
+      alert("Error: " + data.message + (failures.length ? "\n" + failures.join("\n") : ""));
+    }
+    selectedTaskIds = new Set();
+    renderTasks();
+    updateBulkActions();
+    refreshAfterWrite((data.results || []).filter((result) => result.success));
+  } catch (error) {
+    alert("An error occurred. Please try again.");
+    console.error(error);
+  }
+}
+
+function applyBulkUpdate() {
+  const ids = [...selectedTaskIds];
+  const status = document.getElementById("bulkStatus").value;
+  const priority = document.getElementById("bulkPriority").value;
+  const assignee = document.getElementById("bulkAssignedTo").value;
+
+  const operations = [];
+  if (status) {
+    operations.push({ op: "status", ids, status });
+  }
+  const data = {};
+  if (priority) {
+    data.priority = priority;
+  }
+  if (assignee) {
+    data.assigned_to = assignee === "unassigned" ? null : parseInt(assignee, 10);
+  }
+  if (Object.keys(data).length > 0) {
+    operations.push({ op: "update", ids, data });
+  }
+
+  if (ids.length === 0 || operations.length === 0) {
+    alert("Select tasks and at least one change to apply.");
+    return;
+  }
+  submitBulkOperations(operations);
+}
+
+function bulkDeleteTasks() {
+  const ids = [...selectedTaskIds];
+  if (ids.length === 0) return;
+  if (!confirm(`Are you sure you want to delete ${ids.length} task(s)?`)) {
+    return;
+  }
+  submitBulkOperations([{ op: "delete", ids }]);
+}
+
+// ==================== LIVE UPDATES ====================
+
+// Subscribe to /api/events and patch the loaded page instead of refetching it
+function connectLiveUpdates() {
+  if (!window.EventSource) return;
+
+  const source = new EventSource("/api/events");
+  source.addEventListener("open", () => {
+    // Changes made while we were disconnected were missed
+    if (liveUpdatesEverConnected) {
+      syncTasks();
+      loadDashboardStats();
+    }
+    liveUpdatesConnected = true;
+    liveUpdatesEverConnected = true;
+  });
+  source.addEventListener("error", () => {
+    // The browser retries on its own unless the stream is unavailable
+    liveUpdatesConnected = false;
+  });
+
+  const onTaskEvent = (event) => {
+    const data = JSON.parse(event.data);
+    if (data.type === "task.deleted") {
+      removeLocalTask(data.id);
+    } else {
+      const created = data.type === "task.created" && !ownCreatedTaskIds.delete(data.id);
+      applyLocalTask(data.task, created);
+    }
+    scheduleStatsRefresh();
+  };
+  source.addEventListener("task.created", onTaskEvent);
+  source.addEventListener("task.updated", onTaskEvent);
+  source.addEventListener("task.deleted", onTaskEvent);
+  source.addEventListener("resync", () => {
+    syncTasks();
+    loadDashboardStats();
+  });
+}
+
+// After our own write: apply the tasks the server sent back straight away.
+// The event echo may reach a stream on another worker, so live updates are
+// only relied on for other people's changes.
+function refreshAfterWrite(results) {
+  results.forEach((result) => {
+    if (result.op === "delete") {
+      removeLocalTask(result.id);
+    } else if (result.task) {
+      const created = result.op === "create";
+      if (created) ownCreatedTaskIds.add(result.task.id);
+      applyLocalTask(result.task, created);
+    }
+  });
+  loadDashboardStats();
+  if (!liveUpdatesConnected) syncTasks();
+}
+
+// Fetch only what changed since the last sync and patch the loaded page;
+// reloads the page when told to reset or when a changed task belongs on it
+async function syncTasks() {
+  try {
+    const params = new URLSearchParams();
+    if (changesToken !== null) {
+      params.append("since", changesToken);
+    }
+    appendAssigneeFilter(params);
+    const response = await fetch(`/api/tasks/changes?${params.toString()}`);
+    const data = await response.json();
+    if (!data.success) return;
+
+    changesToken = data.next_since;
+    if (data.reset) {
+      loadTasks();
+      return;
+    }
+    data.deleted.forEach(removeLocalTask);
+    const loadedIds = new Set(tasks.map((task) => task.id));
+    const missing = data.tasks.some(
+      (task) => taskMatchesFilter(task) && !loadedIds.has(task.id)
+    );
+    if (missing) {
+      loadTasks();
+    } else {
+      data.tasks.forEach((task) => applyLocalTask(task, false));
+    }
+  } catch (error) {
+    console.error("Error syncing tasks:", error);
+  }
+}
+
+// Coalesce bursts of events into one (usually 304) stats request
+function scheduleStatsRefresh() {
+  clearTimeout(statsRefreshTimer);
+  statsRefreshTimer = setTimeout(loadDashboardStats, 1000);
+}
+
+function taskMatchesFilter(task) {
+  if (currentUserRole !== "admin") {
+    return task.assigned_to === currentUserId;
+  }
+  if (currentAssigneeFilter === "unassigned") {
+    return task.assigned_to === null;
+  }
+  if (currentAssigneeFilter && currentAssigneeFilter !== "all") {
+    return task.assigned_to === parseInt(currentAssigneeFilter, 10);
+  }
+  return true;
+}
+
+function applyLocalTask(task, created) {
+  const index = tasks.findIndex((t) => t.id === task.id);
+  const visible = taskMatchesFilter(task);
+
+  // A late echo of an edit we already applied
+  if (index >= 0 && tasks[index].version > task.version) return;
+
+  if (index >= 0 && !visible) {
+    removeLocalTask(task.id);
+    return;
+  }
+  if (index >= 0) {
+    tasks[index] = task;
+    renderTasks();
+    return;
+  }
+  if (visible && created) {
+    tasksMeta.total_items = (tasksMeta.total_items || 0) + 1;
+    // Only the first page of the newest-first listing shows it; reload just that page
+    if (currentPage === 1 && currentSortField === "created_at" && currentSortDir === "desc") {
+      loadTasks();
+    } else {
+      renderPagination();
+    }
+  }
+}
+
+function removeLocalTask(taskId) {
+  const index = tasks.findIndex((t) => t.id === taskId);
+  if (index < 0) return;
+
+  tasks.splice(index, 1);
+  tasksMeta.total_items = Math.max(0, (tasksMeta.total_items || 1) - 1);
+  selectedTaskIds.delete(taskId);
+  renderTasks();
+  renderPagination();
+  updateBulkActions();
+}
+
 // Logout
 async function logout() {
   try {
@@ -602,24 +954,100 @@ function escapeHtml(text) {
 // ==================== USER MANAGEMENT FUNCTIONS ====================
 
 let allUsers = [];
+let usersMeta = {};
+let usersPage = 1;
+let usersSearch = "";
+let userSearchTimer = null;
 
-// Load all users for user management table
+// Load one page of the user management table
 async function loadAllUsers() {
   if (currentUserRole !== "admin") return;
 
   try {
-    const response = await fetch("/api/users");
+    const params = new URLSearchParams({ page: usersPage });
+    if (usersSearch) {
+      params.append("q", usersSearch);
+    }
+    const response = await fetch(`/api/users?${params.toString()}`);
     const data = await response.json();
 
     if (data.success) {
-      allUsers = data.users;
-      renderUsersTable();
+      applyUserPage(data);
     }
   } catch (error) {
     console.error("Error loading users:", error);
   }
 }
 
+function applyUserPage(data) {
+  allUsers = data.users;
+  usersMeta = data.users_meta || data.meta || {};
+  renderUsersTable();
+  renderUsersPagination();
+}
+
+function changeUsersPage(newPage) {
+  if (newPage < 1 || newPage > (usersMeta.total_pages || 1)) return;
+  usersPage = newPage;
+  loadAllUsers();
+}
+
+function setupUserSearch() {
+  const input = document.getElementById("userSearch");
+  if (!input) return;
+  input.addEventListener("input", () => {
+    clearTimeout(userSearchTimer);
+    userSearchTimer = setTimeout(() => {
+      usersSearch = input.value.trim();
+      usersPage = 1;
+      loadAllUsers();
+    }, 250);
+  });
+}
+
+function renderUsersPagination() {
+  const container = document.getElementById("usersPaginationControls");
+  if (!container) return;
+
+  if ((usersMeta.total_pages || 0) <= 1) {
+    container.innerHTML = "";
+    return;
+  }
+
+  container.innerHTML = `
+        <div class="text-sm text-gray-600">
+            <span class="font-semibold">${usersMeta.total_items}</span> users
+        </div>
+        <div class="flex items-center gap-3">
+            <button class="px-4 py-2 rounded-lg border text-sm ${
+              usersMeta.has_prev
+                ? "text-gray-700 hover:bg-gray-100"
+                : "text-gray-400 cursor-not-allowed"
+            }"
+                ${
+                  usersMeta.has_prev
+                    ? `onclick="changeUsersPage(${usersPage - 1})"`
+                    : "disabled"
+                }>
+                Previous
+            </button>
+            <span class="text-sm text-gray-600">Page ${usersPage} of ${usersMeta.total_pages}</span>
+            <button class="px-4 py-2 rounded-lg border text-sm ${
+              usersMeta.has_next
+                ? "text-gray-700 hover:bg-gray-100"
+                : "text-gray-400 cursor-not-allowed"
+            }"
+                ${
+                  usersMeta.has_next
+                    ? `onclick="changeUsersPage(${usersPage + 1})"`
+                    : "disabled"
+                }>
+                Next
+            </button>
+        </div>
+    `;
+}
+
 // Render users table
 function renderUsersTable() {
   const tbody = document.getElementById("usersTableBody");
@@ -0,0 +1,164 @@
+"""
+API benchmark suite.
+Seeds a throwaway SQLite database at each dataset size and drives the app
+through the Flask test client, reporting latency percentiles, SQL statements
+per request (from the Server-Timing header) and rows serialized per second.
+Usage: python benchmarks/bench_api.py [--sizes 1000,10000,100000] [--iterations 30]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+SERVER_TIMING = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+ROW_KEYS = ('tasks', 'comments', 'users')
+
+
+def make_config(database_path, response_cache):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database_path}'
+        SQLALCHEMY_ECHO = False
+        CREATE_TABLES = True
+        METRICS_ENABLED = True
+        METRICS_TOKEN = None
+        USER_CACHE_BACKEND = 'memory'
+        # With the cache off every GET runs its view; otherwise repeats are cache hits
+        RESPONSE_CACHE_SIZE = 512 if response_cache else 0
+    return BenchConfig
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def count_rows(payload):
+    return sum(len(payload.get(key) or []) for key in ROW_KEYS) if isinstance(payload, dict) else 0
+
+
+def measure(client, method, url, iterations, **kwargs):
+    """Run one request ``iterations`` times (after a warm-up) and summarize it"""
+    getattr(client, method)(url, **kwargs)
+    latencies, queries, db_times, rows = [], [], [], 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = getattr(client, method)(url, **kwargs)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            raise RuntimeError(f'{method.upper()} {url} returned {response.status_code}')
+        timing = SERVER_TIMING.search(response.headers.get('Server-Timing', ''))
+        if timing:
+            db_times.append(float(timing.group(1)))
+            queries.append(int(timing.group(2)))
+        rows += count_rows(response.get_json(silent=True))
+    total = sum(latencies)
+    return {
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': max(latencies) * 1000,
+        'sql': statistics.mean(queries) if queries else 0,
+        'db_ms': statistics.mean(db_times) if db_times else 0,
+        'rows': rows / iterations,
+        'rows_per_s': rows / total if total else 0,
+    }
+
+
+def login(client, email, password):
+    response = client.post('/login', json={'email': email, 'password': password})
+    if response.status_code != 200:
+        raise RuntimeError(f'Login failed for {email}')
+
+
+def scenarios(first_ids):
+    """(name, role, method, url, kwargs) for every benchmarked request"""
+    from app.services.seeding import SEED_PASSWORD
+    from app.services.task_queries import SORT_FIELDS
+
+    busiest_task = first_ids['tasks']  # seeded comments cluster on the oldest tasks
+    credentials = {'email': f'dev{first_ids["users"] + 1}@seed.local', 'password': SEED_PASSWORD}
+    yield 'login', None, 'post', '/login', {'json': credentials}
+    for role in ('admin', 'developer'):
+        for sort_by in SORT_FIELDS:
+            yield f'tasks sort={sort_by}', role, 'get', f'/api/tasks?sort_by={sort_by}&per_page=50', {}
+            yield f'tasks sort={sort_by} page=20', role, 'get', f'/api/tasks?sort_by={sort_by}&per_page=50&page=20', {}
+            yield f'tasks sort={sort_by} cursor', role, 'get', f'/api/tasks?sort_by={sort_by}&per_page=50&mode=cursor', {}
+        yield 'dashboard stats', role, 'get', '/api/dashboard/stats', {}
+    yield 'dashboard stats by assignee', 'admin', 'get', '/api/dashboard/stats?group_by=assignee', {}
+    yield 'comments', 'admin', 'get', f'/api/tasks/{busiest_task}/comments?limit=50', {}
+    yield 'users', 'admin', 'get', '/api/users', {}
+
+
+def run_size(size, args):
+    from app import create_app
+    from app.services.seeding import SEED_PASSWORD, seed_database
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app(make_config(os.path.join(directory, 'bench.db'), args.response_cache))
+        with app.app_context():
+            started = time.perf_counter()
+            first_ids = seed_database(
+                max(2, size // 1000), size, size * args.comments_per_task, seed=args.seed
+            )
+            print(f'\nSeeded {size:,} tasks in {time.perf_counter() - started:.1f}s')
+
+        accounts = {
+            'admin': f'admin{first_ids["users"]}@seed.local',
+            # The first developer has the largest share of the tasks
+            'developer': f'dev{first_ids["users"] + 1}@seed.local',
+        }
+        clients = {}
+        for role, email in accounts.items():
+            clients[role] = app.test_client()
+            login(clients[role], email, SEED_PASSWORD)
+
+        results = []
+        for name, role, method, url, kwargs in scenarios(first_ids):
+            if args.only and not re.search(args.only, name):
+                continue
+            client = clients[role] if role else app.test_client()
+            iterations = max(3, args.iterations // 5) if name == 'login' else args.iterations
+            result = measure(client, method, url, iterations, **kwargs)
+            result.update(size=size, scenario=name, role=role or '-')
+            results.append(result)
+            print(
+                f'{name:<30} {role or "-":<10} {result["p50_ms"]:8.2f} {result["p95_ms"]:8.2f} '
+                f'{result["p99_ms"]:8.2f} {result["sql"]:5.1f} {result["db_ms"]:7.2f} '
+                f'{result["rows"]:6.0f} {result["rows_per_s"]:10,.0f}'
+            )
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Comma-separated task counts')
+    parser.add_argument('--iterations', type=int, default=30, help='Requests per scenario')
+    parser.add_argument('--comments-per-task', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--only', help='Regex selecting scenarios by name')
+    parser.add_argument('--response-cache', action='store_true', help='Keep the ETag body cache on')
+    parser.add_argument('--json', dest='json_path', help='Also write the results to this file')
+    args = parser.parse_args()
+
+    print(f'{"scenario":<30} {"role":<10} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} '
+          f'{"sql":>5} {"db ms":>7} {"rows":>6} {"rows/s":>10}')
+    results = []
+    for size in (int(value) for value in args.sizes.split(',')):
+        results.extend(run_size(size, args))
+
+    if args.json_path:
+        with open(args.json_path, 'w') as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+JSON encoding and compression benchmark.
+Serializes a realistic /api/tasks page with the stdlib and orjson providers,
+then compresses it with each available encoding, reporting bytes and CPU time.
+Usage: python benchmarks/bench_json.py [--rows 50] [--repeat 2000]
+"""
+
+import argparse
+import gzip
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from app.services.compression import brotli
+from app.services.json_provider import IsoJSONProvider, OrjsonProvider, orjson
+
+WORDS = ('api', 'dashboard', 'login', 'export', 'report', 'users', 'cache', 'query', 'page',
+         'timeout', 'retry', 'deploy', 'review', 'migration', 'index', 'stats', 'email', 'error')
+
+
+def task_page(rows, rng):
+    """Task dicts shaped like Task.to_dict(), with free-text descriptions"""
+    now = datetime.utcnow()
+    page = []
+    for task_id in range(1, rows + 1):
+        created_at = now - timedelta(seconds=rng.randint(0, 365 * 86400), microseconds=rng.randint(0, 999999))
+        page.append({
+            'id': task_id,
+            'title': f'Fix {rng.choice(WORDS)} {rng.choice(WORDS)} #{task_id}',
+            'description': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(10, 60))),
+            'assigned_to': rng.randint(2, 40),
+            'assigned_to_name': f'Developer {rng.randint(2, 40)}',
+            'priority': rng.choice(('Low', 'Medium', 'High')),
+            'status': rng.choice(('Pending', 'In Progress', 'Completed', 'On Hold')),
+            'start_date': created_at.date(),
+            'due_date': created_at.date() + timedelta(days=rng.randint(3, 60)) if rng.random() > 0.15 else None,
+            'created_by': 1,
+            'created_by_name': 'Admin User',
+            'created_at': created_at,
+            'updated_at': created_at + timedelta(hours=rng.randint(0, 500)),
+            'is_overdue': False,
+        })
+    return {'success': True, 'tasks': page, 'meta': {'page': 1, 'per_page': rows, 'total_pages': 1,
+                                                   'total_items': rows, 'has_next': False, 'has_prev': False}}
+
+
+def timed(function, repeat):
+    started = time.process_time()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.process_time() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    app = Flask('bench')
+    payload = task_page(args.rows, random.Random(1))
+
+    print(f'{"encoder":<24} {"bytes":>8} {"cpu us":>9}')
+    providers = [('stdlib json', IsoJSONProvider(app))]
+    if orjson is not None:
+        providers.append(('orjson', OrjsonProvider(app)))
+    else:
+        print('(orjson not installed; pip install orjson to compare)')
+    for name, provider in providers:
+        body, cpu = timed(lambda: provider.response(payload).get_data(), args.repeat)
+        print(f'{name:<24} {len(body):>8,} {cpu:>9.1f}')
+
+    print(f'\n{"compression":<24} {"bytes":>8} {"cpu us":>9} {"saved":>7}')
+    codecs = [(f'gzip -{level}', lambda data, level=level: gzip.compress(data, compresslevel=level, mtime=0))
+              for level in (1, 6, 9)]
+    if brotli is not None:
+        codecs += [(f'brotli q{quality}', lambda data, quality=quality: brotli.compress(data, quality=quality))
+                   for quality in (4, 6, 11)]
+    else:
+        print('(brotli not installed; pip install brotli to compare)')
+    for name, codec in codecs:
+        compressed, cpu = timed(lambda: codec(body), max(1, args.repeat // 4))
+        print(f'{name:<24} {len(compressed):>8,} {cpu:>9.1f} {1 - len(compressed) / len(body):>6.0%}')
+
+
+if __name__ == '__main__':
+    main()
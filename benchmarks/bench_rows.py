@@ -0,0 +1,100 @@
+"""
+Task list read-path benchmark.
+Loads and serializes the same task listing through the ORM path
+(Task instances + serialize_tasks) and through the row path used by the
+list endpoints (task_row_query + serialize_task_rows), reporting CPU time
+and peak Python memory per row.
+Usage: python benchmarks/bench_rows.py [--rows 50,500,5000] [--repeat 20]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+
+def make_config(database_path):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database_path}'
+        SQLALCHEMY_ECHO = False
+        CREATE_TABLES = True
+        METRICS_ENABLED = False
+    return BenchConfig
+
+
+def orm_path(query, rows):
+    from app import db
+    from app.services.serializers import serialize_tasks
+
+    payload = serialize_tasks(query.limit(rows).all())
+    db.session.expunge_all()
+    return payload
+
+
+def row_path(query, rows):
+    from app.services.serializers import serialize_task_rows
+    from app.services.task_queries import task_row_query
+
+    return serialize_task_rows(task_row_query(query).limit(rows).all())
+
+
+def measure(path, query, rows, repeat):
+    """Best CPU time and peak traced memory of ``path`` over ``repeat`` runs"""
+    path(query, rows)  # warm-up: statement cache, page cache
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started = time.process_time()
+        payload = path(query, rows)
+        best = min(best, time.process_time() - started)
+    assert len(payload) == rows, f'expected {rows} rows, got {len(payload)}'
+
+    gc.collect()
+    tracemalloc.start()
+    path(query, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='50,500,5000', help='Comma-separated row counts')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per measurement (best is kept)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    sizes = [int(value) for value in args.rows.split(',')]
+
+    from app import create_app
+    from app.services.seeding import seed_database
+    from app.services.task_queries import apply_sort, scoped_task_query
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app(make_config(os.path.join(directory, 'bench.db')))
+        with app.app_context():
+            seed_database(20, max(sizes), 0, seed=args.seed)
+            admin = SimpleNamespace(role='admin', id=None)
+            query = apply_sort(scoped_task_query(admin), 'created_at', 'desc')
+
+            print(f'{"rows":>6} {"path":<5} {"cpu ms":>8} {"us/row":>8} {"peak KB":>9} {"B/row":>7}')
+            for rows in sizes:
+                results = {}
+                for name, path in (('orm', orm_path), ('row', row_path)):
+                    cpu, peak = measure(path, query, rows, args.repeat)
+                    results[name] = (cpu, peak)
+                    print(f'{rows:>6} {name:<5} {cpu * 1000:8.2f} {cpu / rows * 1e6:8.1f} '
+                          f'{peak / 1024:9.0f} {peak / rows:7.0f}')
+                (orm_cpu, orm_peak), (row_cpu, row_peak) = results['orm'], results['row']
+                print(f'{"":>6} row path: {orm_cpu / row_cpu:.1f}x less CPU, {orm_peak / row_peak:.1f}x less memory')
+
+
+if __name__ == '__main__':
+    main()
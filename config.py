@@ -3,10 +3,84 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _engine_options():
+    """Connection pool settings; pool sizes are only passed when set"""
+    options = {
+        # Test connections on checkout and recycle them before MySQL's
+        # wait_timeout closes them, so the first request after a quiet
+        # period doesn't fail
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'True').lower() == 'true',
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 280)),
+    }
+    for option, variable in (('pool_size', 'DB_POOL_SIZE'), ('max_overflow', 'DB_MAX_OVERFLOW'),
+                             ('pool_timeout', 'DB_POOL_TIMEOUT')):
+        if os.environ.get(variable):
+            options[option] = int(os.environ[variable])
+    if os.environ.get('DB_CONNECT_TIMEOUT'):
+        options['connect_args'] = {'connect_timeout': int(os.environ['DB_CONNECT_TIMEOUT'])}
+    return options
+
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f"mysql+pymysql://{os.environ.get('DB_USER', 'root')}:{os.environ.get('DB_PASSWORD', '')}@{os.environ.get('DB_HOST', 'localhost')}/{os.environ.get('DB_NAME', 'workflow_manager')}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = os.environ.get('SQLALCHEMY_ECHO', 'False').lower() == 'true'
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options()
+
+    # Optional read replica for the read-only list/stats endpoints. Users who
+    # just wrote something read from the primary for REPLICA_STICKY_SECONDS
+    SQLALCHEMY_BINDS = {'replica': os.environ['DATABASE_REPLICA_URL']} if os.environ.get('DATABASE_REPLICA_URL') else {}
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+
+    # Cache for the per-request Flask-Login user lookup.
+    # Backends: memory (per process), redis (shared by all workers), none
+    USER_CACHE_BACKEND = os.environ.get('USER_CACHE_BACKEND', 'memory')
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 60))
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 1024))
+    USER_CACHE_REDIS_URL = os.environ.get('USER_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+    # Max serialized JSON responses kept per process for ETag-validated endpoints
+    RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 512))
+
+    # Per-request timing (Server-Timing header) and the Prometheus /metrics endpoint.
+    # Scrapes of /metrics must send "Authorization: Bearer <METRICS_TOKEN>"; unset, it 404s outside debug
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+    # Live updates over /api/events (server-sent events).
+    # Backends: memory (single process), redis (all gunicorn workers), none
+    EVENTS_BACKEND = os.environ.get('EVENTS_BACKEND', 'memory')
+    EVENTS_REDIS_URL = os.environ.get('EVENTS_REDIS_URL', 'redis://localhost:6379/0')
+    EVENTS_HEARTBEAT = int(os.environ.get('EVENTS_HEARTBEAT', 15))
+    EVENTS_QUEUE_SIZE = int(os.environ.get('EVENTS_QUEUE_SIZE', 100))
+
+    # Password hashing blocks the request thread; beyond PASSWORD_HASH_MAX_PENDING
+    # hashes in progress a login gets a fast 503. PASSWORD_HASH_METHOD is a
+    # full werkzeug method string; older hashes are upgraded on the next login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 16))
+
+    # Failed login limits per email and per client IP within the window (seconds).
+    # Backends: memory (per process), redis (shared by all workers)
+    LOGIN_THROTTLE_BACKEND = os.environ.get('LOGIN_THROTTLE_BACKEND', 'memory')
+    LOGIN_THROTTLE_REDIS_URL = os.environ.get('LOGIN_THROTTLE_REDIS_URL', 'redis://localhost:6379/0')
+    LOGIN_MAX_ATTEMPTS_PER_EMAIL = int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_EMAIL', 5))
+    LOGIN_MAX_ATTEMPTS_PER_IP = int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_IP', 50))
+    LOGIN_ATTEMPT_WINDOW = int(os.environ.get('LOGIN_ATTEMPT_WINDOW', 300))
+
+    # JSON provider: auto (orjson when installed), orjson, stdlib
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'auto')
+
+    # Response compression (brotli when installed, else gzip) for bodies of at least COMPRESS_MIN_SIZE bytes
+    COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'True').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', 3))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
 
+    # Flip tasks.is_overdue in-process after the first API write of each day;
+    # turn off when `flask overdue rollover` runs from cron instead
+    OVERDUE_AUTO_ROLLOVER = os.environ.get('OVERDUE_AUTO_ROLLOVER', 'True').lower() == 'true'
@@ -0,0 +1,26 @@
+"""index comments by task and creation time
+
+Revision ID: 5d3f8b2c7e94
+Revises: e2a7c4d81f35
+Create Date: 2026-10-17 13:48:51.207733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d3f8b2c7e94'
+down_revision = 'e2a7c4d81f35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index('ix_comments_task_created_at', ['task_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_comments_task_created_at')
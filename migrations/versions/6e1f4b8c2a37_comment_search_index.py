@@ -0,0 +1,57 @@
+"""full-text search index on comments
+
+Revision ID: 6e1f4b8c2a37
+Revises: a3e5c8f0d914
+Create Date: 2026-10-17 18:41:09.215730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e1f4b8c2a37'
+down_revision = 'a3e5c8f0d914'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.execute('CREATE FULLTEXT INDEX ix_comments_fulltext ON comments (comment_text)')
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE comments_fts USING fts5("
+            "comment_text, content='comments', content_rowid='id')"
+        )
+        op.execute(
+            "CREATE TRIGGER comments_fts_ai AFTER INSERT ON comments BEGIN "
+            "INSERT INTO comments_fts(rowid, comment_text) VALUES (new.id, new.comment_text); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER comments_fts_ad AFTER DELETE ON comments BEGIN "
+            "INSERT INTO comments_fts(comments_fts, rowid, comment_text) "
+            "VALUES ('delete', old.id, old.comment_text); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER comments_fts_au AFTER UPDATE OF comment_text ON comments BEGIN "
+            "INSERT INTO comments_fts(comments_fts, rowid, comment_text) "
+            "VALUES ('delete', old.id, old.comment_text); "
+            "INSERT INTO comments_fts(rowid, comment_text) VALUES (new.id, new.comment_text); "
+            "END"
+        )
+        op.execute("INSERT INTO comments_fts(comments_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.execute('DROP INDEX ix_comments_fulltext ON comments')
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS comments_fts_au')
+        op.execute('DROP TRIGGER IF EXISTS comments_fts_ad')
+        op.execute('DROP TRIGGER IF EXISTS comments_fts_ai')
+        op.execute('DROP TABLE IF EXISTS comments_fts')
@@ -0,0 +1,57 @@
+"""full-text search index on tasks
+
+Revision ID: 7a4c9e2b1d58
+Revises: 5d3f8b2c7e94
+Create Date: 2026-10-17 15:02:37.481905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a4c9e2b1d58'
+down_revision = '5d3f8b2c7e94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.execute('CREATE FULLTEXT INDEX ix_tasks_fulltext ON tasks (title, description)')
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+            "title, description, content='tasks', content_rowid='id')"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+            "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+            "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+            "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); "
+            "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); "
+            "END"
+        )
+        op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.execute('DROP INDEX ix_tasks_fulltext ON tasks')
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS tasks_fts_au')
+        op.execute('DROP TRIGGER IF EXISTS tasks_fts_ad')
+        op.execute('DROP TRIGGER IF EXISTS tasks_fts_ai')
+        op.execute('DROP TABLE IF EXISTS tasks_fts')
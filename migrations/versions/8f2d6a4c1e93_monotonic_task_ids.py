@@ -0,0 +1,83 @@
+"""never reuse task and comment ids
+
+Revision ID: 8f2d6a4c1e93
+Revises: 6e1f4b8c2a37
+Create Date: 2026-10-17 21:12:48.530617
+
+Archived tasks and comments keep their ids, so a new row must never get
+the id of one that was archived or deleted. SQLite only guarantees that
+for AUTOINCREMENT tables, which means rebuilding both tables (and the
+indexes and full-text triggers on them). InnoDB already hands out
+increasing ids; see the README for MySQL before 8.0.
+
+"""
+import re
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8f2d6a4c1e93'
+down_revision = '6e1f4b8c2a37'
+branch_labels = None
+depends_on = None
+
+TABLES = (('tasks', 'tasks_archive'), ('comments', 'comments_archive'))
+
+
+def _rebuild(bind, source, archive, autoincrement):
+    """Recreate ``source`` with or without AUTOINCREMENT, keeping rows, indexes and triggers
+
+    Done by hand (SQLite's documented table rebuild) because batch mode's
+    reflection garbles the generated columns on ``tasks``.
+    """
+    schema = bind.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (source,)
+    ).scalar()
+    if autoincrement:
+        schema = re.sub(r'\bid INTEGER NOT NULL,', 'id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,', schema, count=1)
+        schema = re.sub(r'\s*PRIMARY KEY \(id\),', '', schema, count=1)
+    else:
+        schema = schema.replace('id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,', 'id INTEGER NOT NULL,', 1)
+        schema = re.sub(r',(\s*)(FOREIGN KEY)', r',\1PRIMARY KEY (id),\1\2', schema, count=1)
+    schema = re.sub(rf'^CREATE TABLE "?{source}"?', f'CREATE TABLE _rebuild_{source}', schema)
+    dependents = bind.exec_driver_sql(
+        "SELECT type, name, sql FROM sqlite_master "
+        "WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL", (source,)
+    ).all()
+    # Generated columns (hidden 2 and 3) are recomputed, not copied
+    columns = ', '.join(
+        row[1] for row in bind.exec_driver_sql(f'PRAGMA table_xinfo({source})') if row[6] not in (2, 3)
+    )
+
+    for kind, name, _ in dependents:
+        bind.exec_driver_sql(f'DROP {kind.upper()} {name}')
+    bind.exec_driver_sql(schema)
+    bind.exec_driver_sql(f'INSERT INTO _rebuild_{source} ({columns}) SELECT {columns} FROM {source}')
+    bind.exec_driver_sql(f'DROP TABLE {source}')
+    bind.exec_driver_sql(f'ALTER TABLE _rebuild_{source} RENAME TO {source}')
+    for _, _, sql in dependents:
+        bind.exec_driver_sql(sql)
+
+    if autoincrement:
+        # Start the sequence above every id handed out so far, archived ones included
+        highest = bind.exec_driver_sql(
+            f'SELECT max(id) FROM (SELECT max(id) AS id FROM {source} UNION ALL SELECT max(id) FROM {archive})'
+        ).scalar()
+        bind.exec_driver_sql('DELETE FROM sqlite_sequence WHERE name = ?', (source,))
+        if highest is not None:
+            bind.exec_driver_sql('INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)', (source, highest))
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for source, archive in TABLES:
+            _rebuild(bind, source, archive, autoincrement=True)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for source, archive in TABLES:
+            _rebuild(bind, source, archive, autoincrement=False)
@@ -0,0 +1,57 @@
+"""task list sort keys and indexes
+
+Revision ID: 9b7e3a51c6d2
+Revises: 4c1d2e8f9a01
+Create Date: 2026-10-17 10:03:27.551930
+
+Adds generated ``status_rank`` / ``due_date_missing`` sort keys and one
+index per /api/tasks sort mode, unscoped and scoped by assignee.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b7e3a51c6d2'
+down_revision = '4c1d2e8f9a01'
+branch_labels = None
+depends_on = None
+
+STATUS_RANK_SQL = (
+    "CASE status WHEN 'Pending' THEN 1 WHEN 'In Progress' THEN 2 "
+    "WHEN 'On Hold' THEN 3 WHEN 'Completed' THEN 4 ELSE 5 END"
+)
+
+
+def upgrade():
+    op.add_column('tasks', sa.Column('status_rank', sa.SmallInteger(), sa.Computed(STATUS_RANK_SQL, persisted=False), nullable=True))
+    op.add_column('tasks', sa.Column('due_date_missing', sa.Boolean(), sa.Computed('due_date IS NULL', persisted=False), nullable=True))
+
+    op.create_index('ix_tasks_created_at', 'tasks', ['created_at'], unique=False)
+    op.create_index('ix_tasks_assignee_created_at', 'tasks', ['assigned_to', 'created_at'], unique=False)
+    op.create_index('ix_tasks_due_date', 'tasks', ['due_date_missing', 'due_date'], unique=False)
+    op.create_index('ix_tasks_due_date_desc', 'tasks', [sa.text('due_date_missing DESC'), 'due_date'], unique=False)
+    op.create_index('ix_tasks_assignee_due_date', 'tasks', ['assigned_to', 'due_date_missing', 'due_date'], unique=False)
+    op.create_index('ix_tasks_assignee_due_date_desc', 'tasks', ['assigned_to', sa.text('due_date_missing DESC'), 'due_date'], unique=False)
+    op.create_index('ix_tasks_status_rank', 'tasks', ['status_rank', 'updated_at'], unique=False)
+    op.create_index('ix_tasks_status_rank_desc', 'tasks', [sa.text('status_rank DESC'), 'updated_at'], unique=False)
+    op.create_index('ix_tasks_assignee_status_rank', 'tasks', ['assigned_to', 'status_rank', 'updated_at'], unique=False)
+    op.create_index('ix_tasks_assignee_status_rank_desc', 'tasks', ['assigned_to', sa.text('status_rank DESC'), 'updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tasks_assignee_status_rank_desc', table_name='tasks')
+    op.drop_index('ix_tasks_assignee_status_rank', table_name='tasks')
+    op.drop_index('ix_tasks_status_rank_desc', table_name='tasks')
+    op.drop_index('ix_tasks_status_rank', table_name='tasks')
+    op.drop_index('ix_tasks_assignee_due_date_desc', table_name='tasks')
+    op.drop_index('ix_tasks_assignee_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_due_date_desc', table_name='tasks')
+    op.drop_index('ix_tasks_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_assignee_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_created_at', table_name='tasks')
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_column('due_date_missing')
+        batch_op.drop_column('status_rank')
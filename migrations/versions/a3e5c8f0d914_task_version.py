@@ -0,0 +1,32 @@
+"""task version column for optimistic concurrency
+
+Revision ID: a3e5c8f0d914
+Revises: f1b9c3d7e502
+Create Date: 2026-10-17 21:42:09.318204
+
+Adds ``tasks.version`` (and its tasks_archive copy), bumped by every user
+edit so stale writes to a task can be rejected with 409. Existing tasks
+start at version 1.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3e5c8f0d914'
+down_revision = 'f1b9c3d7e502'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('tasks', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('tasks_archive', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    # Plain DROP COLUMN rather than batch copies, so SQLite keeps the
+    # tasks_fts triggers on the table
+    op.drop_column('tasks_archive', 'version')
+    op.drop_column('tasks', 'version')
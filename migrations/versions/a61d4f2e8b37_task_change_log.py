@@ -0,0 +1,59 @@
+"""hand out change sequence numbers from an auto-increment table
+
+Revision ID: a61d4f2e8b37
+Revises: 8f2d6a4c1e93
+Create Date: 2026-10-17 23:04:12.318406
+
+Every task write used to increment the ``task_changes`` data_versions row
+and hold its lock until commit. The numbers now come from the
+auto-increment task_changes table, starting after the last one handed
+out, so outstanding delta-sync tokens stay valid.
+
+"""
+from datetime import datetime, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a61d4f2e8b37'
+down_revision = '8f2d6a4c1e93'
+branch_labels = None
+depends_on = None
+
+SEQ_SCOPE = 'task_changes'
+
+
+def upgrade():
+    changes = op.create_table('task_changes',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_task_changes_created_at', 'task_changes', ['created_at'], unique=False)
+
+    bind = op.get_bind()
+    last = bind.execute(
+        sa.text('SELECT version FROM data_versions WHERE scope = :scope'), {'scope': SEQ_SCOPE}
+    ).scalar()
+    if last:
+        # Old enough that readers treat it as committed straight away
+        op.bulk_insert(changes, [{'id': last, 'created_at': datetime.utcnow() - timedelta(days=1)}])
+    bind.execute(sa.text('DELETE FROM data_versions WHERE scope = :scope'), {'scope': SEQ_SCOPE})
+
+
+def downgrade():
+    bind = op.get_bind()
+    last = bind.execute(sa.text('SELECT max(id) FROM task_changes')).scalar()
+    if last:
+        bind.execute(
+            sa.text('INSERT INTO data_versions (scope, version) VALUES (:scope, :version)'),
+            {'scope': SEQ_SCOPE, 'version': last}
+        )
+    # The global row was not bumped while this revision was applied
+    bind.execute(sa.text("UPDATE data_versions SET version = version + 1 WHERE scope = 'tasks'"))
+
+    op.drop_index('ix_task_changes_created_at', table_name='task_changes')
+    op.drop_table('task_changes')
@@ -0,0 +1,47 @@
+"""stored overdue flag on tasks
+
+Revision ID: b3e6f1a9c240
+Revises: 7a4c9e2b1d58
+Create Date: 2026-10-17 16:41:09.218734
+
+Adds ``tasks.is_overdue``, filled in for today, and the indexes behind the
+overdue counters and the ``overdue=1`` list filter. The flag is kept
+current by app.services.task_overdue.
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e6f1a9c240'
+down_revision = '7a4c9e2b1d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('tasks', sa.Column('is_overdue', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    tasks = sa.table('tasks', sa.column('is_overdue', sa.Boolean()), sa.column('status', sa.String()),
+                     sa.column('due_date', sa.Date()))
+    op.execute(
+        tasks.update()
+        .where(tasks.c.status != 'Completed', tasks.c.due_date < date.today())
+        .values(is_overdue=True)
+    )
+
+    op.create_index('ix_tasks_overdue_assignee', 'tasks', ['is_overdue', 'assigned_to', 'created_at'], unique=False)
+    op.create_index('ix_tasks_overdue_created_at', 'tasks', ['is_overdue', 'created_at'], unique=False)
+    op.create_index('ix_tasks_overdue_due_date', 'tasks', ['is_overdue', 'due_date_missing', 'due_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tasks_overdue_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_overdue_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_overdue_assignee', table_name='tasks')
+    # A plain DROP COLUMN rather than a batch copy, so SQLite keeps the
+    # tasks_fts triggers on the table
+    op.drop_column('tasks', 'is_overdue')
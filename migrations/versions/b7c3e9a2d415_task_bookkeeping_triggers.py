@@ -0,0 +1,115 @@
+"""maintain task_counters and the task data versions with triggers
+
+Revision ID: b7c3e9a2d415
+Revises: a61d4f2e8b37
+Create Date: 2026-10-17 23:41:55.902174
+
+The ORM flush hooks and every Core task write used to update
+task_counters and the ``tasks:<assignee id>`` data versions themselves,
+which cost a status change a read plus several writes. Triggers on
+``tasks`` now do it inside the statement that changes the row. The
+counters are rebuilt once so they start out exact. On MySQL, creating
+triggers needs the TRIGGER privilege (and SUPER, or
+log_bin_trust_function_creators, when binary logging is on).
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c3e9a2d415'
+down_revision = 'a61d4f2e8b37'
+branch_labels = None
+depends_on = None
+
+TRIGGERS = ('tasks_bookkeeping_ai', 'tasks_bookkeeping_ad', 'tasks_bookkeeping_au')
+
+SQLITE_TRIGGERS = (
+    """CREATE TRIGGER tasks_bookkeeping_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (coalesce(new.assigned_to, 0), new.status, new.priority, 1)
+        ON CONFLICT (assignee_id, status, priority) DO UPDATE SET task_count = task_count + 1;
+        INSERT INTO data_versions (scope, version) VALUES ('tasks:' || coalesce(new.assigned_to, 0), 1)
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    END""",
+    """CREATE TRIGGER tasks_bookkeeping_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (coalesce(old.assigned_to, 0), old.status, old.priority, -1)
+        ON CONFLICT (assignee_id, status, priority) DO UPDATE SET task_count = task_count - 1;
+        INSERT INTO data_versions (scope, version) VALUES ('tasks:' || coalesce(old.assigned_to, 0), 1)
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    END""",
+    # Both counter keys, and both assignee scopes when reassigned, in key order
+    """CREATE TRIGGER tasks_bookkeeping_au AFTER UPDATE ON tasks BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        SELECT coalesce(old.assigned_to, 0), old.status, old.priority, -1
+        WHERE old.assigned_to IS NOT new.assigned_to OR old.status != new.status OR old.priority != new.priority
+        UNION ALL
+        SELECT coalesce(new.assigned_to, 0), new.status, new.priority, 1
+        WHERE old.assigned_to IS NOT new.assigned_to OR old.status != new.status OR old.priority != new.priority
+        ORDER BY 1, 2, 3
+        ON CONFLICT (assignee_id, status, priority) DO UPDATE SET task_count = task_count + excluded.task_count;
+        INSERT INTO data_versions (scope, version)
+        SELECT 'tasks:' || coalesce(old.assigned_to, 0), 1
+        UNION
+        SELECT 'tasks:' || coalesce(new.assigned_to, 0), 1
+        ORDER BY 1
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    END""",
+)
+
+MYSQL_TRIGGERS = (
+    """CREATE TRIGGER tasks_bookkeeping_ai AFTER INSERT ON tasks FOR EACH ROW BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (COALESCE(NEW.assigned_to, 0), NEW.status, NEW.priority, 1)
+        ON DUPLICATE KEY UPDATE task_count = task_count + 1;
+        INSERT INTO data_versions (scope, version) VALUES (CONCAT('tasks:', COALESCE(NEW.assigned_to, 0)), 1)
+        ON DUPLICATE KEY UPDATE version = version + 1;
+    END""",
+    """CREATE TRIGGER tasks_bookkeeping_ad AFTER DELETE ON tasks FOR EACH ROW BEGIN
+        INSERT INTO task_counters (assignee_id, status, priority, task_count)
+        VALUES (COALESCE(OLD.assigned_to, 0), OLD.status, OLD.priority, -1)
+        ON DUPLICATE KEY UPDATE task_count = task_count - 1;
+        INSERT INTO data_versions (scope, version) VALUES (CONCAT('tasks:', COALESCE(OLD.assigned_to, 0)), 1)
+        ON DUPLICATE KEY UPDATE version = version + 1;
+    END""",
+    """CREATE TRIGGER tasks_bookkeeping_au AFTER UPDATE ON tasks FOR EACH ROW BEGIN
+        IF NOT (OLD.assigned_to <=> NEW.assigned_to) OR OLD.status <> NEW.status OR OLD.priority <> NEW.priority THEN
+            INSERT INTO task_counters (assignee_id, status, priority, task_count)
+            SELECT * FROM (
+                SELECT COALESCE(OLD.assigned_to, 0) AS assignee_id, OLD.status AS status,
+                       OLD.priority AS priority, -1 AS task_count
+                UNION ALL
+                SELECT COALESCE(NEW.assigned_to, 0), NEW.status, NEW.priority, 1
+            ) AS changed
+            ORDER BY assignee_id, status, priority
+            ON DUPLICATE KEY UPDATE task_count = task_counters.task_count + VALUES(task_count);
+        END IF;
+        INSERT INTO data_versions (scope, version)
+        SELECT scope, 1 FROM (
+            SELECT CONCAT('tasks:', COALESCE(OLD.assigned_to, 0)) AS scope
+            UNION
+            SELECT CONCAT('tasks:', COALESCE(NEW.assigned_to, 0))
+        ) AS touched
+        ORDER BY scope
+        ON DUPLICATE KEY UPDATE version = data_versions.version + 1;
+    END""",
+)
+
+DIALECT_TRIGGERS = {'sqlite': SQLITE_TRIGGERS, 'mysql': MYSQL_TRIGGERS}
+
+
+def upgrade():
+    for statement in DIALECT_TRIGGERS.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
+    op.execute('DELETE FROM task_counters')
+    op.execute(
+        'INSERT INTO task_counters (assignee_id, status, priority, task_count) '
+        'SELECT COALESCE(assigned_to, 0), status, priority, COUNT(*) FROM tasks '
+        'GROUP BY COALESCE(assigned_to, 0), status, priority'
+    )
+
+
+def downgrade():
+    for name in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name}')
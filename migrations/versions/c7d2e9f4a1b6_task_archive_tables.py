@@ -0,0 +1,87 @@
+"""task and comment archive tables
+
+Revision ID: c7d2e9f4a1b6
+Revises: b3e6f1a9c240
+Create Date: 2026-10-17 17:52:44.610382
+
+Cold storage for ``flask archive``. tasks_archive carries the same
+generated sort keys and list indexes as tasks so include_archived=1
+lists page through it the same way.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e9f4a1b6'
+down_revision = 'b3e6f1a9c240'
+branch_labels = None
+depends_on = None
+
+STATUS_RANK_SQL = (
+    "CASE status WHEN 'Pending' THEN 1 WHEN 'In Progress' THEN 2 "
+    "WHEN 'On Hold' THEN 3 WHEN 'Completed' THEN 4 ELSE 5 END"
+)
+
+
+def upgrade():
+    op.create_table('tasks_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('assigned_to', sa.Integer(), nullable=True),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('is_overdue', sa.Boolean(), server_default=sa.false(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('status_rank', sa.SmallInteger(), sa.Computed(STATUS_RANK_SQL, persisted=False), nullable=True),
+    sa.Column('due_date_missing', sa.Boolean(), sa.Computed('due_date IS NULL', persisted=False), nullable=True),
+    sa.ForeignKeyConstraint(['assigned_to'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tasks_archive_created_at', 'tasks_archive', ['created_at'], unique=False)
+    op.create_index('ix_tasks_archive_assignee_created_at', 'tasks_archive', ['assigned_to', 'created_at'], unique=False)
+    op.create_index('ix_tasks_archive_due_date', 'tasks_archive', ['due_date_missing', 'due_date'], unique=False)
+    op.create_index('ix_tasks_archive_due_date_desc', 'tasks_archive', [sa.text('due_date_missing DESC'), 'due_date'], unique=False)
+    op.create_index('ix_tasks_archive_assignee_due_date', 'tasks_archive', ['assigned_to', 'due_date_missing', 'due_date'], unique=False)
+    op.create_index('ix_tasks_archive_assignee_due_date_desc', 'tasks_archive', ['assigned_to', sa.text('due_date_missing DESC'), 'due_date'], unique=False)
+    op.create_index('ix_tasks_archive_status_rank', 'tasks_archive', ['status_rank', 'updated_at'], unique=False)
+    op.create_index('ix_tasks_archive_status_rank_desc', 'tasks_archive', [sa.text('status_rank DESC'), 'updated_at'], unique=False)
+    op.create_index('ix_tasks_archive_assignee_status_rank', 'tasks_archive', ['assigned_to', 'status_rank', 'updated_at'], unique=False)
+    op.create_index('ix_tasks_archive_assignee_status_rank_desc', 'tasks_archive', ['assigned_to', sa.text('status_rank DESC'), 'updated_at'], unique=False)
+
+    op.create_table('comments_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('comment_text', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks_archive.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_comments_archive_task_created_at', 'comments_archive', ['task_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_comments_archive_task_created_at', table_name='comments_archive')
+    op.drop_table('comments_archive')
+
+    op.drop_index('ix_tasks_archive_assignee_status_rank_desc', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_assignee_status_rank', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_status_rank_desc', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_status_rank', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_assignee_due_date_desc', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_assignee_due_date', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_due_date_desc', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_due_date', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_assignee_created_at', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_created_at', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
@@ -0,0 +1,52 @@
+"""task change sequence and tombstones for delta sync
+
+Revision ID: d4a8b1e6f273
+Revises: c7d2e9f4a1b6
+Create Date: 2026-10-17 19:06:31.472915
+
+Adds ``tasks.change_seq`` (copied into tasks_archive like every other task
+column) and the task_tombstones table behind ``GET /api/tasks/changes``.
+Existing tasks start at sequence 0, which no client token predates.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8b1e6f273'
+down_revision = 'c7d2e9f4a1b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('tasks', sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False))
+    op.create_index('ix_tasks_change_seq', 'tasks', ['change_seq'], unique=False)
+    op.create_index('ix_tasks_assignee_change_seq', 'tasks', ['assigned_to', 'change_seq'], unique=False)
+    op.add_column('tasks_archive', sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False))
+
+    op.create_table('task_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('assignee_id', sa.Integer(), nullable=False),
+    sa.Column('deleted', sa.Boolean(), nullable=False),
+    sa.Column('change_seq', sa.BigInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_tombstones_change_seq', 'task_tombstones', ['change_seq'], unique=False)
+    op.create_index('ix_task_tombstones_assignee_change_seq', 'task_tombstones', ['assignee_id', 'change_seq'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_task_tombstones_assignee_change_seq', table_name='task_tombstones')
+    op.drop_index('ix_task_tombstones_change_seq', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+
+    # Plain DROP COLUMN rather than batch copies, so SQLite keeps the
+    # tasks_fts triggers on the table
+    op.drop_column('tasks_archive', 'change_seq')
+    op.drop_index('ix_tasks_assignee_change_seq', table_name='tasks')
+    op.drop_index('ix_tasks_change_seq', table_name='tasks')
+    op.drop_column('tasks', 'change_seq')
@@ -0,0 +1,28 @@
+"""data versions for response caching
+
+Revision ID: e2a7c4d81f35
+Revises: 9b7e3a51c6d2
+Create Date: 2026-10-17 11:26:08.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a7c4d81f35'
+down_revision = '9b7e3a51c6d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('data_versions',
+    sa.Column('scope', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('scope')
+    )
+
+
+def downgrade():
+    op.drop_table('data_versions')
@@ -0,0 +1,27 @@
+"""index on users.name
+
+Revision ID: f1b9c3d7e502
+Revises: d4a8b1e6f273
+Create Date: 2026-10-17 20:12:47.305816
+
+Serves the name-ordered ``/api/users/directory`` and prefix searches on
+``/api/users?q=``.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b9c3d7e502'
+down_revision = 'd4a8b1e6f273'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_users_name'), 'users', ['name'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_users_name'), table_name='users')
@@ -0,0 +1,120 @@
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from config import Config
+
+PASSWORD = 'secret123'
+
+
+def make_app(database_path, **settings):
+    """An app on a fresh SQLite file; ``settings`` override the test config"""
+    class TestConfig(Config):
+        TESTING = True
+        SECRET_KEY = 'test'
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database_path}'
+        SQLALCHEMY_BINDS = {}
+        SQLALCHEMY_ECHO = False
+        CREATE_TABLES = True
+        # Every GET runs its view, so statement counts don't depend on cache hits
+        RESPONSE_CACHE_SIZE = 0
+        METRICS_ENABLED = False
+        EVENTS_BACKEND = 'memory'
+        USER_CACHE_BACKEND = 'memory'
+        LOGIN_THROTTLE_BACKEND = 'memory'
+        OVERDUE_AUTO_ROLLOVER = False
+        PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'
+
+    for name, value in settings.items():
+        setattr(TestConfig, name, value)
+    return create_app(TestConfig)
+
+
+@pytest.fixture
+def app(tmp_path):
+    return make_app(tmp_path / 'test.db')
+
+
+@pytest.fixture
+def users(app):
+    """An admin and two developers, as {name: id}"""
+    from app.models.user import User
+
+    with app.app_context():
+        accounts = [('admin', 'admin'), ('dev', 'developer'), ('dev2', 'developer')]
+        created = {}
+        for name, role in accounts:
+            user = User(name=name.title(), email=f'{name}@example.com', role=role)
+            user.set_password(PASSWORD)
+            db.session.add(user)
+            created[name] = user
+        db.session.commit()
+        return {name: user.id for name, user in created.items()}
+
+
+def login(app, name):
+    client = app.test_client()
+    response = client.post('/login', json={'email': f'{name}@example.com', 'password': PASSWORD})
+    assert response.status_code == 200, response.get_json()
+    return client
+
+
+@pytest.fixture
+def admin_client(app, users):
+    return login(app, 'admin')
+
+
+@pytest.fixture
+def dev_client(app, users):
+    return login(app, 'dev')
+
+
+def add_tasks(app, count, assigned_to, created_by, comments_per_task=0, **fields):
+    """Insert ``count`` tasks (and comments on each) through the ORM; returns their ids"""
+    from app.models.comment import Comment
+    from app.models.task import Task
+
+    with app.app_context():
+        tasks = [
+            Task(
+                title=f'Task {index}', description='', assigned_to=assigned_to, created_by=created_by,
+                due_date=date.today() + timedelta(days=index % 7 - 2), **fields
+            )
+            for index in range(count)
+        ]
+        db.session.add_all(tasks)
+        db.session.flush()
+        for task in tasks:
+            for index in range(comments_per_task):
+                db.session.add(Comment(task_id=task.id, user_id=created_by, comment_text=f'Comment {index}'))
+        db.session.commit()
+        return [task.id for task in tasks]
+
+
+@pytest.fixture
+def count_statements(app):
+    """Context manager counting the SQL statements run inside it"""
+    with app.app_context():
+        engine = db.engine
+
+    @contextmanager
+    def counting():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+    return counting
@@ -0,0 +1,33 @@
+"""Archived tasks keep their ids, so live tasks must never get them again"""
+from datetime import datetime, timedelta
+
+from app.services.seeding import seed_database
+from app.services.task_archive import archive_tasks
+from conftest import add_tasks
+
+OLD = datetime.utcnow() - timedelta(days=90)
+
+
+def test_new_tasks_never_reuse_archived_or_deleted_ids(app, users, admin_client):
+    first, = add_tasks(app, 1, users['dev'], users['admin'])
+    archived = add_tasks(app, 2, users['dev'], users['admin'], status='Completed', updated_at=OLD)
+    last, = add_tasks(app, 1, users['dev'], users['admin'], status='Completed', updated_at=OLD)
+    deleted, = add_tasks(app, 1, users['dev'], users['admin'])
+    with app.app_context():
+        assert archive_tasks(timedelta(days=30)) == (3, 0)
+    assert admin_client.delete(f'/api/tasks/{deleted}').status_code == 200
+
+    created = admin_client.post('/api/tasks', json={'title': 'New'}).get_json()['task']
+    assert created['id'] > deleted
+
+    listed = admin_client.get('/api/tasks?include_archived=1&per_page=50').get_json()['tasks']
+    ids = [task['id'] for task in listed]
+    assert sorted(ids) == sorted([first, created['id'], *archived, last])
+
+
+def test_seeding_starts_above_archived_ids(app, users):
+    archived = add_tasks(app, 3, users['dev'], users['admin'], status='Completed', updated_at=OLD)
+    with app.app_context():
+        archive_tasks(timedelta(days=30))
+        first_ids = seed_database(users=1, tasks=2, comments=2, seed=1)
+    assert first_ids['tasks'] > max(archived)
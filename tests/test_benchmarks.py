@@ -0,0 +1,49 @@
+"""The benchmark scripts must keep running and keep measuring what they report"""
+import importlib.util
+import os
+from argparse import Namespace
+
+import pytest
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+
+
+def load(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(BENCHMARKS, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def api_results():
+    bench_api = load('bench_api')
+    args = Namespace(
+        iterations=2, comments_per_task=1, seed=1, only=None, response_cache=False, json_path=None
+    )
+    return bench_api, bench_api.run_size(200, args)
+
+
+def test_api_suite_covers_every_scenario(api_results):
+    bench_api, results = api_results
+    first_ids = {'users': 1, 'tasks': 1}
+    expected = {(name, role or '-') for name, role, *_ in bench_api.scenarios(first_ids)}
+    assert {(result['scenario'], result['role']) for result in results} == expected
+
+
+def test_api_suite_reports_statements_and_rows(api_results):
+    _, results = api_results
+    for result in results:
+        assert 0 < result['p50_ms'] <= result['p95_ms'] <= result['p99_ms'] <= result['max_ms'], result
+        # Statement counts come from the Server-Timing header
+        assert result['sql'] > 0, result
+    listing = next(result for result in results if result['scenario'] == 'tasks sort=created_at')
+    assert listing['rows'] == 50 and listing['rows_per_s'] > 0
+
+
+def test_percentile_picks_nearest_rank():
+    bench_api = load('bench_api')
+    samples = [5, 1, 4, 2, 3]
+    assert bench_api.percentile(samples, 0.0) == 1
+    assert bench_api.percentile(samples, 0.5) == 3
+    assert bench_api.percentile(samples, 1.0) == 5
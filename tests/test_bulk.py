@@ -0,0 +1,51 @@
+"""POST /api/tasks/bulk: per-item failures for bad ids and unknown assignees"""
+from conftest import add_tasks
+
+
+def run_bulk(client, *operations, **options):
+    response = client.post('/api/tasks/bulk', json=dict(options, operations=list(operations)))
+    return response.status_code, response.get_json()
+
+
+def outcomes(body):
+    return [(result['id'], result['success'], result.get('status_code')) for result in body['results']]
+
+
+def test_unknown_assignee_fails_only_its_operation(app, users, admin_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+
+    status, body = run_bulk(
+        admin_client,
+        {'op': 'create', 'data': {'title': 'Orphan', 'assigned_to': 999}},
+        {'op': 'update', 'ids': [task_id], 'data': {'assigned_to': 999}},
+        {'op': 'create', 'data': {'title': 'Fine', 'assigned_to': users['dev2']}},
+        {'op': 'update', 'ids': [task_id], 'data': {'assigned_to': None}},
+    )
+
+    assert status == 200
+    assert outcomes(body) == [(None, False, 400), (task_id, False, 400), (None, True, None), (task_id, True, None)]
+    assert body['results'][0]['message'] == 'Assigned user not found'
+    assert body['results'][2]['task']['assigned_to'] == users['dev2']
+    assert body['results'][3]['task']['assigned_to'] is None
+
+
+def test_non_integer_ids_are_reported(app, users, admin_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+
+    status, body = run_bulk(admin_client, {'op': 'status', 'ids': [task_id, '7', None, [1]], 'status': 'Completed'})
+
+    assert status == 200
+    assert outcomes(body) == [(task_id, True, None), ('7', False, 400), (None, False, 400), ([1], False, 400)]
+    assert body['results'][1]['message'] == 'Task id must be an integer'
+
+
+def test_atomic_batch_with_unknown_assignee_applies_nothing(app, users, admin_client):
+    status, body = run_bulk(
+        admin_client,
+        {'op': 'create', 'data': {'title': 'Fine'}},
+        {'op': 'create', 'data': {'title': 'Orphan', 'assigned_to': 999}},
+        atomic=True,
+    )
+
+    assert status == 400
+    assert admin_client.get('/api/tasks').get_json()['tasks'] == []
@@ -0,0 +1,93 @@
+"""GET /api/tasks/<id>/comments: cursor pagination, ``since`` and joined authors"""
+from datetime import datetime, timedelta
+
+from app import db
+from app.models.comment import Comment
+from conftest import add_tasks, login
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+def add_comments(app, task_id, user_ids, count, start=START):
+    """``count`` comments one minute apart, cycling through the authors in ``user_ids``"""
+    with app.app_context():
+        comments = [
+            Comment(
+                task_id=task_id, user_id=user_ids[index % len(user_ids)], comment_text=f'Comment {index}',
+                created_at=start + timedelta(minutes=index)
+            )
+            for index in range(count)
+        ]
+        db.session.add_all(comments)
+        db.session.commit()
+        return [comment.id for comment in comments]
+
+
+def comment_ids(response):
+    assert response.status_code == 200, response.get_json()
+    return [comment['id'] for comment in response.get_json()['comments']]
+
+
+def test_cursor_walks_every_comment_once_in_order(app, users, admin_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    expected = add_comments(app, task_id, [users['admin'], users['dev']], 12)
+
+    seen, cursor = [], None
+    while True:
+        url = f'/api/tasks/{task_id}/comments?limit=5' + (f'&cursor={cursor}' if cursor else '')
+        response = admin_client.get(url)
+        seen += comment_ids(response)
+        meta = response.get_json()['meta']
+        cursor = meta['next_cursor']
+        if not meta['has_next']:
+            break
+    assert seen == expected
+
+    # The last cursor polls for comments added later
+    assert comment_ids(admin_client.get(f'/api/tasks/{task_id}/comments?cursor={cursor}')) == []
+    newer = add_comments(app, task_id, [users['dev']], 2, start=START + timedelta(days=1))
+    assert comment_ids(admin_client.get(f'/api/tasks/{task_id}/comments?cursor={cursor}')) == newer
+
+
+def test_authors_are_joined_into_the_page_query(app, users, admin_client, count_statements):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    add_comments(app, task_id, [users['admin'], users['dev'], users['dev2']], 30)
+    admin_client.get(f'/api/tasks/{task_id}/comments?limit=1')
+
+    counts = []
+    for limit in (1, 30):
+        with count_statements() as statements:
+            response = admin_client.get(f'/api/tasks/{task_id}/comments?limit={limit}')
+        counts.append(len(statements))
+    assert counts[0] == counts[1], counts
+    names = {comment['user_name'] for comment in response.get_json()['comments']}
+    assert names == {'Admin', 'Dev', 'Dev2'}
+
+
+def test_since_returns_only_newer_comments(app, users, admin_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    ids = add_comments(app, task_id, [users['admin']], 5)
+    since = (START + timedelta(minutes=2)).isoformat()
+    assert comment_ids(admin_client.get(f'/api/tasks/{task_id}/comments?since={since}')) == ids[3:]
+
+    response = admin_client.get(f'/api/tasks/{task_id}/comments?since=yesterday')
+    assert response.status_code == 400
+
+
+def test_rejects_bad_cursors_and_clamps_limit(app, users, admin_client):
+    first, second = add_tasks(app, 2, users['dev'], users['admin'])
+    add_comments(app, first, [users['admin']], 3)
+    cursor = admin_client.get(f'/api/tasks/{first}/comments?limit=1').get_json()['meta']['next_cursor']
+
+    assert admin_client.get(f'/api/tasks/{first}/comments?cursor=garbage').status_code == 400
+    # A cursor only continues the thread it came from
+    assert admin_client.get(f'/api/tasks/{second}/comments?cursor={cursor}').status_code == 400
+    assert admin_client.get(f'/api/tasks/{first}/comments?limit=100000').get_json()['meta']['limit'] == 200
+
+
+def test_only_the_assignee_and_admins_read_comments(app, users, dev_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    add_comments(app, task_id, [users['dev']], 1)
+    assert dev_client.get(f'/api/tasks/{task_id}/comments').status_code == 200
+    assert login(app, 'dev2').get(f'/api/tasks/{task_id}/comments').status_code == 403
+    assert dev_client.get('/api/tasks/9999/comments').status_code == 404
@@ -0,0 +1,9 @@
+def test_write_succeeds_when_publishing_fails(app, users, admin_client, monkeypatch, caplog):
+    def publish(event):
+        raise ConnectionError('Redis is down')
+
+    monkeypatch.setattr(app.extensions['events'], 'publish', publish)
+    response = admin_client.post('/api/tasks', json={'title': 'Still saved'})
+    assert response.status_code in (200, 201)
+    assert [task['title'] for task in admin_client.get('/api/tasks').get_json()['tasks']] == ['Still saved']
+    assert 'Could not publish task.created event' in caplog.text
@@ -0,0 +1,50 @@
+"""Password rehashing, the hashing limit and the in-process login attempt store"""
+import threading
+
+from app.services.login_throttle import MemoryAttemptStore
+from app.services.passwords import PasswordHasher
+
+
+def test_short_method_names_do_not_force_a_rehash():
+    hasher = PasswordHasher(method='scrypt')
+    current = hasher.hash('secret123')
+
+    assert not hasher.needs_rehash(current)
+    assert hasher.needs_rehash(PasswordHasher(method='pbkdf2:sha256:1000').hash('secret123'))
+    assert hasher.needs_rehash(PasswordHasher(method='scrypt:16384:8:1').hash('secret123'))
+
+
+def test_full_store_evicts_oldest_counters_first(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('app.services.login_throttle.time.monotonic', lambda: clock[0])
+    store = MemoryAttemptStore(max_keys=3)
+
+    for key in ('a', 'b', 'c'):
+        store.incr(key, 300)
+        clock[0] += 1
+    store.incr('c', 300)
+    store.incr('d', 300)
+
+    assert [store.get(key) for key in 'abcd'] == [0, 1, 2, 1]
+
+
+def test_full_store_drops_expired_counters_before_live_ones(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('app.services.login_throttle.time.monotonic', lambda: clock[0])
+    store = MemoryAttemptStore(max_keys=3)
+
+    store.incr('short', 10)
+    store.incr('a', 300)
+    store.incr('b', 300)
+    clock[0] += 20
+    store.incr('c', 300)
+
+    assert store._counters.keys() == {'a', 'b', 'c'}
+
+
+def test_login_beyond_the_hashing_limit_gets_a_fast_503(app, users):
+    app.extensions['password_hasher']._slots = threading.BoundedSemaphore(1)
+    app.extensions['password_hasher']._slots.acquire()
+    response = app.test_client().post('/login', json={'email': 'dev@example.com', 'password': 'secret123'})
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,59 @@
+"""/metrics access, and what the request timing hooks record"""
+import pytest
+from sqlalchemy import text
+
+from app import db
+from conftest import make_app
+
+
+@pytest.fixture
+def metrics_app(tmp_path):
+    return make_app(tmp_path / 'metrics.db', METRICS_ENABLED=True, METRICS_TOKEN='scrape')
+
+
+def test_metrics_needs_the_token(metrics_app):
+    client = metrics_app.test_client()
+
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    # WSGI headers are latin-1, so a header can carry characters compare_digest rejects in a str
+    assert client.get('/metrics', headers={'Authorization': 'Bearer scr\xe4pe'}).status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer scrape'}).status_code == 200
+
+
+def test_metrics_is_hidden_without_a_token(tmp_path):
+    app = make_app(tmp_path / 'metrics.db', METRICS_ENABLED=True, METRICS_TOKEN=None)
+
+    assert app.test_client().get('/metrics').status_code == 404
+
+
+def test_requests_that_raise_are_recorded(metrics_app):
+    def broken():
+        db.session.execute(text('SELECT 1'))
+        raise RuntimeError('boom')
+
+    metrics_app.add_url_rule('/broken', 'broken', broken)
+    client = metrics_app.test_client()
+
+    # TESTING propagates the error, so no response (and no after_request) happens
+    with pytest.raises(RuntimeError):
+        client.get('/broken')
+    body = client.get('/metrics', headers={'Authorization': 'Bearer scrape'}).get_data(as_text=True)
+    assert 'http_responses_total{blueprint="app",status="500"} 1' in body
+    assert 'http_request_sql_queries_count{blueprint="app"} 1' in body
+
+
+def test_failed_statements_leave_no_timer_behind(metrics_app):
+    def failing_sql():
+        try:
+            db.session.execute(text('SELECT * FROM no_such_table'))
+        except Exception:
+            db.session.rollback()
+        db.session.execute(text('SELECT 1'))
+        return {'pending': db.session.connection().info.get('query_started')}
+
+    metrics_app.add_url_rule('/failing-sql', 'failing_sql', failing_sql)
+    response = metrics_app.test_client().get('/failing-sql')
+
+    assert response.get_json() == {'pending': []}
+    assert 'desc="2 queries"' in response.headers['Server-Timing']
@@ -0,0 +1,37 @@
+"""When the in-process overdue rollover runs"""
+from datetime import date, timedelta
+
+import pytest
+
+from app import db
+from app.models.task import Task
+from conftest import add_tasks, make_app
+
+
+@pytest.fixture
+def app(tmp_path):
+    return make_app(tmp_path / 'overdue.db', OVERDUE_AUTO_ROLLOVER=True)
+
+
+def overdue_flag(app, task_id):
+    with app.app_context():
+        return db.session.get(Task, task_id).is_overdue
+
+
+def test_rollover_runs_after_the_first_api_write(app, users, admin_client):
+    late, other = add_tasks(app, 2, users['dev'], users['admin'])
+    with app.app_context():
+        # Passed its due date since the last write, as at midnight
+        db.session.execute(
+            Task.__table__.update().where(Task.id == late)
+            .values(due_date=date.today() - timedelta(days=1), is_overdue=False)
+        )
+        db.session.commit()
+
+    # The server closes each response once it is sent; the test client leaves that to us
+    admin_client.get('/api/tasks').close()
+    admin_client.get('/').close()
+    assert not overdue_flag(app, late)
+
+    admin_client.put(f'/api/tasks/{other}/status', json={'status': 'In Progress'}).close()
+    assert overdue_flag(app, late)
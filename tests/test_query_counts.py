@@ -0,0 +1,77 @@
+"""Statement counts for the hot endpoints must not grow with the page size"""
+from conftest import add_tasks
+
+
+def statements_for(count_statements, request):
+    with count_statements() as statements:
+        response = request()
+    assert response.status_code in (200, 201), response.get_json()
+    return len(statements)
+
+
+def test_task_list_statements_do_not_grow_with_page_size(app, users, admin_client, count_statements):
+    # Tasks for two assignees plus an unassigned one, each with comments, so
+    # lazy-loaded users or comments would show up as extra statements
+    add_tasks(app, 20, users['dev'], users['admin'], comments_per_task=2)
+    add_tasks(app, 20, users['dev2'], users['admin'], comments_per_task=2)
+    add_tasks(app, 5, None, users['admin'])
+    admin_client.get('/api/tasks')  # warm the session user cache
+
+    counts = {}
+    for per_page in (2, 10, 40):
+        for sort_by in ('created_at', 'due_date', 'status'):
+            url = f'/api/tasks?per_page={per_page}&sort_by={sort_by}'
+            counts[per_page, sort_by] = statements_for(count_statements, lambda: admin_client.get(url))
+
+    for sort_by in ('created_at', 'due_date', 'status'):
+        assert counts[2, sort_by] == counts[10, sort_by] == counts[40, sort_by], counts
+    assert max(counts.values()) <= 4, counts
+
+
+def test_cursor_page_statements_do_not_grow_with_page_size(app, users, dev_client, count_statements):
+    add_tasks(app, 30, users['dev'], users['admin'], comments_per_task=1)
+    dev_client.get('/api/tasks')
+
+    small = statements_for(count_statements, lambda: dev_client.get('/api/tasks?mode=cursor&per_page=2'))
+    large = statements_for(count_statements, lambda: dev_client.get('/api/tasks?mode=cursor&per_page=30'))
+    assert small == large <= 4
+
+
+def test_dashboard_stats_statements_are_constant(app, users, admin_client, dev_client, count_statements):
+    admin_client.get('/api/dashboard/stats')
+    dev_client.get('/api/dashboard/stats')
+    empty = statements_for(count_statements, lambda: admin_client.get('/api/dashboard/stats'))
+
+    add_tasks(app, 25, users['dev'], users['admin'], comments_per_task=2)
+    add_tasks(app, 25, users['dev2'], users['admin'], comments_per_task=2)
+    for client in (admin_client, dev_client):
+        assert statements_for(count_statements, lambda: client.get('/api/dashboard/stats')) == empty
+    by_assignee = statements_for(
+        count_statements, lambda: admin_client.get('/api/dashboard/stats?group_by=assignee')
+    )
+    assert by_assignee <= empty + 2
+
+
+def test_write_responses_do_not_lazy_load_users(app, users, admin_client, dev_client, count_statements):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'], comments_per_task=3)
+    dev_client.get('/api/tasks')
+    admin_client.get('/api/tasks')
+
+    status = statements_for(
+        count_statements, lambda: dev_client.put(f'/api/tasks/{task_id}/status', json={'status': 'In Progress'})
+    )
+    # Taking the change sequence number and one UPDATE ... RETURNING; the
+    # triggers keep the counters and data versions
+    assert status == 2
+
+    # Statements for an edit must not depend on the task's comments or the users involved
+    other_id, = add_tasks(app, 1, users['dev2'], users['admin'], comments_per_task=20)
+    first = statements_for(count_statements, lambda: admin_client.put(f'/api/tasks/{task_id}', json={'title': 'A'}))
+    second = statements_for(count_statements, lambda: admin_client.put(f'/api/tasks/{other_id}', json={'title': 'B'}))
+    assert first == second
+
+    created = statements_for(
+        count_statements,
+        lambda: admin_client.post('/api/tasks', json={'title': 'New', 'assigned_to': users['dev']})
+    )
+    assert created <= first + 2
@@ -0,0 +1,40 @@
+"""Every /api/tasks sort mode must be served from an index, not a filesort"""
+import os
+
+import pytest
+from flask_migrate import upgrade
+
+from app.services.query_plans import task_list_plans, uses_filesort
+from conftest import make_app
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+@pytest.fixture(params=['models', 'migrations'])
+def schema_app(request, tmp_path):
+    """The schema as create_all() builds it, and as the Alembic migrations build it"""
+    if request.param == 'models':
+        return make_app(tmp_path / 'models.db')
+    app = make_app(tmp_path / 'migrated.db', CREATE_TABLES=False)
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+    return app
+
+
+def test_task_list_sorts_use_indexes(schema_app):
+    with schema_app.app_context():
+        plans = list(task_list_plans())
+    assert plans
+    filesorts = {
+        (scope, sort_by, sort_dir): plan
+        for scope, sort_by, sort_dir, plan in plans if uses_filesort(plan)
+    }
+    assert not filesorts, filesorts
+
+
+def test_task_list_queries_search_an_index(schema_app):
+    with schema_app.app_context():
+        for scope, sort_by, sort_dir, plan in task_list_plans():
+            assert any('USING INDEX' in line or 'USING COVERING INDEX' in line for line in plan), (
+                scope, sort_by, sort_dir, plan
+            )
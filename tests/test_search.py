@@ -0,0 +1,60 @@
+"""GET /api/tasks/search: task text, comment text, scoping and ranking"""
+from app import db
+from app.models.comment import Comment
+from app.models.task import Task
+from conftest import login
+
+
+def add_task(app, title, assigned_to, created_by, description='', comments=()):
+    with app.app_context():
+        task = Task(title=title, description=description, assigned_to=assigned_to, created_by=created_by)
+        db.session.add(task)
+        db.session.flush()
+        for text in comments:
+            db.session.add(Comment(task_id=task.id, user_id=created_by, comment_text=text))
+        db.session.commit()
+        return task.id
+
+
+def search(client, q, **params):
+    response = client.get('/api/tasks/search', query_string=dict(params, q=q))
+    assert response.status_code == 200, response.get_json()
+    return [task['id'] for task in response.get_json()['tasks']]
+
+
+def test_matches_title_description_and_comments(app, users, admin_client):
+    in_title = add_task(app, 'Migrate invoices', users['dev'], users['admin'])
+    in_description = add_task(app, 'Billing', users['dev'], users['admin'], description='old invoices export')
+    in_comment = add_task(app, 'Reports', users['dev'], users['admin'], comments=['blocked on invoices'])
+    add_task(app, 'Unrelated', users['dev'], users['admin'], comments=['nothing here'])
+
+    assert search(admin_client, 'invoice') == [in_title, in_description, in_comment]
+
+
+def test_every_term_must_match_within_one_document(app, users, admin_client):
+    one_comment = add_task(app, 'Reports', users['dev'], users['admin'], comments=['deploy failed on staging'])
+    add_task(app, 'Deploy', users['dev'], users['admin'], comments=['staging is down'])
+    add_task(app, 'Other', users['dev'], users['admin'], comments=['deploy later', 'staging ok'])
+
+    assert search(admin_client, 'deploy staging') == [one_comment]
+
+
+def test_comment_edits_and_new_comments_are_searchable(app, users, admin_client):
+    task_id = add_task(app, 'Reports', users['dev'], users['admin'])
+    assert search(admin_client, 'flaky') == []
+
+    response = admin_client.post(f'/api/tasks/{task_id}/comments', json={'comment_text': 'flaky test'})
+    assert response.status_code == 201, response.get_json()
+    assert search(admin_client, 'flaky') == [task_id]
+
+
+def test_developers_only_find_their_own_tasks(app, users):
+    own = add_task(app, 'Mine', users['dev'], users['admin'], comments=['shared keyword'])
+    add_task(app, 'Theirs', users['dev2'], users['admin'], comments=['shared keyword'])
+
+    assert search(login(app, 'dev'), 'shared') == [own]
+
+
+def test_rejects_queries_without_words(users, admin_client):
+    response = admin_client.get('/api/tasks/search', query_string={'q': '!!'})
+    assert response.status_code == 400
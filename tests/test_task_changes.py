@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models.task_change import TaskChange
+from app.services.task_changes import CHANGE_SEQ_GRACE, committed_change_seq, next_change_seq
+from conftest import add_tasks
+
+
+def changes(client, since=None):
+    query = '' if since is None else f'?since={since}'
+    return client.get(f'/api/tasks/changes{query}').get_json()
+
+
+def test_changes_since_token(app, users, admin_client, dev_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    token = changes(dev_client)['next_since']
+
+    dev_client.put(f'/api/tasks/{task_id}/status', json={'status': 'In Progress'})
+    admin_client.put(f'/api/tasks/{task_id}', json={'assigned_to': users['dev2']})
+    result = changes(dev_client, token)
+    assert not result['reset']
+    assert result['tasks'] == [] and result['deleted'] == [task_id]
+    assert changes(admin_client, token)['tasks'][0]['assigned_to'] == users['dev2']
+    assert changes(dev_client, result['next_since'])['deleted'] == []
+
+
+def test_missing_number_holds_readers_back_until_the_grace_period(app, users):
+    add_tasks(app, 1, users['dev'], users['admin'])
+    with app.app_context():
+        committed = committed_change_seq()
+        # A write that took committed + 1 is still running when a later one commits
+        db.session.add(TaskChange(id=committed + 2, created_at=datetime.utcnow()))
+        db.session.commit()
+        assert committed_change_seq() == committed
+
+        # Long enough ago that committed + 1 must have rolled back
+        db.session.get(TaskChange, committed + 2).created_at -= CHANGE_SEQ_GRACE + timedelta(seconds=1)
+        db.session.commit()
+        assert committed_change_seq() == committed + 2
+
+        assert next_change_seq(db.session.connection()) == committed + 3
+        assert committed_change_seq() == committed + 3
+
+
+def test_admin_list_etag_follows_every_assignee(app, users, admin_client, dev_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    before = admin_client.get('/api/tasks').headers['ETag']
+    dev_client.put(f'/api/tasks/{task_id}/status', json={'status': 'In Progress'})
+    assert admin_client.get('/api/tasks').headers['ETag'] != before
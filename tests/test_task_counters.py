@@ -0,0 +1,22 @@
+from app import db
+from app.models.task import Task
+from app.services.data_versions import read_versions, task_scope
+from app.services.task_counters import find_counter_drift, stored_counters
+from conftest import add_tasks
+
+tasks_table = Task.__table__
+
+
+def test_triggers_follow_core_writes(app, users):
+    first, second = add_tasks(app, 2, users['dev'], users['admin'])
+    with app.app_context():
+        before = read_versions([task_scope(users['dev']), task_scope(users['dev2'])])
+        db.session.execute(tasks_table.update().where(tasks_table.c.id == first).values(status='Completed'))
+        db.session.execute(tasks_table.update().where(tasks_table.c.id == second).values(assigned_to=users['dev2']))
+        db.session.execute(tasks_table.delete().where(tasks_table.c.id == first))
+        db.session.commit()
+
+        assert find_counter_drift() == {}
+        assert stored_counters() == {(users['dev2'], 'Pending', 'Medium'): 1}
+        after = read_versions([task_scope(users['dev']), task_scope(users['dev2'])])
+    assert after[0] == before[0] + 3 and after[1] == before[1] + 1
@@ -0,0 +1,52 @@
+"""The plain-row list path must serialize exactly like the ORM path"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.models.archived_task import ArchivedTask
+from app.models.task import Task
+from app.services.serializers import serialize_task_rows, serialize_tasks
+from app.services.task_archive import archive_tasks
+from app.services.task_queries import ARCHIVE_ROW_FIELDS, ROW_FIELDS, scoped_task_query, task_row_query
+from conftest import add_tasks
+
+ADMIN = SimpleNamespace(role='admin', id=None)
+
+
+def test_rows_match_orm_serialization(app, users):
+    add_tasks(app, 5, users['dev'], users['admin'])
+    add_tasks(app, 3, None, users['admin'], status='Completed')
+    with app.app_context():
+        orm = serialize_tasks(Task.query.order_by(Task.id).all())
+        rows = serialize_task_rows(task_row_query(scoped_task_query(ADMIN)).order_by(Task.id).all())
+    assert rows == orm
+    assert all(list(task) == list(ROW_FIELDS) for task in rows)
+    assert {task['assigned_to_name'] for task in rows} == {'Dev', None}
+
+
+def test_archived_rows_add_archived_at(app, users):
+    old = datetime.utcnow() - timedelta(days=90)
+    archived_ids = add_tasks(app, 2, users['dev'], users['admin'], status='Completed', updated_at=old)
+    live_ids = add_tasks(app, 2, users['dev2'], users['admin'])
+    with app.app_context():
+        assert archive_tasks(timedelta(days=30)) == (2, 0)
+        query = scoped_task_query(ADMIN, model=ArchivedTask)
+        archived = serialize_task_rows(task_row_query(query, model=ArchivedTask).all())
+        live = serialize_task_rows(task_row_query(scoped_task_query(ADMIN)).all())
+        # Mixed lists, as merged pages produce, keep each row's own fields
+        mixed = serialize_task_rows(
+            task_row_query(scoped_task_query(ADMIN)).all() + task_row_query(query, model=ArchivedTask).all()
+        )
+    assert sorted(task['id'] for task in archived) == archived_ids
+    assert all(list(task) == list(ARCHIVE_ROW_FIELDS) for task in archived)
+    assert all(task['assigned_to_name'] == 'Dev' and task['archived_at'] for task in archived)
+    assert sorted(task['id'] for task in live) == live_ids
+    assert mixed == live + archived
+
+
+def test_list_endpoint_serves_the_same_dicts_as_writes(app, users, admin_client):
+    created = admin_client.post('/api/tasks', json={'title': 'One', 'assigned_to': users['dev']}).get_json()['task']
+    listed = admin_client.get('/api/tasks').get_json()['tasks']
+    assert listed == [created]
+
+    with_archive = admin_client.get('/api/tasks?include_archived=1').get_json()['tasks']
+    assert with_archive == [created]
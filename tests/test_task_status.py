@@ -0,0 +1,27 @@
+from app.services.task_counters import find_counter_drift
+from conftest import add_tasks
+
+
+def put_status(client, task_id, **body):
+    response = client.put(f'/api/tasks/{task_id}/status', json={'status': 'In Progress', **body})
+    return response.status_code, response.get_json()
+
+
+def test_status_update_returns_the_listed_row(app, users, admin_client, dev_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    code, body = put_status(dev_client, task_id, version=1)
+    assert code == 200
+    assert body['task'] == admin_client.get('/api/tasks').get_json()['tasks'][0]
+    assert body['task']['status'] == 'In Progress' and body['task']['version'] == 2
+    with app.app_context():
+        assert find_counter_drift() == {}
+
+
+def test_failed_status_updates_are_told_apart(app, users, dev_client):
+    task_id, = add_tasks(app, 1, users['dev'], users['admin'])
+    other_id, = add_tasks(app, 1, users['dev2'], users['admin'])
+    assert put_status(dev_client, 999)[0] == 404
+    assert put_status(dev_client, other_id)[0] == 403
+    assert put_status(dev_client, task_id, version=5)[0] == 409
+    assert put_status(dev_client, task_id, status='Done')[0] == 400
+    assert put_status(dev_client, task_id, version=1)[0] == 200
@@ -0,0 +1,5 @@
+def test_directory_is_admin_only(admin_client, dev_client):
+    assert dev_client.get('/api/users/directory').status_code == 403
+    rows = admin_client.get('/api/users/directory').get_json()['users']
+    assert [name for _, name, _ in rows] == ['Admin', 'Dev', 'Dev2']
+    assert dev_client.get('/api/bootstrap').get_json()['directory'] is None